@@ -0,0 +1,8 @@
+"""핫패스 성능 측정 스크립트 모음. 저장소 최상위에서 `python -m benchmarks.<이름>` 으로 실행합니다."""
+
+import os
+
+# 커밋 간 비교를 위해 BLAS/OpenMP 스레드를 1개로 고정합니다. `python -m benchmarks.<이름>` 은
+# 이 패키지를 먼저 import 하므로 각 스크립트의 numpy import 보다 앞서 적용됩니다.
+for _var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+    os.environ.setdefault(_var, "1")
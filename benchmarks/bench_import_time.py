@@ -0,0 +1,60 @@
+"""패키지 import 비용 벤치마크 (`python -X importtime`).
+
+모듈마다 새 인터프리터에서 `-X importtime` 으로 import 해 누적 import 시간과
+가장 비싼 하위 import, NLTK import 여부를 출력합니다.
+
+실행: python -m benchmarks.bench_import_time --repeat 5
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+MODULES = [
+    "src.features",
+    "src.features.keywords",
+    "src.features.parallel",
+    "src.features.text",
+    "src.features.term_counts",
+    "src.features.cooccurrence",
+]
+
+
+def import_profile(module):
+    """(모듈 누적 import 시간(us), {import 된 모듈: 누적 시간(us)}) 을 반환합니다."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    )
+    timings = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        timings[name.strip()] = int(cumulative)
+    return timings[module], timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=3)
+    parser.add_argument("modules", nargs="*", default=MODULES)
+    args = parser.parse_args()
+
+    for module in args.modules:
+        runs = [import_profile(module) for _ in range(args.repeat)]
+        total = statistics.median(cumulative for cumulative, _ in runs)
+        timings = runs[-1][1]
+        heavy = sorted(
+            ((us, name) for name, us in timings.items() if "." not in name and name != module),
+            reverse=True,
+        )[:args.top]
+        nltk = "yes" if any(name == "nltk" or name.startswith("nltk.") for name in timings) else "no"
+        print(f"{module:30s} {total / 1000:8.1f} ms  nltk={nltk}  "
+              + ", ".join(f"{name} {us / 1000:.1f}ms" for us, name in heavy))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""키워드 추출 벤치마크: 기존 키워드별 부분 문자열 루프 vs KeywordMatcher.
+
+실행: python -m benchmarks.bench_keyword_matcher --docs 20000
+"""
+
+import argparse
+import random
+import string
+import time
+
+from src.features.keywords import TECH_KEYWORDS, KeywordMatcher
+
+FILLER = [
+    '반도체', '시장', '전망', '기업', '올해', '메모리', '제품', '고객', '기술', '생산',
+    '확대', '분기', '실적', '글로벌', '업계', '발표했다', '밝혔다', 'memory', 'chip', '2024년',
+]
+
+
+def make_corpus(n_docs, words_per_doc=300, keyword_rate=0.05, seed=0):
+    rng = random.Random(seed)
+    keywords = list(TECH_KEYWORDS)
+    docs = []
+    for _ in range(n_docs):
+        words = [rng.choice(keywords) if rng.random() < keyword_rate else rng.choice(FILLER)
+                 for _ in range(words_per_doc)]
+        docs.append(" ".join(words))
+    return docs
+
+
+def make_dictionary(size, seed=0):
+    """TECH_KEYWORDS 에 임의 영문 용어를 덧붙여 사전 크기를 키웁니다."""
+    rng = random.Random(seed)
+    extra = {"".join(rng.choice(string.ascii_uppercase) for _ in range(6))
+             for _ in range(max(0, size - len(TECH_KEYWORDS)))}
+    return list(TECH_KEYWORDS) + sorted(extra)
+
+
+def legacy_extract(text, target_keywords):
+    """변경 전 extract_keywords_advanced 의 키워드별 이중 탐색 루프."""
+    found = set()
+    text_upper = text.upper()
+    for keyword in target_keywords:
+        keyword_upper = keyword.upper()
+        if keyword_upper in text_upper or keyword in text:
+            found.add(keyword)
+    return list(found)
+
+
+def timeit(fn, docs):
+    start = time.perf_counter()
+    for doc in docs:
+        fn(doc)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=20000)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[len(TECH_KEYWORDS), 200, 1000])
+    args = parser.parse_args()
+
+    docs = make_corpus(args.docs)
+    print(f"{'dict':>6} {'legacy(s)':>10} {'scan(s)':>10} {'automaton(s)':>13} {'finditer(s)':>12}")
+    for size in args.sizes:
+        dictionary = make_dictionary(size)
+        scan = KeywordMatcher(dictionary, scan_threshold=len(dictionary))
+        automaton = KeywordMatcher(dictionary, scan_threshold=0)
+        t_legacy = timeit(lambda d, dictionary=dictionary: legacy_extract(d, dictionary), docs)
+        t_scan = timeit(scan.extract, docs)
+        t_auto = timeit(automaton.extract, docs)
+        t_pos = timeit(automaton.find_all, docs)
+        print(f"{len(dictionary):>6} {t_legacy:>10.3f} {t_scan:>10.3f} {t_auto:>13.3f} {t_pos:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""스트리밍 로딩 메모리 벤치마크: 전체 로드 vs iter_articles 청크 처리.
+
+합성 뉴스 CSV(기본 1GB, --gb 로 조절)를 만들고, 각 방식으로 감성 사전 빈도를 집계하면서
+별도 프로세스의 최대 RSS 와 소요 시간을 비교합니다.
+
+실행: python -m benchmarks.bench_streaming_memory --gb 2
+"""
+
+import argparse
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from src.data.loaders import NEWS_SOURCES, iter_articles, read_news_csv
+from src.features.keywords import build_matcher
+
+SENTIMENT_WORDS = ['최대', '성장', '호조', '달성', '성공', '감소', '적자', '하락', '둔화', '위기']
+FILLER = ['반도체', '시장', '전망', '기업', '메모리', 'HBM', 'DRAM', '파운드리', '고객', '투자'] + SENTIMENT_WORDS
+
+
+def write_synthetic_csv(path, target_bytes, seed=0):
+    """목표 크기에 도달할 때까지 합성 기사 행을 기록합니다."""
+    rng = random.Random(seed)
+    rows = [
+        " ".join(rng.choice(FILLER) for _ in range(400)) for _ in range(1000)
+    ]
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("date,title,content\n")
+        written = 0
+        i = 0
+        while written < target_bytes:
+            line = f"20{14 + i % 11}.{1 + i % 12:02d}.{1 + i % 28:02d},기사 {i},\"{rows[i % len(rows)]}\"\n"
+            f.write(line)
+            written += len(line.encode("utf-8"))
+            i += 1
+    return i
+
+
+def run_worker(mode, raw_dir, chunksize):
+    matcher = build_matcher(SENTIMENT_WORDS, case_sensitive=True)
+    start = time.perf_counter()
+    total = 0
+    if mode == "full":
+        df = read_news_csv(raw_dir, "Samsung")
+        for text in df["text"]:
+            total += sum(matcher.count(text).values())
+    else:
+        for chunk in iter_articles(raw_dir, companies=["Samsung"], columns=["text"], chunksize=chunksize):
+            for text in chunk["text"]:
+                total += sum(matcher.count(text).values())
+    elapsed = time.perf_counter() - start
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{mode},{elapsed:.2f},{peak_mb:.0f},{total}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--gb", type=float, default=1.0)
+    parser.add_argument("--chunksize", type=int, default=20000)
+    parser.add_argument("--worker", choices=["full", "stream"])
+    parser.add_argument("--raw-dir")
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.raw_dir, args.chunksize)
+        return
+
+    with tempfile.TemporaryDirectory() as raw_dir:
+        csv_path = Path(raw_dir) / NEWS_SOURCES["Samsung"][0]
+        n_rows = write_synthetic_csv(csv_path, int(args.gb * (1 << 30)))
+        size_mb = csv_path.stat().st_size / (1 << 20)
+        print(f"synthetic corpus: {n_rows:,} rows, {size_mb:,.0f} MB")
+        print(f"{'mode':>8} {'time(s)':>9} {'peak RSS(MB)':>13}")
+        for mode in ("stream", "full"):
+            out = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_streaming_memory", "--worker", mode,
+                 "--raw-dir", raw_dir, "--chunksize", str(args.chunksize)],
+                capture_output=True, text=True,
+            )
+            if out.returncode != 0:
+                print(f"{mode:>8} failed: {out.stderr.strip().splitlines()[-1]}")
+                continue
+            _, elapsed, peak, _ = out.stdout.strip().splitlines()[-1].split(",")
+            print(f"{mode:>8} {elapsed:>9} {peak:>13}")
+
+
+if __name__ == "__main__":
+    main()
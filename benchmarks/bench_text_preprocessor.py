@@ -0,0 +1,75 @@
+"""텍스트 전처리 벤치마크: 문서별 batch_clean(변경 전) vs TextPreprocessor.clean_many.
+
+실행: python -m benchmarks.bench_text_preprocessor --docs 1000000 --workers 8
+"""
+
+import argparse
+import random
+import re
+import time
+
+from src.features.text import TextPreprocessor
+
+WORDS = (
+    "the memory market and of samsung hynix is expected to grow in with new hbm dram nand "
+    "products for ai servers data centers smartphones 반도체 메모리 파운드리 양산 개발 공급"
+).split()
+
+
+def make_documents(n_docs, max_words=60, seed=0):
+    rng = random.Random(seed)
+    docs = []
+    for _ in range(n_docs):
+        words = [rng.choice(WORDS) for _ in range(rng.randint(5, max_words))]
+        if rng.random() < 0.5:
+            words.insert(rng.randrange(len(words)), str(rng.randint(1, 2024)))
+        docs.append(" ".join(words).capitalize() + ".")
+    return docs
+
+
+def legacy_clean(preprocessor, text):
+    """변경 전 TextPreprocessor.clean (호출마다 정규식을 해석)."""
+    if preprocessor.lowercase:
+        text = text.lower()
+    if preprocessor.remove_numbers:
+        text = re.sub(r"\d+", " ", text)
+    tokens = [
+        token
+        for token in re.findall(r"\b\w+\b", text)
+        if len(token) >= preprocessor.min_token_length and token not in preprocessor.stopwords
+    ]
+    return " ".join(tokens)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=1000000)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    docs = make_documents(args.docs)
+    preprocessor = TextPreprocessor(languages=["english"])
+
+    start = time.perf_counter()
+    expected = [legacy_clean(preprocessor, text) for text in docs]
+    t_legacy = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = preprocessor.clean_many(docs)
+    t_batch = time.perf_counter() - start
+    assert result == expected
+
+    print(f"documents: {args.docs:,}")
+    print(f"batch_clean (legacy):  {t_legacy:8.2f}s")
+    print(f"clean_many:            {t_batch:8.2f}s  ({t_legacy / t_batch:.1f}x)")
+
+    if args.workers != 1:
+        start = time.perf_counter()
+        result = preprocessor.clean_many(docs, workers=args.workers)
+        t_parallel = time.perf_counter() - start
+        assert result == expected
+        print(f"clean_many (workers={args.workers}): {t_parallel:8.2f}s  ({t_legacy / t_parallel:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,419 @@
+"""핫패스 벤치마크 스위트 (asv 방식, 외부 의존성 없음).
+
+합성 코퍼스(`benchmarks.synthetic`)로 주요 단계를 단일 스레드에서 반복 측정하고,
+커밋·머신 정보와 함께 결과를 JSON Lines 로 누적 저장합니다. 같은 머신의 두 커밋 결과를
+`compare` 로 비교할 수 있습니다.
+
+    python -m benchmarks.suite run --sizes 10000 100000 --repeat 5
+    python -m benchmarks.suite run -k keyword -k centrality
+    python -m benchmarks.suite compare HEAD~3 HEAD
+    python -m benchmarks.suite list
+
+결과 파일 기본값: benchmarks/results/results.jsonl (`--results` 로 변경)
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import make_news, make_patents
+
+RESULTS_PATH = Path(__file__).resolve().parent / "results" / "results.jsonl"
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """setup(size) 로 입력을 준비하고(측정 제외) run(state) 을 측정합니다."""
+
+    name: str
+    setup: Callable[[int], object]
+    run: Callable[[object], object]
+    unit: str = "docs"
+
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, setup: Callable[[int], object], unit: str = "docs") -> Callable:
+    def decorator(run: Callable) -> Callable:
+        BENCHMARKS[name] = Benchmark(name, setup, run, unit)
+        return run
+    return decorator
+
+
+# ---------------------------------------------------------------------------
+# 입력 준비 (크기별로 한 번만 생성)
+# ---------------------------------------------------------------------------
+
+_inputs: Dict[tuple, object] = {}
+
+
+def _cached(key, build):
+    if key not in _inputs:
+        _inputs[key] = build()
+    return _inputs[key]
+
+
+def news(size: int) -> pd.DataFrame:
+    return _cached(("news", size), lambda: make_news(size))
+
+
+def news_with_keywords(size: int) -> pd.DataFrame:
+    def build():
+        from src.features.parallel import extract_keywords_parallel
+        from src.features.keywords import TECH_KEYWORDS
+        df = news(size).copy()
+        df["keywords"] = extract_keywords_parallel(df["text"], TECH_KEYWORDS, workers=1)
+        return df
+    return _cached(("keywords", size), build)
+
+
+def network_counts(size: int) -> pd.DataFrame:
+    def build():
+        from src.temporal_network_analysis import count_cooccurrence_cells
+        return count_cooccurrence_cells(news_with_keywords(size))
+    return _cached(("counts", size), build)
+
+
+def monthly_network_counts(size: int) -> pd.DataFrame:
+    def build():
+        from src.temporal_network_analysis import count_cooccurrence_cells
+        df = news_with_keywords(size).copy()
+        df["month"] = df["date"].dt.to_period("M").astype(str)
+        return count_cooccurrence_cells(df, period="month")
+    return _cached(("monthly_counts", size), build)
+
+
+def news_tokens(size: int):
+    def build():
+        from src.features.text import build_tokenizer
+        tokenizer = build_tokenizer("korean")
+        return news(size), [tokenizer(text) for text in news(size)["text"]]
+    return _cached(("tokens", size), build)
+
+
+def dictionary_counts(size: int):
+    def build():
+        from src.analyze_news_v2 import build_term_counts
+        return build_term_counts(news(size), workers=1)
+    return _cached(("term_counts", size), build)
+
+
+def trend_counts(size: int):
+    def build():
+        from src.analyze_news import TARGET_TECHS
+        from src.features.term_counts import TermCountMatrix
+        return TermCountMatrix.from_texts(news(size)["text"], TARGET_TECHS)
+    return _cached(("trend_counts", size), build)
+
+
+def patents(size: int) -> pd.DataFrame:
+    # 출원 1건당 평균 3개 CPC 코드 -> 뉴스 크기의 1/3 출원
+    return _cached(("patents", size), lambda: make_patents(max(1, size // 3)))
+
+
+def patent_cpc_frame(size: int):
+    """patents(size) 를 PatentCorpus.cpc_frame() 형식 (appln_id, cpc_id, 출원연도) 과 CPCIndex 로 변환."""
+    def build():
+        from src.features.cpc import CPCIndex
+        df = patents(size)
+        cpc_id, symbols = pd.factorize(df["cpc_class_symbol"], sort=True)
+        frame = pd.DataFrame({"appln_id": df["appln_id"], "cpc_id": cpc_id.astype(np.int32),
+                              "appln_filing_year": df["appln_filing_year"]})
+        return frame, CPCIndex.from_symbols(symbols)
+    return _cached(("patent_cpc", size), build)
+
+
+def patent_raw_dir(size: int):
+    """patents(size) 와 이를 HBM_Gemini.csv 로 기록한 임시 원본 디렉토리."""
+    def build():
+        raw_dir = Path(tempfile.mkdtemp(prefix="bench-patents-")) / "raw"
+        path = raw_dir / "HBM" / "HBM_Gemini.csv"
+        path.parent.mkdir(parents=True)
+        patents(size).to_csv(path, index=False)
+        return patents(size), raw_dir
+    return _cached(("patent_raw", size), build)
+
+
+# ---------------------------------------------------------------------------
+# 벤치마크
+# ---------------------------------------------------------------------------
+
+@benchmark("keyword_extraction", news)
+def bench_keyword_extraction(df):
+    from src.features.keywords import TECH_KEYWORDS
+    from src.features.parallel import extract_keywords_parallel
+    return extract_keywords_parallel(df["text"], TECH_KEYWORDS, workers=1)
+
+
+@benchmark("keyword_sets", news)
+def bench_keyword_sets(df):
+    from src.features.keywords import TECH_KEYWORDS
+    from src.features.parallel import extract_keyword_sets_parallel
+    return extract_keyword_sets_parallel(df["text"], TECH_KEYWORDS, workers=1)
+
+
+@benchmark("keyword_counts", news)
+def bench_keyword_counts(df):
+    from src.analyze_news_v2 import get_dictionary_terms
+    from src.features.term_counts import TermCountMatrix
+    return TermCountMatrix.from_texts(df["text"], get_dictionary_terms())
+
+
+@benchmark("cooccurrence", news_with_keywords)
+def bench_cooccurrence(df):
+    from src.temporal_network_analysis import count_cooccurrence_cells
+    return count_cooccurrence_cells(df)
+
+
+@benchmark("centrality", network_counts, unit="edges")
+def bench_centrality(counts):
+    from src.temporal_network_analysis import (
+        CENTRALITY_MIN_EDGE_WEIGHT, analyze_centrality_evolution, company_edges,
+    )
+    return [analyze_centrality_evolution(company_edges(counts, company), min_edge_weight=min_edge_weight)
+            for company, min_edge_weight in CENTRALITY_MIN_EDGE_WEIGHT.items()]
+
+
+@benchmark("rolling_networks", monthly_network_counts, unit="edges")
+def bench_rolling_networks(counts):
+    from src.temporal_network_analysis import rolling_networks_from_counts
+    return rolling_networks_from_counts(counts, window=12, step=1, freq='M')
+
+
+@benchmark("emerging_keywords", news_tokens)
+def bench_emerging_keywords(state):
+    from src.features.bursts import BurstDetector
+    df, tokens = state
+    detector = BurstDetector()
+    return detector.update(df["date"], df["company"].astype(str), tokens), detector.flush()
+
+
+@benchmark("sentiment", lambda size: (news(size), dictionary_counts(size)))
+def bench_sentiment(state):
+    from src.analyze_news_v2 import analyze_sentiment
+    df, term_counts = state
+    return analyze_sentiment(df, term_counts)
+
+
+@benchmark("tech_social_impact", lambda size: (news(size), dictionary_counts(size)))
+def bench_tech_social_impact(state):
+    from src.analyze_news_v2 import analyze_tech_social_impact
+    df, term_counts = state
+    return analyze_tech_social_impact(df, term_counts)
+
+
+@benchmark("trend_aggregation", lambda size: (news(size), trend_counts(size)))
+def bench_trend_aggregation(state):
+    from src.analyze_news import analyze_trends
+    df, term_counts = state
+    return analyze_trends(df, term_counts)
+
+
+@benchmark("milestones", news)
+def bench_milestones(df):
+    from src.analyze_news import extract_milestones
+    return extract_milestones(df)
+
+
+@benchmark("text_clean", news)
+def bench_text_clean(df):
+    from src.features.text import TextPreprocessor
+    return TextPreprocessor(languages=("english",)).clean_many(df["text"])
+
+
+@benchmark("patent_cpc_aggregation", patents, unit="rows")
+def bench_patent_cpc_aggregation(df):
+    # 출원연도 × CPC 서브클래스(앞 4자리)별 고유 출원 수
+    subclass = df["cpc_class_symbol"].str[:4]
+    return (df.assign(subclass=subclass)
+              .groupby(["appln_filing_year", "subclass"])["appln_id"].nunique()
+              .unstack(fill_value=0))
+
+
+@benchmark("cpc_hierarchy_counts", patent_cpc_frame, unit="rows")
+def bench_cpc_hierarchy_counts(state):
+    # patent_cpc_aggregation 과 같은 서브클래스 집계 + 메인그룹 집계와 전년 대비 증가율
+    from src.features.cpc import cpc_counts, cpc_growth
+    frame, index = state
+    return cpc_counts(frame, index, "subclass"), cpc_growth(cpc_counts(frame, index, "group"))
+
+
+@benchmark("patent_csv_read", patent_raw_dir, unit="rows")
+def bench_patent_csv_read(state):
+    # 인코딩 감지(지문 캐시 적중) + 1회 읽기 + 제목 컬럼 복구 검사
+    from src.data.loaders import load_text_csv
+    _, raw_dir = state
+    return load_text_csv(raw_dir / "HBM" / "HBM_Gemini.csv", text_columns=["appln_title"], dtype=str)
+
+
+@benchmark("patent_corpus_build", patent_raw_dir, unit="rows")
+def bench_patent_corpus_build(state):
+    from src.data.loaders import build_patent_corpus
+    _, raw_dir = state
+    return build_patent_corpus(raw_dir)
+
+
+# ---------------------------------------------------------------------------
+# 실행/기록
+# ---------------------------------------------------------------------------
+
+def _git(*args) -> Optional[str]:
+    try:
+        return subprocess.run(["git", *args], cwd=PROJECT_ROOT, capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _cpu_model() -> str:
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def environment() -> dict:
+    """결과 비교 단위가 되는 머신/소프트웨어 정보."""
+    return {
+        "machine": platform.node(),
+        "cpu": _cpu_model(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+    }
+
+
+def time_benchmark(bench: Benchmark, size: int, repeat: int) -> dict:
+    state = bench.setup(size)
+    bench.run(state)  # 워밍업 (import, 매처 컴파일 캐시 등)
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        bench.run(state)
+        timings.append(time.perf_counter() - start)
+    n = len(state[0] if isinstance(state, tuple) else state)
+    best = min(timings)
+    return {
+        "benchmark": bench.name,
+        "size": size,
+        "n": n,
+        "unit": bench.unit,
+        "repeat": repeat,
+        "min_s": best,
+        "median_s": statistics.median(timings),
+        "per_s": n / best if best > 0 else None,
+    }
+
+
+def run(names: List[str], sizes: List[int], repeat: int, results_path: Path, save: bool = True) -> List[dict]:
+    env = environment()
+    commit = _git("rev-parse", "HEAD")
+    dirty = bool(_git("status", "--porcelain", "--untracked-files=no"))
+    stamp = datetime.now().isoformat(timespec="seconds")
+    records = []
+    print(f"{'benchmark':24s} {'size':>9s} {'min(s)':>9s} {'median(s)':>10s} {'throughput':>16s}")
+    for size in sizes:
+        for name in names:
+            record = time_benchmark(BENCHMARKS[name], size, repeat)
+            record.update(commit=commit, dirty=dirty, timestamp=stamp, env=env)
+            records.append(record)
+            rate = f"{record['per_s']:,.0f} {record['unit']}/s" if record["per_s"] else ""
+            print(f"{name:24s} {size:>9,d} {record['min_s']:>9.4f} {record['median_s']:>10.4f} {rate:>16s}")
+        _inputs.clear()
+    if save:
+        results_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(results_path, "a", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        print(f"\n{len(records)} results appended to {results_path}")
+    return records
+
+
+def load_results(results_path: Path) -> pd.DataFrame:
+    with open(results_path, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f if line.strip()]
+    df = pd.json_normalize(records)
+    return df
+
+
+def compare(base: str, head: str, results_path: Path, machine: Optional[str] = None) -> pd.DataFrame:
+    """두 커밋의 (benchmark, size)별 최소 시간 비교. 같은 머신(cpu, machine) 결과만 사용합니다."""
+    df = load_results(results_path)
+    machine = machine or platform.node()
+    df = df[df["env.machine"] == machine]
+    commits = {}
+    for label, rev in (("base", base), ("head", head)):
+        sha = _git("rev-parse", rev) or rev
+        subset = df[df["commit"].fillna("").str.startswith(sha)]
+        if subset.empty:
+            raise SystemExit(f"{rev} ({sha[:10]}) 의 결과가 {results_path} 에 없습니다 (machine={machine}).")
+        commits[label] = subset.groupby(["benchmark", "size"])["min_s"].min()
+    table = pd.DataFrame(commits).dropna()
+    table["ratio"] = table["head"] / table["base"]
+    return table
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = sub.add_parser("run", help="벤치마크 실행 및 결과 저장")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=[10_000],
+                            help="합성 뉴스 문서 수 (예: 10000 100000 1000000)")
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("-k", "--filter", action="append", default=[],
+                            help="이름에 이 문자열이 포함된 벤치마크만 실행 (여러 번 지정 가능)")
+    run_parser.add_argument("--results", type=Path, default=RESULTS_PATH)
+    run_parser.add_argument("--no-save", action="store_true", help="결과 파일에 기록하지 않음")
+
+    compare_parser = sub.add_parser("compare", help="두 커밋의 결과 비교")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("head", nargs="?", default="HEAD")
+    compare_parser.add_argument("--results", type=Path, default=RESULTS_PATH)
+    compare_parser.add_argument("--machine", default=None, help="비교할 머신 이름 (기본값: 현재 머신)")
+
+    sub.add_parser("list", help="벤치마크 목록")
+    args = parser.parse_args()
+
+    if args.command == "list":
+        for name, bench in BENCHMARKS.items():
+            print(f"{name:24s} ({bench.unit})")
+    elif args.command == "run":
+        names = [name for name in BENCHMARKS if not args.filter or any(f in name for f in args.filter)]
+        if not names:
+            parser.error(f"일치하는 벤치마크가 없습니다: {args.filter}")
+        run(names, args.sizes, args.repeat, args.results, save=not args.no_save)
+    else:
+        table = compare(args.base, args.head, args.results, args.machine)
+        with pd.option_context("display.float_format", "{:.4f}".format):
+            print(table.to_string())
+        slower = table[table["ratio"] > 1.1]
+        if len(slower):
+            print(f"\n10% 이상 느려진 항목: {len(slower)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
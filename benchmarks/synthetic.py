@@ -0,0 +1,154 @@
+"""벤치마크용 합성 코퍼스 생성기 (반도체 뉴스, 특허 분류 표).
+
+같은 (크기, seed) 이면 항상 같은 데이터를 만들므로 커밋 간 결과를 비교할 수 있습니다.
+큰 코퍼스(수백만 건)는 `iter_news` 로 청크 단위로 생성합니다.
+
+- 뉴스: 한국어 본문에 기술 키워드(TECH_KEYWORDS), 영문 용어, 감성어, 마일스톤 동사를 섞은 기사.
+  컬럼은 Parquet 뉴스 코퍼스와 같습니다 (article_id, date, company, year, title, content, text).
+- 특허: HBM_Gemini.csv 와 같은 컬럼의 출원×CPC 표 (appln_id, appln_auth, appln_nr,
+  appln_filing_year, appln_title, cpc_class_symbol).
+
+실행(원본 CSV 생성): python -m benchmarks.synthetic --docs 100000 --out /tmp/bench/raw
+"""
+
+import argparse
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+import pandas as pd
+
+from src.data.loaders import NEWS_SOURCES
+from src.features.keywords import TECH_KEYWORDS
+
+KOREAN_FILLER = [
+    '반도체', '시장', '전망', '기업', '올해', '메모리', '제품', '고객', '기술', '생산', '확대', '분기',
+    '실적', '글로벌', '업계', '발표했다', '밝혔다', '수요', '공급망', '경쟁력', '점유율', '데이터센터',
+    '스마트폰', '전기차', '자율주행', '친환경', '수출', '경제', '고용', '경기', '클라우드', '인공지능',
+]
+ENGLISH_FILLER = ['memory', 'chip', 'wafer', 'yield', 'capex', 'server', 'GPU', 'TSMC', 'Nvidia', 'PC']
+SENTIMENT_WORDS = ['최대', '성장', '호조', '달성', '성공', '최초', '개선', '혁신', '흑자',
+                   '감소', '적자', '하락', '둔화', '위기', '우려', '부진', '손실']
+MILESTONE_WORDS = ['개발', '양산', '공급', '공개', '출시']
+
+WORDS = np.array(KOREAN_FILLER + ENGLISH_FILLER + SENTIMENT_WORDS + MILESTONE_WORDS + list(TECH_KEYWORDS),
+                 dtype=object)
+# 단어 선택 확률: 일반어 대부분, 기술 키워드 약 12%, 감성/마일스톤 어휘 약 8%
+_WEIGHTS = np.concatenate([
+    np.full(len(KOREAN_FILLER), 0.65 / len(KOREAN_FILLER)),
+    np.full(len(ENGLISH_FILLER), 0.15 / len(ENGLISH_FILLER)),
+    np.full(len(SENTIMENT_WORDS), 0.05 / len(SENTIMENT_WORDS)),
+    np.full(len(MILESTONE_WORDS), 0.03 / len(MILESTONE_WORDS)),
+    np.full(len(TECH_KEYWORDS), 0.12 / len(TECH_KEYWORDS)),
+])
+_WEIGHTS /= _WEIGHTS.sum()
+
+CPC_SYMBOLS = [
+    'G11C   5/04', 'G11C   5/06', 'G11C   7/10', 'G11C  11/4096', 'G11C  29/12', 'H01L  25/0657',
+    'H01L  23/481', 'H01L  21/76898', 'H01L  25/18', 'H01L2225/06541', 'G06F  13/1668',
+    'G06F  12/0802', 'G06F  13/4068', 'H05K   1/181', 'H10B  80/00', 'G01R  31/2884',
+]
+PATENT_TITLE_WORDS = ['stacked', 'memory', 'die', 'interposer', 'through-silicon', 'via', 'bandwidth',
+                      'controller', 'package', 'thermal', 'interface', 'buffer', 'semiconductor', 'device']
+
+
+def _texts(rng: np.random.Generator, n: int, words_per_doc: int, sentence_length: int = 12) -> np.ndarray:
+    """단어를 확률적으로 뽑아 sentence_length 단어마다 '. ' 로 끊은 문서를 만듭니다."""
+    picks = WORDS[rng.choice(len(WORDS), size=(n, words_per_doc), p=_WEIGHTS)]
+    out = np.empty(n, dtype=object)
+    for i, row in enumerate(picks):
+        sentences = [" ".join(row[j:j + sentence_length]) for j in range(0, words_per_doc, sentence_length)]
+        out[i] = ". ".join(sentences) + "."
+    return out
+
+
+def iter_news(
+    n_docs: int,
+    seed: int = 0,
+    words_per_doc: int = 120,
+    chunksize: int = 100_000,
+    years: range = range(2014, 2025),
+) -> Iterator[pd.DataFrame]:
+    """합성 기사를 chunksize 건씩 생성합니다 (청크마다 (seed, 시작 위치)로 난수를 초기화)."""
+    companies = list(NEWS_SOURCES)
+    for start in range(0, n_docs, chunksize):
+        n = min(chunksize, n_docs - start)
+        rng = np.random.default_rng([seed, start])
+        year = rng.integers(years.start, years.stop, size=n)
+        day_of_year = rng.integers(0, 365, size=n)
+        date = pd.to_datetime(year.astype(str), format="%Y") + pd.to_timedelta(day_of_year, unit="D")
+        title = _texts(rng, n, 8, sentence_length=8)
+        content = _texts(rng, n, words_per_doc)
+        yield pd.DataFrame({
+            "article_id": np.arange(start, start + n, dtype=np.int64),
+            "date": date,
+            "company": pd.Categorical(np.asarray(companies, dtype=object)[rng.integers(0, len(companies), size=n)],
+                                      categories=companies),
+            "year": year.astype(np.int64),
+            "title": title,
+            "content": content,
+            "text": title + " " + content,
+        })
+
+
+def make_news(n_docs: int, seed: int = 0, **options) -> pd.DataFrame:
+    """n_docs 건의 합성 기사 (날짜순 정렬)."""
+    df = pd.concat(iter_news(n_docs, seed, **options), ignore_index=True)
+    return df.sort_values("date", kind="stable").reset_index(drop=True)
+
+
+def write_news_csvs(raw_dir, n_docs: int, seed: int = 0, **options) -> None:
+    """기업별 원본 뉴스 CSV(NEWS_SOURCES 형식)를 raw_dir 에 씁니다 (파이프라인 벤치마크용)."""
+    raw_dir = Path(raw_dir)
+    raw_dir.mkdir(parents=True, exist_ok=True)
+    first = True
+    for chunk in iter_news(n_docs, seed, **options):
+        for company, (filename, date_format) in NEWS_SOURCES.items():
+            part = chunk[chunk["company"] == company]
+            out = pd.DataFrame({"date": part["date"].dt.strftime(date_format),
+                                "title": part["title"], "content": part["content"]})
+            out.to_csv(raw_dir / filename, mode="w" if first else "a", header=first, index=False)
+        first = False
+
+
+def make_patents(n_applications: int, seed: int = 0, max_codes: int = 5) -> pd.DataFrame:
+    """출원별로 1~max_codes 개의 CPC 코드를 가진 HBM_Gemini.csv 형식 표."""
+    rng = np.random.default_rng(seed)
+    codes_per_app = rng.integers(1, max_codes + 1, size=n_applications)
+    appln_id = np.arange(600_000_000, 600_000_000 + n_applications, dtype=np.int64)
+    titles = np.array([" ".join(words) for words in
+                       np.asarray(PATENT_TITLE_WORDS, dtype=object)[
+                           rng.integers(0, len(PATENT_TITLE_WORDS), size=(n_applications, 6))]],
+                      dtype=object)
+    auth = np.asarray(['US', 'KR', 'CN', 'JP', 'EP', 'WO'], dtype=object)[
+        rng.integers(0, 6, size=n_applications)]
+    rows = np.repeat(np.arange(n_applications), codes_per_app)
+    return pd.DataFrame({
+        "appln_id": appln_id[rows],
+        "appln_auth": auth[rows],
+        "appln_nr": (appln_id[rows] * 7 % 10**9).astype(str),
+        "appln_filing_year": rng.integers(2010, 2025, size=n_applications)[rows],
+        "appln_title": titles[rows],
+        "cpc_class_symbol": np.asarray(CPC_SYMBOLS, dtype=object)[rng.integers(0, len(CPC_SYMBOLS), size=len(rows))],
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=100_000)
+    parser.add_argument("--patents", type=int, default=0, help="특허 출원 수 (0 이면 생성하지 않음)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", required=True, help="원본 CSV 를 쓸 디렉토리")
+    args = parser.parse_args()
+
+    write_news_csvs(args.out, args.docs, args.seed)
+    print(f"{args.docs:,} articles written to {args.out}/")
+    if args.patents:
+        path = Path(args.out) / "HBM" / "HBM_Gemini.csv"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        make_patents(args.patents, args.seed).to_csv(path, index=False)
+        print(f"{args.patents:,} patent applications written to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,119 +1,140 @@
 import pandas as pd
 import re
 import os
+import argparse
 from collections import Counter
 from datetime import datetime
+from functools import lru_cache
 
-# 설정
-DATA_DIR = "/home/arkwith/SKKU/tech_forcast/data/raw"
-OUTPUT_DIR = "/home/arkwith/SKKU/tech_forcast/data/processed"
+from src.data.incremental import aggregate_chunks, start_incremental_run, update_aggregate_table
+from src.data.loaders import NEWS_CHUNKSIZE, iter_articles
+from src.features.sentences import sentence_table
+from src.features.term_counts import TermCountMatrix
+from src.features.text import build_tokenizer
+from src.pipeline.config import config_path
+
+# 설정 (경로는 configs/pipeline_config.yaml 기준)
+DATA_DIR = config_path("data", "raw_dir")
+OUTPUT_DIR = config_path("data", "processed_dir")
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-def load_data():
-    # Samsung Data
-    sam_df = pd.read_csv(os.path.join(DATA_DIR, "samsung_news.csv"))
-    sam_df['date'] = pd.to_datetime(sam_df['date'], format='%Y.%m.%d', errors='coerce')
-    sam_df['company'] = 'Samsung'
-    
-    # SK Hynix Data
-    sk_df = pd.read_csv(os.path.join(DATA_DIR, "skhynix_news.csv"))
-    sk_df['date'] = pd.to_datetime(sk_df['date'], format='%Y-%m-%d', errors='coerce')
-    sk_df['company'] = 'SKHynix'
-    
-    # Merge and Filter (2016-2024)
-    df = pd.concat([sam_df, sk_df], ignore_index=True)
-    df = df[(df['date'] >= '2016-01-01') & (df['date'] <= '2024-12-31')]
-    
-    # Combine title and content for analysis
-    df['text'] = df['title'].fillna('') + " " + df['content'].fillna('')
-    return df
+@lru_cache(maxsize=None)
+def _korean_tokenizer():
+    # 토크나이저(불용어 사전 포함)는 처음 호출할 때 한 번만 만듭니다.
+    return build_tokenizer('korean')
 
 def extract_keywords(text):
-    # 기술 용어(영어+숫자 등) 보존을 위한 정규식
-    # 예: HBM, DDR5, 3D NAND, GAA, 10nm
-    
-    # 1. 영어/숫자 혼합 키워드 추출 (예: HBM3E, DDR5, i7)
-    tech_terms = re.findall(r'\b[A-Za-z]+[0-9]+[A-Za-z]*\b|\b[A-Za-z]{2,}\b', text)
-    
-    # 2. 한글 명사 추출 (간이) - 조사가 붙는 패턴 제외 노력
-    # 실제로는 형태소 분석기가 좋지만, 복합명사 처리를 위해 N-gram이나 명사 패턴을 정규식으로 근사
-    # 여기서는 간단하게 2글자 이상 한글만 추출
-    korean_nouns = re.findall(r'[가-힣]{2,}', text)
-    
-    # 불용어 제거 (분석에 방해되는 일반 명사들)
-    stop_words = set(['삼성', '삼성전자', '하이닉스', 'SK하이닉스', '전자', '반도체', '발표', '개최', '참석', '진행', '예정', '이번', '통해', '위해', '관련', '제공', '사용', '적용', '기준', '부문', '기록', '대비', '증가', '감소', '설명', '포함', '시작', '계획', '목표'])
-    
-    keywords = [w for w in tech_terms + korean_nouns if w not in stop_words and len(w) > 1]
-    return keywords
+    # 기술 용어(영어+숫자, 예: HBM3E, DDR5)와 조사/어미를 뗀 한글 명사 추출
+    # ('파운드리는' -> '파운드리'). 불용어는 data/interim/stopwords/korean.txt 에서 관리
+    return _korean_tokenizer()(text)
 
-def analyze_trends(df):
-    # 주요 기술 키워드 정의
-    target_techs = ['HBM', 'DDR', 'NAND', 'DRAM', 'EUV', 'GAA', 'CIS', 'Foundry', '파운드리', 'OLED', 'AI', 'LPDDR', 'GDDR', 'HBM3', 'HBM3E']
-    
-    results = []
+# 주요 기술 키워드 정의
+TARGET_TECHS = ['HBM', 'DDR', 'NAND', 'DRAM', 'EUV', 'GAA', 'CIS', 'Foundry', '파운드리', 'OLED', 'AI', 'LPDDR', 'GDDR', 'HBM3', 'HBM3E']
+
+def analyze_trends(df, term_counts=None):
+    # 기사별 기술 키워드 빈도(대소문자 통일) 행렬을 월×기업으로 합산
+    # term_counts: df 행 순서와 같은 TermCountMatrix (없으면 새로 계산)
+    if term_counts is None:
+        term_counts = TermCountMatrix.from_texts(df['text'], TARGET_TECHS)
     
     df['year_month'] = df['date'].dt.to_period('M')
     
-    for period, group in df.groupby(['year_month', 'company']):
-        text_blob = " ".join(group['text'].tolist())
-        # 대소문자 통일하여 검색
-        text_lower = text_blob.lower()
-        
-        counts = {}
-        for tech in target_techs:
-            # 단순 포함 여부가 아니라 빈도수 체크
-            counts[tech] = text_lower.count(tech.lower())
-            
-        row = {
-            'date': str(period[0]),
-            'company': period[1],
-            **counts
-        }
-        results.append(row)
-        
-    return pd.DataFrame(results)
+    sums = term_counts.aggregate(df[['year_month', 'company']], TARGET_TECHS)
+    trend_df = sums.reset_index().rename(columns={'year_month': 'date'})
+    trend_df['date'] = trend_df['date'].astype(str)
+    trend_df['company'] = trend_df['company'].astype(str)
+    return trend_df
+
+# 마일스톤: (기술) + (행위) 패턴
+MILESTONE_TECH_PATTERN = re.compile(r'(HBM|DDR|NAND|DRAM|파운드리|EUV|GAA|CXL|PIM)', re.IGNORECASE)
+MILESTONE_ACTION_PATTERN = re.compile(r'(?:개발|양산|공급|공개|출시|성공|최초)')
+MILESTONE_COLUMNS = ['date', 'company', 'tech', 'content', 'article_id', 'sentence_id', 'offset']
 
 def extract_milestones(df):
     # 마일스톤: (기술) + (행위) 패턴 문장 추출
-    milestones = []
-    
-    tech_pattern = r'(HBM|DDR|NAND|DRAM|파운드리|EUV|GAA|CXL|PIM)'
-    action_pattern = r'(개발|양산|공급|공개|출시|성공|최초)'
-    
-    for idx, row in df.iterrows():
-        sentences = re.split(r'[.!?]\s+', str(row['text']))
-        for sent in sentences:
-            if re.search(tech_pattern, sent, re.IGNORECASE) and re.search(action_pattern, sent):
-                # 날짜, 회사, 관련 기술, 내용
-                tech_match = re.search(tech_pattern, sent, re.IGNORECASE)
-                tech_name = tech_match.group(0).upper() if tech_match else "ETC"
-                
-                milestones.append({
-                    'date': row['date'],
-                    'company': row['company'],
-                    'tech': tech_name,
-                    'content': sent[:200].strip() # 너무 길면 자름
-                })
-    
-    return pd.DataFrame(milestones)
+    # 기사를 문장 테이블로 한 번 펼친 뒤 컴파일된 패턴을 벡터화해 적용
+    df = df.reset_index(drop=True)
+    sentences = sentence_table(df['text'])
+    sentences = sentences[sentences['sentence'].str.contains(MILESTONE_ACTION_PATTERN)]
+    tech = sentences['sentence'].str.extract(MILESTONE_TECH_PATTERN, expand=False)
+    sentences = sentences[tech.notna()]
+    
+    rows = sentences['row'].to_numpy()
+    article_id = df['article_id'].to_numpy() if 'article_id' in df.columns else df.index.to_numpy()
+    return pd.DataFrame({
+        # 날짜, 회사, 관련 기술, 내용 (너무 길면 자름), 기사 id, 문장 순번/위치
+        'date': df['date'].to_numpy()[rows],
+        'company': df['company'].astype(str).to_numpy()[rows],
+        'tech': tech[tech.notna()].str.upper().to_numpy(),
+        'content': sentences['sentence'].str.slice(0, 200).str.strip().to_numpy(),
+        'article_id': article_id[rows],
+        'sentence_id': sentences['sentence_id'].to_numpy(),
+        'offset': sentences['offset'].to_numpy(),
+    }, columns=MILESTONE_COLUMNS)
+
+def iter_milestones(chunks):
+    # 스트리밍 모드: 청크(예: iter_articles 결과)마다 마일스톤 표를 반환
+    for chunk in chunks:
+        yield extract_milestones(chunk)
+
+def stream_milestones(save_path, chunksize=NEWS_CHUNKSIZE):
+    """원본 CSV 전체를 청크 단위로 읽어 마일스톤을 파일에 이어 씁니다 (메모리는 청크 크기에 비례).
+
+    결과는 기업/원본 파일 순서로 기록되며 날짜 정렬은 하지 않습니다.
+    """
+    chunks = iter_articles(DATA_DIR, columns=['article_id', 'date', 'company', 'text'],
+                           years=range(2016, 2025), chunksize=chunksize)
+    total = 0
+    with open(save_path, 'w', encoding='utf-8', newline='') as f:
+        pd.DataFrame(columns=MILESTONE_COLUMNS).to_csv(f, index=False)
+        for milestone_df in iter_milestones(chunks):
+            milestone_df.to_csv(f, index=False, header=False)
+            total += len(milestone_df)
+    return total
+
+def stream_trends(save_path, chunksize=NEWS_CHUNKSIZE):
+    """원본 CSV 전체를 청크 단위로 읽어 월×기업 기술 키워드 빈도를 합산해 저장합니다.
+
+    빈도는 기사 단위로 합산 가능하므로 메모리에는 한 청크와 누적 집계 표만 유지됩니다.
+    """
+    chunks = iter_articles(DATA_DIR, columns=['date', 'company', 'text'],
+                           years=range(2016, 2025), chunksize=chunksize)
+    trend_df = aggregate_chunks(chunks, analyze_trends, ['date', 'company'])
+    trend_df.to_csv(save_path, index=False)
+    return trend_df
+
+def main(incremental=False, workers=None):
+    """incremental=True 이면 이전 실행 이후 코퍼스에 추가된 기사만 분석해 기존 결과에 병합
 
-def main():
+    workers: 키워드 빈도 계산 프로세스 수 (None 이면 CPU 코어 수)
+    """
     print("Loading data...")
-    df = load_data()
-    print(f"Data loaded. Total records (2016-2024): {len(df)}")
-    
-    # 1. 기술 트렌드 시계열 데이터 생성
-    print("Analyzing trends...")
-    trend_df = analyze_trends(df)
     trend_save_path = os.path.join(OUTPUT_DIR, "tech_trends_timeseries.csv")
-    trend_df.to_csv(trend_save_path, index=False)
+    milestone_save_path = os.path.join(OUTPUT_DIR, "tech_milestones.csv")
+    run = start_incremental_run(
+        'analyze_news', OUTPUT_DIR, raw_dir=DATA_DIR,
+        columns=['article_id', 'date', 'company', 'text'], years=range(2016, 2025), incremental=incremental,
+        outputs=[trend_save_path, milestone_save_path]
+    )
+    df = run.articles
+    scope = "Total" if run.full else "New"
+    print(f"Data loaded. {scope} records (2016-2024): {len(df)}")
+    
+    # 1. 기술 트렌드 시계열 데이터 생성 (월×기업 빈도는 기사 단위로 합산 가능)
+    print("Analyzing trends...")
+    df = df.reset_index(drop=True)
+    term_counts = TermCountMatrix.from_texts(df['text'], TARGET_TECHS, workers=workers)
+    trend_df = analyze_trends(df, term_counts)
+    trend_df = update_aggregate_table(trend_save_path, trend_df, ['date', 'company'], run.full)
     print(f"Trend data saved to {trend_save_path}")
     
-    # 2. 마일스톤 데이터 생성
+    # 2. 마일스톤 데이터 생성 (신규 기사의 마일스톤을 기존 목록에 추가)
     print("Extracting milestones...")
     milestone_df = extract_milestones(df)
-    milestone_save_path = os.path.join(OUTPUT_DIR, "tech_milestones.csv")
-    milestone_df = milestone_df.sort_values('date')
+    if not run.full:
+        stored = pd.read_csv(milestone_save_path, parse_dates=['date'])
+        milestone_df = pd.concat([stored, milestone_df], ignore_index=True)
+    milestone_df = milestone_df.sort_values('date', kind='stable')
     milestone_df.to_csv(milestone_save_path, index=False)
     print(f"Milestone data saved to {milestone_save_path}")
     
@@ -125,7 +146,24 @@ def main():
     recent = milestone_df[milestone_df['date'] >= '2024-01-01'].head(5)
     for _, row in recent.iterrows():
         print(f"[{row['date'].date()}] {row['company']} - {row['tech']}: {row['content'][:100]}...")
+    
+    run.commit()
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="뉴스 기술 트렌드/마일스톤 분석")
+    parser.add_argument('--incremental', action='store_true', help="신규 기사만 분석해 기존 결과에 병합")
+    parser.add_argument('--workers', type=int, default=None, help="병렬 프로세스 수 (기본값: CPU 코어 수)")
+    parser.add_argument('--stream', action='store_true',
+                        help="코퍼스 대신 전체 원본 CSV를 청크 단위로 읽어 트렌드 집계와 마일스톤을 추출")
+    parser.add_argument('--stream-milestones', action='store_true',
+                        help="전체 원본 CSV를 청크 단위로 읽어 마일스톤만 추출")
+    args = parser.parse_args()
+    if args.stream:
+        trend_save_path = os.path.join(OUTPUT_DIR, "tech_trends_timeseries.csv")
+        print(f"{len(stream_trends(trend_save_path))} trend rows saved to {trend_save_path}")
+    if args.stream or args.stream_milestones:
+        save_path = os.path.join(OUTPUT_DIR, "tech_milestones.csv")
+        print(f"{stream_milestones(save_path)} milestones saved to {save_path}")
+    else:
+        main(incremental=args.incremental, workers=args.workers)
 
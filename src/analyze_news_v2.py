@@ -1,33 +1,22 @@
 import pandas as pd
+import numpy as np
 import re
 import os
+import argparse
 from collections import Counter
 from datetime import datetime
 import itertools
 
-# 설정
-DATA_DIR = "/home/arkwith/SKKU/tech_forcast/data/raw"
-OUTPUT_DIR = "/home/arkwith/SKKU/tech_forcast/data/processed"
-os.makedirs(OUTPUT_DIR, exist_ok=True)
+from src.data.incremental import commit_full_run, start_incremental_run, update_aggregate_table
+from src.data.loaders import news_source_paths
+from src.features.term_counts import TermCountMatrix
+from src.pipeline.cache import cached_stage, configure_stage_cache
+from src.pipeline.config import config_path
 
-def load_data():
-    # Samsung Data
-    sam_df = pd.read_csv(os.path.join(DATA_DIR, "samsung_news.csv"))
-    sam_df['date'] = pd.to_datetime(sam_df['date'], format='%Y.%m.%d', errors='coerce')
-    sam_df['company'] = 'Samsung'
-    
-    # SK Hynix Data
-    sk_df = pd.read_csv(os.path.join(DATA_DIR, "skhynix_news.csv"))
-    sk_df['date'] = pd.to_datetime(sk_df['date'], format='%Y-%m-%d', errors='coerce')
-    sk_df['company'] = 'SKHynix'
-    
-    # Merge and Filter (2016-2024)
-    df = pd.concat([sam_df, sk_df], ignore_index=True)
-    df = df[(df['date'] >= '2016-01-01') & (df['date'] <= '2024-12-31')]
-    
-    # Combine title and content
-    df['text'] = df['title'].fillna('') + " " + df['content'].fillna('')
-    return df
+# 설정 (경로는 configs/pipeline_config.yaml 기준)
+DATA_DIR = config_path("data", "raw_dir")
+OUTPUT_DIR = config_path("data", "processed_dir")
+os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 def get_tech_keywords():
     return ['HBM', 'DDR', 'NAND', 'DRAM', 'EUV', 'GAA', '파운드리', 'CIS', 'SSD', 'AP', '패키징']
@@ -42,102 +31,161 @@ def get_social_keywords():
         'Economy': ['수출', '경제', '고용', '투자', '경기', '공급망']
     }
 
-def analyze_tech_social_impact(df):
-    techs = get_tech_keywords()
-    social_cats = get_social_keywords()
-    
-    results = []
-    
-    # 연도별 기술-사회 키워드 동시 출현 빈도 분석
-    df['year'] = df['date'].dt.year
-    
-    for year, group in df.groupby('year'):
-        text_blob = " ".join(group['text'].tolist()).lower()
-        
-        for tech in techs:
-            tech_count = text_blob.count(tech.lower())
-            if tech_count == 0: continue
-                
-            row = {'year': year, 'tech': tech}
-            
-            for cat_name, keywords in social_cats.items():
-                # 해당 기술이 언급된 문맥 근처에 사회적 키워드가 있는지 확인하는 것이 가장 좋으나,
-                # 여기서는 전체 텍스트 내 공기(co-occurrence) 빈도로 근사합니다.
-                # 정교함을 위해 '기술' 키워드가 포함된 기사들만 필터링하여 사회 키워드 카운트
-                tech_articles = group[group['text'].str.contains(tech, case=False, na=False)]
-                tech_article_blob = " ".join(tech_articles['text'].tolist()).lower()
-                
-                cat_count = 0
-                for kw in keywords:
-                    cat_count += tech_article_blob.count(kw.lower())
-                
-                row[cat_name] = cat_count
-            
-            results.append(row)
-            
-    return pd.DataFrame(results)
-
-def analyze_sentiment(df):
+def get_sentiment_keywords():
     # 간단한 감성 사전
     pos_words = ['최대', '성장', '호조', '달성', '성공', '최초', '개선', '확대', '혁신', '수상', '흑자']
     neg_words = ['감소', '적자', '하락', '둔화', '위기', '우려', '불확실', '부진', '축소', '손실']
+    return pos_words, neg_words
+
+def get_dictionary_terms():
+    # 기술/사회/감성 사전의 합집합 (기사×용어 빈도 행렬의 열)
+    pos_words, neg_words = get_sentiment_keywords()
+    terms = list(get_tech_keywords()) + pos_words + neg_words
+    for keywords in get_social_keywords().values():
+        terms.extend(keywords)
+    return list(dict.fromkeys(terms))
+
+def build_term_counts(df, workers=1):
+    # 기사별 사전 용어 빈도를 한 번만 계산 (대소문자 통일, 한글 감성어는 영향 없음)
+    return TermCountMatrix.from_texts(df['text'], get_dictionary_terms(), workers=workers)
+
+def analyze_tech_social_impact(df, term_counts=None, categories=None, techs=None):
+    # categories: {카테고리명: 키워드 목록} 사용자 정의 사전 (기본값: get_social_keywords())
+    techs = get_tech_keywords() if techs is None else list(techs)
+    social_cats = get_social_keywords() if categories is None else dict(categories)
+    terms = list(dict.fromkeys(techs + [kw for keywords in social_cats.values() for kw in keywords]))
+    if term_counts is None or not set(terms) <= set(term_counts.vocabulary):
+        term_counts = TermCountMatrix.from_texts(df['text'], terms)
+    
+    # 연도별 기술-사회 키워드 동시 출현 빈도 분석
+    # 해당 기술이 언급된 문맥 근처에 사회적 키워드가 있는지 확인하는 것이 가장 좋으나,
+    # 여기서는 전체 텍스트 내 공기(co-occurrence) 빈도로 근사합니다.
+    # 정교함을 위해 '기술' 키워드가 포함된 기사들만 골라 사회 키워드 빈도를 합산하며,
+    # 기술 -> 기사 역색인과 기사별 카테고리 빈도를 한 번만 계산해 재사용합니다.
+    years, year_codes = np.unique(df['date'].dt.year.to_numpy(), return_inverse=True)
+    postings = term_counts.inverted_index(techs)
+    cat_totals = {cat_name: term_counts.total(keywords) for cat_name, keywords in social_cats.items()}
+    
+    present = np.zeros((len(years), len(techs)), dtype=bool)
+    cat_sums = {cat_name: np.zeros((len(years), len(techs)), dtype=np.int64) for cat_name in social_cats}
+    for j, tech in enumerate(techs):
+        articles = postings[tech]
+        codes = year_codes[articles]
+        present[:, j] = np.bincount(codes, minlength=len(years)) > 0
+        for cat_name, totals in cat_totals.items():
+            cat_sums[cat_name][:, j] = np.bincount(codes, weights=totals[articles], minlength=len(years))
+    
+    year_idx, tech_idx = np.nonzero(present)
+    impact_df = pd.DataFrame({'year': years[year_idx], 'tech': np.asarray(techs, dtype=object)[tech_idx]})
+    for cat_name, sums in cat_sums.items():
+        impact_df[cat_name] = sums[year_idx, tech_idx]
+    return impact_df
+
+def add_sentiment_index(sentiment_df):
+    # 정규화된 점수 (-1 ~ 1 사이). 빈도 합산 후 다시 계산할 수 있도록 분리
+    pos, neg = sentiment_df['positive_freq'], sentiment_df['negative_freq']
+    sentiment_df['sentiment_index'] = (pos - neg) / (pos + neg + 1)
+    return sentiment_df
+
+def analyze_sentiment(df, term_counts=None, workers=1):
+    # workers: term_counts 가 없을 때 빈도 계산에 쓸 프로세스 수
+    pos_words, neg_words = get_sentiment_keywords()
+    if term_counts is None:
+        term_counts = build_term_counts(df, workers=workers)
     
-    results = []
     df['year_month'] = df['date'].dt.to_period('M')
+    keys = df[['year_month', 'company']]
     
-    for (period, company), group in df.groupby(['year_month', 'company']):
-        text_blob = " ".join(group['text'].tolist())
-        
-        pos_score = sum(text_blob.count(w) for w in pos_words)
-        neg_score = sum(text_blob.count(w) for w in neg_words)
-        total_words = len(text_blob.split())
-        
-        # 정규화된 점수
-        sentiment_index = (pos_score - neg_score) / (pos_score + neg_score + 1) # -1 ~ 1 사이
-        
-        results.append({
-            'date': str(period),
-            'company': company,
-            'positive_freq': pos_score,
-            'negative_freq': neg_score,
-            'sentiment_index': sentiment_index,
-            'article_count': len(group)
-        })
-        
-    return pd.DataFrame(results)
-
-def main():
-    print("Loading data...")
-    df = load_data()
-    print(f"Loaded {len(df)} records.")
+    # 기사별 긍정/부정 빈도를 월×기업으로 합산
+    sums = term_counts.aggregate(keys, pos_words + neg_words)
+    sentiment_df = pd.DataFrame({
+        'positive_freq': sums[pos_words].sum(axis=1),
+        'negative_freq': sums[neg_words].sum(axis=1),
+        'sentiment_index': 0.0,
+        'article_count': keys.groupby(['year_month', 'company'], observed=True).size(),
+    }).reset_index().rename(columns={'year_month': 'date'})
+    sentiment_df['date'] = sentiment_df['date'].astype(str)
+    sentiment_df['company'] = sentiment_df['company'].astype(str)
+    
+    return add_sentiment_index(sentiment_df)
+
+# 결과 표: 이름 -> (파일명, 병합 키, 합산 후 재계산 함수)
+RESULT_TABLES = {
+    'impact': ("tech_social_impact.csv", ['year', 'tech'], None),
+    'sentiment': ("market_sentiment.csv", ['date', 'company'], add_sentiment_index),
+    'quarterly': ("tech_trends_quarterly.csv", ['date', 'company'], None),
+}
+
+def compute_tables(df, workers=1):
+    # 기사×용어 빈도 행렬 (모든 집계의 공통 중간 산출물)
+    term_counts = build_term_counts(df, workers=workers)
     
     # 1. 기술-사회 상호작용 데이터 (논문 'Discussion' 파트용)
     print("Analyzing Tech-Social Impact...")
-    impact_df = analyze_tech_social_impact(df)
-    impact_df.to_csv(os.path.join(OUTPUT_DIR, "tech_social_impact.csv"), index=False)
+    impact_df = analyze_tech_social_impact(df, term_counts)
     
     # 2. 감성 분석 데이터 (시장 반응 대리 지표)
     print("Analyzing Sentiment...")
-    sentiment_df = analyze_sentiment(df)
-    sentiment_df.to_csv(os.path.join(OUTPUT_DIR, "market_sentiment.csv"), index=False)
+    sentiment_df = analyze_sentiment(df, term_counts, workers=workers)
     
     # 3. 기존 시계열 트렌드 (재확인)
     print("Analyzing Tech Trends...")
     techs = get_tech_keywords()
-    trend_results = []
     df['year_quarter'] = df['date'].dt.to_period('Q')
     
-    for (period, company), group in df.groupby(['year_quarter', 'company']):
-        text_blob = " ".join(group['text'].tolist()).lower()
-        row = {'date': str(period), 'company': company}
-        for tech in techs:
-            row[tech] = text_blob.count(tech.lower())
-        trend_results.append(row)
-        
-    pd.DataFrame(trend_results).to_csv(os.path.join(OUTPUT_DIR, "tech_trends_quarterly.csv"), index=False)
-    
+    trend_df = (term_counts.aggregate(df[['year_quarter', 'company']], techs)
+                .reset_index().rename(columns={'year_quarter': 'date'}))
+    trend_df['date'] = trend_df['date'].astype(str)
+    trend_df['company'] = trend_df['company'].astype(str)
+    return {'impact': impact_df, 'sentiment': sentiment_df, 'quarterly': trend_df}
+
+def write_tables(tables, full):
+    # 모든 집계는 기사 단위 빈도의 합이므로 증분 결과를 기존 결과에 더해 병합
+    return {
+        name: update_aggregate_table(os.path.join(OUTPUT_DIR, filename), tables[name], keys, full,
+                                     finalize=finalize)
+        for name, (filename, keys, finalize) in RESULT_TABLES.items()
+    }
+
+def update_tables(incremental=False, workers=None):
+    print("Loading data...")
+    run = start_incremental_run(
+        'analyze_news_v2', OUTPUT_DIR, raw_dir=DATA_DIR,
+        columns=['date', 'company', 'text'], years=range(2016, 2025), incremental=incremental,
+        outputs=[os.path.join(OUTPUT_DIR, filename) for filename, _, _ in RESULT_TABLES.values()]
+    )
+    df = run.articles
+    print(f"Loaded {len(df)} {'records' if run.full else 'new records'}.")
+    tables = write_tables(compute_tables(df, workers=workers), run.full)
+    run.commit()
+    return tables
+
+# 전체 실행 결과는 원본 CSV, 사전/집계 코드가 그대로면 단계 캐시(data/interim/stage_cache)에서 재사용
+@cached_stage('news_v2_tables', files=lambda: news_source_paths(DATA_DIR),
+              config_sections=('data', 'features'),
+              code=('src.data', 'src.features', __name__), ignore=('workers',))
+def full_tables(workers=None):
+    return update_tables(incremental=False, workers=workers)
+
+def main(incremental=False, workers=None):
+    """incremental=True 이면 이전 실행 이후 코퍼스에 추가된 기사만 분석해 기존 결과에 병합
+
+    workers: 키워드 빈도 계산 프로세스 수 (None 이면 CPU 코어 수)
+    """
+    if incremental:
+        update_tables(incremental=True, workers=workers)
+    else:
+        write_tables(full_tables(workers=workers), full=True)
+        # 캐시 적중 시에는 update_tables 가 실행되지 않으므로 증분 상태를 여기서 기록
+        commit_full_run('analyze_news_v2', OUTPUT_DIR, raw_dir=DATA_DIR)
     print("Analysis Complete. Data saved to processed/ directory.")
 
 if __name__ == "__main__":
-    main()
-
+    parser = argparse.ArgumentParser(description="뉴스 기술-사회 영향/감성 분석")
+    parser.add_argument('--incremental', action='store_true', help="신규 기사만 분석해 기존 결과에 병합")
+    parser.add_argument('--workers', type=int, default=None, help="병렬 프로세스 수 (기본값: CPU 코어 수)")
+    parser.add_argument('--force', action='store_true', help="단계 캐시를 무시하고 다시 계산")
+    args = parser.parse_args()
+    if args.force:
+        configure_stage_cache(force=True)
+    main(incremental=args.incremental, workers=args.workers)
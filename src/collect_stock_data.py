@@ -2,10 +2,12 @@ import yfinance as yf
 import pandas as pd
 import os
 
+from src.pipeline.config import config_path
+
 # 설정
 start_date = "2016-01-01"
 end_date = "2024-12-31"
-output_dir = "/home/arkwith/SKKU/tech_forcast/data/raw"
+output_dir = config_path("data", "raw_dir")
 
 # 종목 코드 (삼성전자, SK하이닉스)
 tickers = {
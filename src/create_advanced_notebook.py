@@ -1,6 +1,8 @@
 import json
 import os
 
+from src.pipeline.config import PROJECT_ROOT
+
 # 노트북 내용 정의 (JSON 구조)
 notebook_content = {
  "cells": [
@@ -34,8 +36,7 @@ notebook_content = {
     "import seaborn as sns\n",
     "import re\n",
     "import os\n",
-    "from collections import Counter\n",
-    "from itertools import combinations\n",
+    "import sys\n",
     "from bertopic import BERTopic\n",
     "from sklearn.feature_extraction.text import CountVectorizer\n",
     "\n",
@@ -43,6 +44,12 @@ notebook_content = {
     "from openai import AzureOpenAI\n",
     "from dotenv import load_dotenv\n",
     "\n",
+    "# 프로젝트 공용 모듈 (공출현 네트워크)\n",
+    "sys.path.append(\"..\")\n",
+    "from src.features.cooccurrence import DocumentTermMatrix, cooccurrence_to_graph\n",
+    "from src.features.text import build_tokenizer\n",
+    "from src.features.token_store import tokenize_articles\n",
+    "\n",
     "# 시각화 설정\n",
     "sns.set(style=\"whitegrid\")\n",
     "plt.rcParams['font.family'] = 'sans-serif' \n",
@@ -134,14 +141,13 @@ notebook_content = {
    "outputs": [],
    "source": [
     "# 3. Semantic Network Analysis (SNA)\n",
-    "def extract_keywords_regex(text):\n",
-    "    if not isinstance(text, str): return []\n",
-    "    tech_terms = re.findall(r'\\b[A-Za-z][A-Za-z0-9]+\\b', text)\n",
-    "    korean_nouns = re.findall(r'[가-힣]{2,}', text)\n",
+    "tokenizer = build_tokenizer('korean', stopword_languages=())  # 조사/어미 제거 (예: 'HBM3E를' -> 'HBM3E')\n",
+    "\n",
+    "def extract_keywords_tokens(tokens):\n",
     "    target_keywords = set(['HBM', 'DDR', 'NAND', 'AI', '반도체', '파운드리', '수율', '투자', '양산', \n",
     "                          '엔비디아', 'TSMC', 'GAA', '이익', '적자', 'CXL', 'PIM', 'SK하이닉스', '삼성전자'])\n",
     "    found = []\n",
-    "    for word in tech_terms + korean_nouns:\n",
+    "    for word in tokens:\n",
     "        w_upper = word.upper()\n",
     "        for target in target_keywords:\n",
     "            if target in w_upper or w_upper in target:\n",
@@ -151,16 +157,10 @@ notebook_content = {
     "\n",
     "def draw_semantic_network(df, company_name, threshold=5):\n",
     "    subset = df[df['company'] == company_name].copy()\n",
-    "    subset['keywords'] = subset['processed_text'].apply(extract_keywords_regex)\n",
-    "    edge_list = []\n",
-    "    for keywords in subset['keywords']:\n",
-    "        if len(keywords) > 1:\n",
-    "            edge_list.extend(combinations(sorted(keywords), 2))\n",
-    "    edge_counts = Counter(edge_list)\n",
-    "    G = nx.Graph()\n",
-    "    for (u, v), count in edge_counts.items():\n",
-    "        if count >= threshold: G.add_edge(u, v, weight=count)\n",
-    "    return G\n",
+    "    tokens = tokenize_articles(subset['processed_text'], tokenizer)\n",
+    "    subset['keywords'] = [extract_keywords_tokens(t) for t in tokens]\n",
+    "    dtm = DocumentTermMatrix.from_keywords(subset['keywords'])\n",
+    "    return cooccurrence_to_graph(dtm.cooccurrence(), dtm.vocabulary, min_weight=threshold)\n",
     "\n",
     "G_sk = draw_semantic_network(sample_df, \"SKHynix\", threshold=20)\n",
     "G_sam = draw_semantic_network(sample_df, \"Samsung\", threshold=20)\n",
@@ -174,10 +174,24 @@ notebook_content = {
    "outputs": [],
    "source": [
     "# 4. LLM Prompt Generation\n",
-    "def generate_llm_prompt(G, company_name):\n",
+    "def load_weak_signals(company, months=12, top_n=10):\n",
+    "    \"\"\"temporal_network_analysis 가 탐지한 최근 급증/신규 키워드 (emerging_keywords.csv)\"\"\"\n",
+    "    path = os.path.join(PROCESSED_DIR, \"emerging_keywords.csv\")\n",
+    "    if not os.path.exists(path):\n",
+    "        return []\n",
+    "    emerging = pd.read_csv(path)\n",
+    "    emerging = emerging[emerging['company'] == company]\n",
+    "    if emerging.empty:\n",
+    "        return []\n",
+    "    since = str(pd.Period(emerging['period'].max(), freq='M') - (months - 1))\n",
+    "    recent = emerging[emerging['period'] >= since].sort_values('zscore', ascending=False)\n",
+    "    return recent.drop_duplicates('term')['term'].head(top_n).tolist()\n",
+    "\n",
+    "def generate_llm_prompt(G, company_name, company_key):\n",
     "    degree_dict = dict(G.degree(weight='weight'))\n",
     "    top_nodes = sorted(degree_dict.items(), key=lambda x: x[1], reverse=True)[:5]\n",
     "    top_keywords = [k[0] for k in top_nodes]\n",
+    "    weak_signals = load_weak_signals(company_key) or ['(탐지 결과 없음)']\n",
     "    \n",
     "    prompt = f\"\"\"\n",
     "    [역할]\n",
@@ -186,15 +200,16 @@ notebook_content = {
     "    [분석 데이터: {company_name}]\n",
     "    1. 핵심 연결 키워드 (Top 5): {top_keywords}\n",
     "    2. 네트워크 특징: '{top_keywords[0]}' 키워드가 중심 허브 역할을 하며 기술 생태계를 주도함.\n",
+    "    3. 최근 12개월 급증/신규 등장 키워드 (버스트 탐지): {weak_signals}\n",
     "    \n",
     "    [요청 사항]\n",
     "    1. **전략 진단:** 현재 {company_name}의 기술 전략이 '집중형'인지 '분산형'인지 진단해 주세요.\n",
     "    2. **성과 예측:** 특히 '{top_keywords[0]}' 기술이 AI 산업 트렌드와 결합하여 향후 어떤 재무적 성과를 낼지 추론해 주세요.\n",
-    "    3. **약한 신호(Weak Signal):** 네트워크 주변부에 위치했을 가능성이 있는 차세대 기술을 제안하고 그 이유를 설명해 주세요.\n",
+    "    3. **약한 신호(Weak Signal):** 급증/신규 등장 키워드 중 차세대 기술로 이어질 가능성이 높은 것을 고르고 그 이유를 설명해 주세요.\n",
     "    \"\"\"\n",
     "    return prompt\n",
     "\n",
-    "target_prompt = generate_llm_prompt(G_sk, \"SK하이닉스\")\n",
+    "target_prompt = generate_llm_prompt(G_sk, \"SK하이닉스\", \"SKHynix\")\n",
     "print(target_prompt)"
    ]
   },
@@ -271,7 +286,7 @@ notebook_content = {
 }
 
 # 파일 생성
-output_path = "/home/arkwith/SKKU/tech_forcast/notebooks/02_advanced_analysis.ipynb"
+output_path = os.path.join(PROJECT_ROOT, "notebooks", "02_advanced_analysis.ipynb")
 os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
 with open(output_path, 'w', encoding='utf-8') as f:
@@ -1,6 +1,8 @@
 import json
 import os
 
+from src.pipeline.config import PROJECT_ROOT
+
 
 def main():
     notebook_content = {
@@ -169,7 +171,7 @@ def main():
         "nbformat_minor": 4,
     }
 
-    output_path = "/home/arkwith/SKKU/tech_forcast/notebooks/03_forecasting.ipynb"
+    output_path = os.path.join(PROJECT_ROOT, "notebooks", "03_forecasting.ipynb")
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
     with open(output_path, "w", encoding="utf-8") as f:
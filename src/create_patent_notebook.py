@@ -1,6 +1,8 @@
 import json
 import os
 
+from src.pipeline.config import PROJECT_ROOT
+
 # 노트북 내용 정의 (JSON 구조)
 notebook_content = {
  "cells": [
@@ -52,22 +54,24 @@ notebook_content = {
     "    print(f\" - {os.path.basename(f)}\")\n",
     "\n",
     "# ------------------------------------------\n",
-    "# 안전한 CSV 로드 함수 (인코딩 에러 방지)\n",
+    "# CSV 로드 함수: 앞부분 표본으로 인코딩을 감지해 파일을 한 번만 읽음\n",
+    "# (감지 결과는 파일 지문별로 data/interim/encodings.json 에 캐시)\n",
     "# ------------------------------------------\n",
-    "def load_csv_safe(filepath):\n",
-    "    encodings = ['utf-8', 'cp949', 'euc-kr', 'latin1']\n",
-    "    for enc in encodings:\n",
-    "        try:\n",
-    "            df = pd.read_csv(filepath, encoding=enc)\n",
-    "            print(f\"Successfully loaded {os.path.basename(filepath)} with encoding='{enc}'\")\n",
-    "            return df\n",
-    "        except UnicodeDecodeError:\n",
-    "            continue\n",
-    "        except Exception as e:\n",
-    "            print(f\"Error reading {filepath}: {e}\")\n",
-    "            return None\n",
-    "    print(f\"Failed to load {filepath} with tested encodings.\")\n",
-    "    return None"
+    "import sys\n",
+    "sys.path.append(\"..\")\n",
+    "from src.data.loaders import ENCODING_CACHE_NAME, load_text_csv, sniff_encoding\n",
+    "\n",
+    "ENCODING_CACHE = os.path.join(\"../data/interim\", ENCODING_CACHE_NAME)\n",
+    "\n",
+    "def load_csv_safe(filepath, text_columns=()):\n",
+    "    try:\n",
+    "        df = load_text_csv(filepath, text_columns=text_columns, cache_path=ENCODING_CACHE)\n",
+    "    except (OSError, pd.errors.ParserError) as e:\n",
+    "        print(f\"Error reading {filepath}: {e}\")\n",
+    "        return None\n",
+    "    encoding = sniff_encoding(filepath, cache_path=ENCODING_CACHE)\n",
+    "    print(f\"Successfully loaded {os.path.basename(filepath)} with encoding='{encoding}'\")\n",
+    "    return df"
    ]
   },
   {
@@ -144,30 +148,26 @@ notebook_content = {
    "metadata": {},
    "outputs": [],
    "source": [
-    "code_df = load_csv_safe(os.path.join(DATA_DIR, \"HBM_Gemini_Code.csv\"))\n",
+    "from src.data.loaders import load_patent_corpus\n",
+    "from src.features.cpc import CPCIndex, cpc_counts, cpc_growth\n",
     "\n",
-    "if code_df is not None:\n",
-    "    # 데이터 구조 확인 (컬럼명)\n",
-    "    print(\"Columns:\", code_df.columns.tolist())\n",
-    "    \n",
-    "    # 'code'나 'ipc', 'cpc' 등의 컬럼을 찾아 빈도수 시각화\n",
-    "    # (CSV 구조에 따라 수정 필요 가능성 있음, 여기선 첫 번째 컬럼을 코드로 가정)\n",
-    "    target_col = code_df.columns[0] # 가령 'Code' or 'IPC'\n",
-    "    count_col = code_df.columns[1] if len(code_df.columns) > 1 else None\n",
-    "    \n",
-    "    if count_col:\n",
-    "        top_codes = code_df.sort_values(count_col, ascending=False).head(10)\n",
-    "        plt.figure(figsize=(12, 6))\n",
-    "        sns.barplot(data=top_codes, x=count_col, y=target_col, palette='Blues_r')\n",
-    "        plt.title(f\"Top 10 Technology Codes ({target_col})\", fontsize=15)\n",
-    "        plt.show()\n",
-    "    else:\n",
-    "        # 카운트 컬럼이 없으면 직접 카운트\n",
-    "        top_codes = code_df[target_col].value_counts().head(10)\n",
-    "        plt.figure(figsize=(12, 6))\n",
-    "        sns.barplot(x=top_codes.values, y=top_codes.index, palette='Blues_r')\n",
-    "        plt.title(f\"Top 10 Technology Codes ({target_col})\", fontsize=15)\n",
-    "        plt.show()"
+    "# HBM_Gemini_Code.csv 는 추출용 SQL 이므로, 정규화된 출원×CPC 표(data/interim/patents)에서 직접 집계\n",
+    "patents = load_patent_corpus(raw_dir=\"../data/raw\", tables=[\"applications\", \"cpc\", \"cpc_symbols\"])\n",
+    "cpc_index = CPCIndex.from_corpus(patents)\n",
+    "cpc = patents.cpc_frame()\n",
+    "\n",
+    "# 메인그룹별 고유 출원 수 상위 10개\n",
+    "group_counts = cpc_counts(cpc, cpc_index, level=\"group\")\n",
+    "top_groups = group_counts.sum().nlargest(10)\n",
+    "plt.figure(figsize=(12, 6))\n",
+    "sns.barplot(x=top_groups.values, y=top_groups.index, palette='Blues_r')\n",
+    "plt.title(\"Top 10 CPC Main Groups (applications)\", fontsize=15)\n",
+    "plt.show()\n",
+    "\n",
+    "# 메모리 회로(G11C) 하위 서브그룹의 최근 연도 전년 대비 증가율\n",
+    "subgroup_counts = cpc_counts(cpc, cpc_index, level=\"subgroup\", prefix=\"G11C\")\n",
+    "growth = cpc_growth(subgroup_counts)\n",
+    "print(growth.iloc[-1].dropna().sort_values(ascending=False).head(10))"
    ]
   },
   {
@@ -213,29 +213,22 @@ notebook_content = {
    "metadata": {},
    "outputs": [],
    "source": [
-    "abstract_df = load_csv_safe(os.path.join(DATA_DIR, \"HBM_Gemini_With_Abstract.csv\"))\n",
+    "from src.data.loaders import load_patent_corpus\n",
+    "\n",
+    "# 초록은 공보 행마다 반복되므로 출원당 1개로 정규화된 테이블(data/interim/patents)을 사용\n",
+    "patents = load_patent_corpus(raw_dir=\"../data/raw\", tables=[\"abstracts\"])\n",
+    "print(f\"Abstracts: {len(patents.abstracts):,} applications\")\n",
     "\n",
-    "if abstract_df is not None:\n",
-    "    # 'Abstract' 컬럼이 있는지 확인, 없으면 비슷한 이름 찾기\n",
-    "    abs_col = None\n",
-    "    for col in abstract_df.columns:\n",
-    "        if 'abstract' in col.lower():\n",
-    "            abs_col = col\n",
-    "            break\n",
-    "            \n",
-    "    if abs_col:\n",
-    "        text = \" \".join(abstract_df[abs_col].fillna('').astype(str))\n",
-    "        try:\n",
-    "            wordcloud = WordCloud(width=800, height=400, background_color='white', colormap='magma').generate(text)\n",
-    "            plt.figure(figsize=(12, 6))\n",
-    "            plt.imshow(wordcloud, interpolation='bilinear')\n",
-    "            plt.axis('off')\n",
-    "            plt.title(\"HBM Patent Abstract Word Cloud\", fontsize=15)\n",
-    "            plt.show()\n",
-    "        except ImportError:\n",
-    "            print(\"WordCloud library not installed.\")\n",
-    "    else:\n",
-    "        print(\"Abstract column not found.\")"
+    "text = \" \".join(patents.abstracts[\"abstract\"])\n",
+    "try:\n",
+    "    wordcloud = WordCloud(width=800, height=400, background_color='white', colormap='magma').generate(text)\n",
+    "    plt.figure(figsize=(12, 6))\n",
+    "    plt.imshow(wordcloud, interpolation='bilinear')\n",
+    "    plt.axis('off')\n",
+    "    plt.title(\"HBM Patent Abstract Word Cloud\", fontsize=15)\n",
+    "    plt.show()\n",
+    "except ImportError:\n",
+    "    print(\"WordCloud library not installed.\")"
    ]
   }
  ],
@@ -263,7 +256,7 @@ notebook_content = {
 }
 
 # 파일 생성
-output_path = "/home/arkwith/SKKU/tech_forcast/notebooks/04_patent_analysis.ipynb"
+output_path = os.path.join(PROJECT_ROOT, "notebooks", "04_patent_analysis.ipynb")
 os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
 with open(output_path, 'w', encoding='utf-8') as f:
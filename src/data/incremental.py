@@ -0,0 +1,164 @@
+"""뉴스 코퍼스 증분 처리 유틸리티.
+
+각 분석(consumer)은 마지막으로 처리한 코퍼스 세대(generation)와 배치(batch)를
+상태 파일에 기록합니다. 다음 실행에서는 그 이후 배치의 기사만 읽어 처리하고,
+기사 단위로 합산 가능한 집계 결과(빈도, 공출현 횟수 등)는 기존 결과에 더해 병합합니다.
+코퍼스가 새 세대로 재생성되면 전체를 다시 처리합니다.
+"""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Sequence, Union
+
+import pandas as pd
+
+from .loaders import default_corpus_dir, load_news_corpus, update_news_corpus
+
+
+@dataclass
+class IncrementalRun:
+    """한 번의 증분 실행에서 처리할 기사와 상태 정보."""
+
+    articles: pd.DataFrame
+    full: bool
+    state_path: Path
+    generation: str
+    batch: int
+
+    def commit(self) -> None:
+        """처리가 끝난 뒤 호출해 다음 실행의 시작 지점을 기록합니다."""
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.state_path, "w", encoding="utf-8") as f:
+            json.dump({"generation": self.generation, "batch": self.batch}, f, indent=2)
+
+
+def start_incremental_run(
+    name: str,
+    state_dir: Union[str, Path],
+    raw_dir: Union[str, Path] = "data/raw",
+    corpus_dir: Optional[Union[str, Path]] = None,
+    columns: Optional[Sequence[str]] = None,
+    years: Optional[Iterable[int]] = None,
+    incremental: bool = True,
+    outputs: Sequence[Union[str, Path]] = (),
+) -> IncrementalRun:
+    """코퍼스를 갱신하고, consumer(name)가 아직 처리하지 않은 기사를 반환합니다.
+
+    incremental=False 이거나 이전 상태가 없거나 코퍼스 세대가 바뀐 경우, 또는 증분을
+    병합할 누적 결과 파일(outputs) 중 하나라도 없는 경우(예: 상태 파일보다 나중에 추가된 표)에는
+    전체 기사를 반환하며 `full` 이 True 가 됩니다.
+    """
+    corpus_dir = Path(corpus_dir) if corpus_dir else default_corpus_dir(raw_dir)
+    manifest = update_news_corpus(raw_dir, corpus_dir)
+    state_path = _state_path(state_dir, name)
+
+    state = None
+    if incremental and state_path.exists() and all(Path(path).exists() for path in outputs):
+        with open(state_path, encoding="utf-8") as f:
+            state = json.load(f)
+    full = state is None or state.get("generation") != manifest["generation"]
+    min_batch = None if full else state["batch"] + 1
+
+    articles = load_news_corpus(raw_dir, corpus_dir, columns=columns, years=years,
+                                min_batch=min_batch, refresh=False)
+    return IncrementalRun(
+        articles=articles,
+        full=full,
+        state_path=state_path,
+        generation=manifest["generation"],
+        batch=manifest["batch"],
+    )
+
+
+def _state_path(state_dir: Union[str, Path], name: str) -> Path:
+    return Path(state_dir) / f"_incremental_{name}.json"
+
+
+def commit_full_run(
+    name: str,
+    state_dir: Union[str, Path],
+    raw_dir: Union[str, Path] = "data/raw",
+    corpus_dir: Optional[Union[str, Path]] = None,
+) -> None:
+    """전체 기사 결과를 기사 로딩 없이 얻었을 때(예: 단계 캐시 적중) consumer(name)의 상태를 기록합니다.
+
+    결과가 현재 원본 CSV 기준이라는 전제로 최신 코퍼스 세대/배치를 저장하므로,
+    다음 증분 실행은 그 이후에 추가된 기사만 처리합니다.
+    """
+    corpus_dir = Path(corpus_dir) if corpus_dir else default_corpus_dir(raw_dir)
+    manifest = update_news_corpus(raw_dir, corpus_dir)
+    IncrementalRun(
+        articles=pd.DataFrame(),
+        full=True,
+        state_path=_state_path(state_dir, name),
+        generation=manifest["generation"],
+        batch=manifest["batch"],
+    ).commit()
+
+
+def merge_additive(
+    stored: Optional[pd.DataFrame], delta: pd.DataFrame, keys: Sequence[str]
+) -> pd.DataFrame:
+    """키 기준으로 두 집계 표의 수치 컬럼을 더합니다. 한쪽에만 있는 값은 0으로 간주합니다."""
+    if stored is None or stored.empty:
+        return delta.reset_index(drop=True)
+    if delta.empty:
+        return stored.reset_index(drop=True)
+    merged = pd.concat([stored, delta], ignore_index=True)
+    value_cols = [c for c in merged.columns if c not in keys]
+    merged[value_cols] = merged[value_cols].fillna(0)
+    merged = merged.groupby(list(keys), sort=True, observed=True, as_index=False)[value_cols].sum()
+    return merged
+
+
+def aggregate_chunks(
+    chunks: Iterable[pd.DataFrame],
+    aggregate: Callable[[pd.DataFrame], pd.DataFrame],
+    keys: Sequence[str],
+    finalize: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+) -> pd.DataFrame:
+    """청크(예: `iter_articles` 결과)마다 집계한 결과를 키 기준으로 합산합니다.
+
+    aggregate 는 기사 단위로 합산 가능한 집계(빈도, 공출현 횟수 등)여야 하며,
+    메모리에는 한 청크와 누적 집계 결과만 유지됩니다.
+    """
+    result = None
+    for chunk in chunks:
+        result = merge_additive(result, aggregate(chunk), keys)
+    if result is None:
+        return pd.DataFrame(columns=list(keys))
+    if finalize is not None and len(result):
+        result = finalize(result)
+    return result
+
+
+def update_aggregate_table(
+    path: Union[str, Path],
+    delta: pd.DataFrame,
+    keys: Sequence[str],
+    full: bool,
+    finalize: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+) -> pd.DataFrame:
+    """저장된 집계 결과(CSV 또는 Parquet)에 증분을 합산해 저장하고 병합 결과를 반환합니다.
+
+    full=True 이면 기존 파일을 무시하고 delta 를 그대로 저장합니다.
+    finalize 는 합산 후 비율 지표처럼 합산할 수 없는 컬럼을 다시 계산할 때 사용합니다.
+    """
+    path = Path(path)
+    parquet = path.suffix == ".parquet"
+    stored = None
+    if not full and path.exists():
+        stored = pd.read_parquet(path) if parquet else pd.read_csv(path)
+        for key in keys:
+            if key in delta.columns and len(delta):
+                stored[key] = stored[key].astype(delta[key].dtype)
+    merged = delta if full else merge_additive(stored, delta, keys)
+    if finalize is not None and len(merged):
+        merged = finalize(merged)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if parquet:
+        merged.to_parquet(path, index=False)
+    else:
+        merged.to_csv(path, index=False)
+    return merged
@@ -1,22 +1,844 @@
 """데이터 로딩 관련 유틸리티 모듈."""
 
+import codecs
+import hashlib
+import io
+import json
+import re
+import shutil
+import uuid
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Union
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from pandas.api.types import union_categoricals
 
 
-def load_csv(path: Union[str, Path], **read_kwargs) -> pd.DataFrame:
-    """CSV 파일을 DataFrame으로 로드합니다."""
+def load_csv(
+    path: Union[str, Path], chunksize: Optional[int] = None, **read_kwargs
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+    """CSV 파일을 DataFrame으로 로드합니다.
+
+    chunksize 를 지정하면 chunksize 행씩 DataFrame 을 반환하는 반복자를 돌려주므로,
+    메모리보다 큰 파일도 최대 메모리 사용량을 청크 크기로 제한해 처리할 수 있습니다.
+    """
     path = Path(path)
     if not path.exists():
         raise FileNotFoundError(f"CSV 파일을 찾을 수 없습니다: {path}")
+    if chunksize is not None:
+        return _iter_csv_chunks(path, chunksize, read_kwargs)
     return pd.read_csv(path, **read_kwargs)
 
 
+def _iter_csv_chunks(path: Path, chunksize: int, read_kwargs: dict) -> Iterator[pd.DataFrame]:
+    with pd.read_csv(path, chunksize=chunksize, **read_kwargs) as reader:
+        yield from reader
+
+
 def list_patent_files(directory: Union[str, Path], suffix: str = ".xml"):
     """특허 XML/JSON 파일 목록을 반환합니다."""
     directory = Path(directory)
     if not directory.exists():
         return []
     return sorted(directory.glob(f"*{suffix}"))
+
+
+# ---------------------------------------------------------------------------
+# 뉴스 코퍼스 (Parquet 캐시)
+# ---------------------------------------------------------------------------
+
+# 기업명 -> (원본 CSV 파일명, 날짜 형식)
+NEWS_SOURCES: Dict[str, Tuple[str, str]] = {
+    "Samsung": ("samsung_news.csv", "%Y.%m.%d"),
+    "SKHynix": ("skhynix_news.csv", "%Y-%m-%d"),
+}
+
+NEWS_CORPUS_COLUMNS = ["article_id", "batch", "date", "company", "year", "title", "content", "text"]
+
+# 원본 뉴스 CSV에서 읽는 컬럼과 타입 (나머지 컬럼은 읽지 않음)
+NEWS_CSV_DTYPES = {"date": str, "title": str, "content": str}
+NEWS_CHUNKSIZE = 50_000
+
+_HTML_TAG = re.compile(r"<[^>]+>")
+_WHITESPACE = re.compile(r"\s+")
+_MANIFEST_NAME = "_manifest.json"
+# 워터마크 직전 구간의 해시로 원본 CSV가 추가(append)만 되었는지 확인합니다.
+_TAIL_HASH_BYTES = 1 << 20
+
+
+def default_corpus_dir(raw_dir: Union[str, Path]) -> Path:
+    """원본 디렉토리(data/raw)와 같은 수준의 data/interim/news_corpus 경로를 반환합니다."""
+    return Path(raw_dir).parent / "interim" / "news_corpus"
+
+
+def clean_news_text(text: str) -> str:
+    """HTML 태그를 제거하고 공백을 정규화합니다."""
+    text = _HTML_TAG.sub("", str(text))
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def _parse_dates(values: pd.Series, date_format: str) -> pd.Series:
+    """지정한 형식으로 날짜를 파싱하고, 실패한 값만 형식 추론으로 재시도합니다."""
+    dates = pd.to_datetime(values, format=date_format, errors="coerce")
+    missing = dates.isna() & values.notna()
+    if missing.any():
+        dates[missing] = pd.to_datetime(values[missing], format="mixed", errors="coerce")
+    return dates
+
+
+def article_ids(df: pd.DataFrame) -> np.ndarray:
+    """기업/날짜/제목/본문의 내용 해시로 기사 식별자(int64)를 계산합니다."""
+    keys = (
+        df["company"].astype(str) + "\x1f" + df["date"].astype(str) + "\x1f"
+        + df["title"].fillna("").astype(str) + "\x1f" + df["content"].fillna("").astype(str)
+    )
+    return np.fromiter(
+        (int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little", signed=True)
+         for key in keys),
+        dtype=np.int64,
+        count=len(keys),
+    )
+
+
+def _normalize_news(df: pd.DataFrame, company: str, date_format: str) -> pd.DataFrame:
+    """원본 뉴스 행을 코퍼스 스키마(NEWS_CORPUS_COLUMNS)로 정규화합니다."""
+    df = df.copy()
+    df["date"] = _parse_dates(df["date"], date_format)
+    df = df.dropna(subset=["date"])
+    df["company"] = pd.Categorical([company] * len(df), categories=list(NEWS_SOURCES))
+    df["year"] = df["date"].dt.year.astype("int16")
+    df["text"] = (df["title"].fillna("") + " " + df["content"].fillna("")).map(clean_news_text)
+    df["article_id"] = article_ids(df)
+    df["batch"] = np.int32(0)
+    return df[NEWS_CORPUS_COLUMNS]
+
+
+def news_source_paths(raw_dir: Union[str, Path]) -> List[Path]:
+    """기업별 원본 뉴스 CSV 경로 목록 (코퍼스의 입력 파일)."""
+    return [Path(raw_dir) / filename for filename, _ in NEWS_SOURCES.values()]
+
+
+def read_news_csv(raw_dir: Union[str, Path], company: str) -> pd.DataFrame:
+    """기업별 원본 뉴스 CSV 전체를 코퍼스 스키마로 읽습니다."""
+    filename, date_format = NEWS_SOURCES[company]
+    df = load_csv(Path(raw_dir) / filename, usecols=list(NEWS_CSV_DTYPES), dtype=NEWS_CSV_DTYPES)
+    return _normalize_news(df, company, date_format)
+
+
+def iter_articles(
+    raw_dir: Union[str, Path] = "data/raw",
+    companies: Optional[Iterable[str]] = None,
+    columns: Optional[Sequence[str]] = None,
+    years: Optional[Iterable[int]] = None,
+    chunksize: int = NEWS_CHUNKSIZE,
+) -> Iterator[pd.DataFrame]:
+    """원본 뉴스 CSV를 청크 단위로 정규화해 반환하는 제너레이터.
+
+    각 청크는 코퍼스 스키마(NEWS_CORPUS_COLUMNS 중 columns)를 따르며 `company` 는
+    모든 청크에서 같은 범주를 갖는 category 타입입니다. 청크별로 키워드 빈도/감성/공출현을
+    계산하고 합산하면 최대 메모리 사용량이 파일 크기가 아닌 청크 크기에 비례합니다.
+    """
+    raw_dir = Path(raw_dir)
+    companies = list(NEWS_SOURCES) if companies is None else list(companies)
+    columns = list(columns) if columns is not None else NEWS_CORPUS_COLUMNS
+    years = None if years is None else {int(y) for y in years}
+    for company in companies:
+        filename, date_format = NEWS_SOURCES[company]
+        chunks = load_csv(raw_dir / filename, chunksize=chunksize,
+                          usecols=list(NEWS_CSV_DTYPES), dtype=NEWS_CSV_DTYPES)
+        for chunk in chunks:
+            frame = _normalize_news(chunk, company, date_format)
+            if years is not None:
+                frame = frame[frame["year"].isin(years)]
+            if len(frame):
+                yield frame[columns].reset_index(drop=True)
+
+
+def _tail_hash(path: Path, offset: int) -> str:
+    """파일의 offset 직전 구간(_TAIL_HASH_BYTES) 해시."""
+    start = max(0, offset - _TAIL_HASH_BYTES)
+    with open(path, "rb") as f:
+        f.seek(start)
+        return hashlib.blake2b(f.read(offset - start), digest_size=16).hexdigest()
+
+
+def _read_csv_from(path: Path, offset: int) -> pd.DataFrame:
+    """CSV 헤더와 offset 이후에 추가된 행만 읽습니다."""
+    with open(path, "rb") as f:
+        header = f.readline()
+        f.seek(offset)
+        appended = f.read()
+    return pd.read_csv(io.BytesIO(header + appended), usecols=list(NEWS_CSV_DTYPES), dtype=NEWS_CSV_DTYPES)
+
+
+def _watermark(path: Path, max_date, rows: int) -> dict:
+    size = path.stat().st_size
+    return {
+        "offset": size,
+        "mtime_ns": path.stat().st_mtime_ns,
+        "tail_hash": _tail_hash(path, size),
+        "rows": rows,
+        "max_date": None if max_date is None or pd.isna(max_date) else str(max_date),
+    }
+
+
+def _read_manifest(corpus_dir: Path) -> Optional[dict]:
+    manifest_path = corpus_dir / _MANIFEST_NAME
+    if not manifest_path.exists():
+        return None
+    with open(manifest_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_manifest(corpus_dir: Path, manifest: dict) -> None:
+    with open(corpus_dir / _MANIFEST_NAME, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+
+def _write_partitions(df: pd.DataFrame, corpus_dir: Path, batch: int, part: str = "") -> None:
+    df = df.assign(batch=np.int32(batch), company=df["company"].astype(str))
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pq.write_to_dataset(
+        table,
+        root_path=str(corpus_dir),
+        partition_cols=["company", "year"],
+        basename_template=f"batch{batch:05d}{part}-{{i}}.parquet",
+    )
+
+
+def build_news_corpus(
+    raw_dir: Union[str, Path] = "data/raw",
+    corpus_dir: Optional[Union[str, Path]] = None,
+    chunksize: int = NEWS_CHUNKSIZE,
+) -> dict:
+    """원본 뉴스 CSV 전체를 기업/연도로 파티셔닝된 Parquet 코퍼스로 새로 생성합니다.
+
+    원본은 청크 단위로 읽어 기록하므로 메모리보다 큰 CSV도 처리할 수 있습니다.
+    새 세대(generation) 식별자를 발급하고 원본별 워터마크를 기록한 manifest 를 반환합니다.
+    """
+    raw_dir = Path(raw_dir)
+    corpus_dir = Path(corpus_dir) if corpus_dir else default_corpus_dir(raw_dir)
+    sources = {company: filename for company, (filename, _) in NEWS_SOURCES.items()
+               if (raw_dir / filename).exists()}
+    if not sources:
+        raise FileNotFoundError(f"뉴스 CSV 파일을 찾을 수 없습니다: {raw_dir}")
+
+    # 임시 디렉토리에 기록한 뒤 교체해, 실패 시에도 기존 코퍼스를 보존
+    tmp_dir = corpus_dir.with_name(corpus_dir.name + ".tmp")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir(parents=True)
+
+    seen_ids = set()
+    watermarks = {}
+    total_rows = 0
+    for company, filename in sources.items():
+        _, date_format = NEWS_SOURCES[company]
+        raw_rows = 0
+        max_date = None
+        chunks = load_csv(raw_dir / filename, chunksize=chunksize,
+                          usecols=list(NEWS_CSV_DTYPES), dtype=NEWS_CSV_DTYPES)
+        for part, raw in enumerate(chunks):
+            raw_rows += len(raw)
+            chunk = _normalize_news(raw, company, date_format)
+            chunk = chunk[~chunk["article_id"].duplicated() & ~chunk["article_id"].isin(seen_ids)]
+            if not len(chunk):
+                continue
+            seen_ids.update(chunk["article_id"].tolist())
+            chunk_max = chunk["date"].max()
+            max_date = chunk_max if max_date is None else max(max_date, chunk_max)
+            _write_partitions(chunk, tmp_dir, batch=0, part=f"{company}{part:05d}")
+            total_rows += len(chunk)
+        watermarks[filename] = _watermark(raw_dir / filename, max_date, raw_rows)
+
+    manifest = {
+        "generation": uuid.uuid4().hex,
+        "batch": 0,
+        "rows": total_rows,
+        "watermarks": watermarks,
+    }
+    _write_manifest(tmp_dir, manifest)
+    shutil.rmtree(corpus_dir, ignore_errors=True)
+    tmp_dir.rename(corpus_dir)
+    return manifest
+
+
+def update_news_corpus(
+    raw_dir: Union[str, Path] = "data/raw",
+    corpus_dir: Optional[Union[str, Path]] = None,
+    force: bool = False,
+) -> dict:
+    """원본 CSV에 추가된 기사만 코퍼스에 새 배치(batch)로 반영하고 manifest 를 반환합니다.
+
+    원본별 워터마크(바이트 오프셋, 행 수, 최대 날짜, 직전 구간 해시)와 비교해
+    - 변경 없음: 아무것도 읽지 않음
+    - 뒤에 행이 추가됨: 추가 구간만 읽고, 이미 있는 기사(내용 해시 동일)는 제외
+    - 기존 구간이 수정/삭제됨: 코퍼스를 새 세대로 재생성 (force=True 도 동일)
+    """
+    raw_dir = Path(raw_dir)
+    corpus_dir = Path(corpus_dir) if corpus_dir else default_corpus_dir(raw_dir)
+    manifest = None if force else _read_manifest(corpus_dir)
+    if manifest is None or "watermarks" not in manifest:
+        return build_news_corpus(raw_dir, corpus_dir)
+
+    watermarks = dict(manifest["watermarks"])
+    frames = []
+    for company, (filename, date_format) in NEWS_SOURCES.items():
+        path = raw_dir / filename
+        mark = watermarks.get(filename)
+        if not path.exists():
+            if mark is not None:
+                return build_news_corpus(raw_dir, corpus_dir)
+            continue
+        stat = path.stat()
+        if mark is not None and stat.st_size == mark["offset"] and stat.st_mtime_ns == mark["mtime_ns"]:
+            continue
+        if mark is None:
+            raw = load_csv(path, usecols=list(NEWS_CSV_DTYPES), dtype=NEWS_CSV_DTYPES)
+            rows = 0
+        elif stat.st_size < mark["offset"] or _tail_hash(path, mark["offset"]) != mark["tail_hash"]:
+            return build_news_corpus(raw_dir, corpus_dir)
+        else:
+            raw = _read_csv_from(path, mark["offset"])
+            rows = mark["rows"]
+        delta = _normalize_news(raw, company, date_format)
+        new_mark = _watermark(path, delta["date"].max() if len(delta) else None, rows + len(raw))
+        if mark is not None and mark.get("max_date") and new_mark["max_date"]:
+            new_mark["max_date"] = max(mark["max_date"], new_mark["max_date"])
+        watermarks[filename] = new_mark
+        frames.append(delta)
+
+    if not frames:  # 변경 없음: manifest 도 그대로 두어 수정 시각으로 최신 여부를 판단할 수 있게 함
+        return manifest
+    delta = pd.concat(frames, ignore_index=True).drop_duplicates("article_id")
+    existing = ds.dataset(str(corpus_dir), format="parquet", partitioning="hive")
+    known = existing.to_table(columns=["article_id"]).column("article_id").to_numpy()
+    delta = delta[~delta["article_id"].isin(known)].sort_values("date", kind="stable")
+    if len(delta):
+        manifest["batch"] += 1
+        manifest["rows"] += len(delta)
+        _write_partitions(delta, corpus_dir, batch=manifest["batch"])
+    manifest["watermarks"] = watermarks
+    _write_manifest(corpus_dir, manifest)
+    return manifest
+
+
+def load_news_corpus(
+    raw_dir: Union[str, Path] = "data/raw",
+    corpus_dir: Optional[Union[str, Path]] = None,
+    columns: Optional[Sequence[str]] = None,
+    companies: Optional[Iterable[str]] = None,
+    years: Optional[Iterable[int]] = None,
+    min_batch: Optional[int] = None,
+    refresh: bool = True,
+) -> pd.DataFrame:
+    """Parquet 뉴스 코퍼스를 로드합니다. refresh=True 이면 원본 변경분을 먼저 반영합니다.
+
+    columns 로 읽을 컬럼을, companies/years 로 읽을 파티션을 제한하고,
+    min_batch 를 지정하면 해당 배치 이후에 추가된 기사만 읽습니다.
+    반환되는 `company` 는 category, `date` 는 datetime64 타입이며 날짜순으로 정렬됩니다.
+    """
+    raw_dir = Path(raw_dir)
+    corpus_dir = Path(corpus_dir) if corpus_dir else default_corpus_dir(raw_dir)
+    if refresh:
+        update_news_corpus(raw_dir, corpus_dir)
+    dataset = ds.dataset(str(corpus_dir), format="parquet", partitioning="hive")
+
+    filters = []
+    if companies is not None:
+        filters.append(ds.field("company").isin(list(companies)))
+    if years is not None:
+        filters.append(ds.field("year").isin([int(y) for y in years]))
+    if min_batch is not None:
+        filters.append(ds.field("batch") >= min_batch)
+    expression = None
+    for flt in filters:
+        expression = flt if expression is None else expression & flt
+
+    columns = list(columns) if columns is not None else NEWS_CORPUS_COLUMNS
+    if "date" not in columns:
+        columns = columns + ["date"]
+    df = dataset.to_table(columns=columns, filter=expression).to_pandas()
+    df = df.sort_values("date", kind="stable").reset_index(drop=True)
+    if "company" in df.columns:
+        df["company"] = df["company"].astype("category")
+    if "year" in df.columns:
+        df["year"] = df["year"].astype("int16")
+    return df
+
+
+# ---------------------------------------------------------------------------
+# 인코딩 감지 (접두 표본 기반) 및 행 단위 복구
+# ---------------------------------------------------------------------------
+
+# BOM 이 없을 때 표본 디코딩을 시도할 인코딩 (UTF-8 우선, cp949 는 euc-kr 의 상위 집합)
+SNIFF_ENCODINGS = ("utf-8", "cp949")
+SNIFF_BYTES = 256 * 1024
+ENCODING_CACHE_NAME = "encodings.json"
+ENCODING_STATUSES = ("ok", "repaired", "garbled")
+_BOMS = ((b"\xef\xbb\xbf", "utf-8-sig"), (b"\xff\xfe", "utf-16"), (b"\xfe\xff", "utf-16"))
+# 레거시 인코딩 바이트열은 유효한 UTF-8 다중 바이트 문자를 거의 만들지 않으므로, 비ASCII 바이트의
+# 절반 이상이 UTF-8 로 읽히면 일부 행만 손상된 UTF-8 파일로 봅니다. 레거시 인코딩은 오류 비율이
+# _MAX_ERROR_RATIO 미만일 때만 사용하고, 아니면 모든 바이트를 읽을 수 있는 latin1 로 대체합니다.
+_MAX_UTF8_ERROR_RATIO = 0.5
+_MAX_ERROR_RATIO = 0.05
+_FINGERPRINT_BYTES = 64 * 1024
+# 디코딩할 수 없는 바이트 b 를 사용자 정의 영역 문자 U+F700+b 로 보존하는 오류 처리기.
+# surrogateescape 와 달리 UTF-8 로 다시 인코딩할 수 있어 pandas 파서를 그대로 통과합니다.
+_ESCAPE_ERRORS = "loaders-byte-escape"
+_ESCAPE_BASE = 0xF700
+_ESCAPED_RUN = re.compile("([\uf700-\uf7ff]+)")
+# 복구 대상 셀: 보존된 바이트, 대체 문자(U+FFFD), UTF-8 을 latin1/cp1252 로 읽은 흔적 (예: 'Ã©')
+_SUSPECT_TEXT = re.compile("[\uf700-\uf7ff\ufffd]|[\xc2-\xf4][^\x00-\x7f]")
+
+
+def _escape_undecodable(error: UnicodeDecodeError) -> Tuple[str, int]:
+    escaped = "".join(chr(_ESCAPE_BASE + b) for b in error.object[error.start:error.end])
+    return escaped, error.end
+
+
+codecs.register_error(_ESCAPE_ERRORS, _escape_undecodable)
+_encoding_caches: Dict[Optional[Path], Dict[str, str]] = {}
+
+
+def file_fingerprint(path: Union[str, Path]) -> str:
+    """파일 크기와 앞/뒤 64KB 의 해시로 만든 내용 지문 (경로·수정 시각과 무관)."""
+    path = Path(path)
+    size = path.stat().st_size
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        digest.update(f.read(_FINGERPRINT_BYTES))
+        if size > _FINGERPRINT_BYTES:
+            f.seek(max(_FINGERPRINT_BYTES, size - _FINGERPRINT_BYTES))
+            digest.update(f.read())
+    return f"{size}-{digest.hexdigest()}"
+
+
+def _decode_errors(sample: bytes, encoding: str) -> int:
+    """sample 을 encoding 으로 디코딩할 때 대체되는 바이트 수."""
+    text = sample.decode(encoding, errors=_ESCAPE_ERRORS)
+    return sum(len(run) for run in _ESCAPED_RUN.findall(text))
+
+
+def _sniff_sample(sample: bytes, complete: bool) -> str:
+    for bom, encoding in _BOMS:
+        if sample.startswith(bom):
+            return encoding
+    if not complete:  # 표본 끝에서 잘린 멀티바이트 문자를 오류로 세지 않도록 마지막 줄 이전까지만 사용
+        sample = sample[:sample.rfind(b"\n") + 1] or sample
+    non_ascii = sum(1 for b in sample if b >= 0x80)
+    if not non_ascii:
+        return SNIFF_ENCODINGS[0]
+    if _decode_errors(sample, "utf-8") < non_ascii * _MAX_UTF8_ERROR_RATIO:
+        return "utf-8"
+    errors = {encoding: _decode_errors(sample, encoding) for encoding in SNIFF_ENCODINGS[1:]}
+    best = min(errors, key=errors.get)
+    return best if errors[best] < non_ascii * _MAX_ERROR_RATIO else "latin1"
+
+
+def _load_encoding_cache(cache_path: Optional[Path]) -> Dict[str, str]:
+    """cache_path 별 인코딩 캐시 (파일은 처음 요청될 때 한 번만 읽음, None 은 메모리 전용)."""
+    if cache_path is not None:
+        cache_path = cache_path.resolve()
+    if cache_path not in _encoding_caches:
+        cache: Dict[str, str] = {}
+        if cache_path is not None and cache_path.exists():
+            with open(cache_path, encoding="utf-8") as f:
+                cache.update(json.load(f))
+        _encoding_caches[cache_path] = cache
+    return _encoding_caches[cache_path]
+
+
+def sniff_encoding(
+    path: Union[str, Path],
+    sample_bytes: int = SNIFF_BYTES,
+    cache_path: Optional[Union[str, Path]] = None,
+) -> str:
+    """파일 앞부분 sample_bytes 만 읽어 인코딩을 추정합니다.
+
+    BOM 이 있으면 그 인코딩을, 없으면 UTF-8 디코딩을 먼저 시도하고 대부분 읽히지 않으면
+    나머지 SNIFF_ENCODINGS 중 디코딩 오류가 가장 적은 인코딩을 반환합니다. 결과는 cache_path 별로 나눠 파일 지문 단위로 메모리와 cache_path(JSON)에 저장해 다시 감지하지 않습니다.
+    """
+    path = Path(path)
+    cache_path = Path(cache_path) if cache_path is not None else None
+    cache = _load_encoding_cache(cache_path)
+    key = file_fingerprint(path)
+    if key in cache:
+        return cache[key]
+    with open(path, "rb") as f:
+        sample = f.read(sample_bytes + 1)
+    encoding = _sniff_sample(sample[:sample_bytes], complete=len(sample) <= sample_bytes)
+    cache[key] = encoding
+    if cache_path is not None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2)
+    return encoding
+
+
+def _raw_bytes(text: str, encoding: str) -> bytes:
+    """보존된 바이트(U+F7xx)를 원래 바이트로 되돌려 셀의 원본 바이트열을 재구성합니다."""
+    parts = _ESCAPED_RUN.split(text)
+    return b"".join(
+        bytes(ord(c) - _ESCAPE_BASE for c in part) if i % 2 else part.encode(encoding, errors="replace")
+        for i, part in enumerate(parts)
+    )
+
+
+def _plausible(text: str, encoding: str) -> bool:
+    """다른 인코딩으로 디코딩한 결과가 그럴듯한지 판단합니다.
+
+    UTF-8 은 엄격한 디코딩 성공 자체가 충분한 근거입니다. cp949 는 거의 모든 바이트 쌍을 읽어 내므로
+    KS X 1001(euc-kr) 범위 안이고 비ASCII 문자의 90% 이상이 한글인 경우만 인정합니다
+    (UTF-8 한자/중국어 바이트열을 cp949 로 읽으면 한자·기호가 섞인 무의미한 음절이 됨).
+    """
+    if encoding == "utf-8":
+        return True
+    try:
+        text.encode("euc_kr")
+    except UnicodeEncodeError:
+        return False
+    non_ascii = [c for c in text if ord(c) >= 0x80]
+    hangul = sum(1 for c in non_ascii if "가" <= c <= "힣" or "ㄱ" <= c <= "ㆎ")
+    return bool(non_ascii) and hangul >= 0.9 * len(non_ascii)
+
+
+def _repair_cell(text: str, encoding: str) -> Tuple[str, str]:
+    if _ESCAPED_RUN.search(text):
+        raw = _raw_bytes(text, encoding)
+        for candidate in SNIFF_ENCODINGS:
+            if candidate == encoding.replace("-sig", ""):
+                continue
+            try:
+                fixed = raw.decode(candidate)
+            except UnicodeDecodeError:
+                continue
+            if _plausible(fixed, candidate):
+                return fixed, "repaired"
+        return _ESCAPED_RUN.sub(lambda m: "\ufffd", text), "garbled"
+    if "\ufffd" in text:
+        return text, "garbled"
+    # UTF-8 바이트를 latin1/cp1252 로 읽은 경우 (예: 'Ã©' -> 'é')
+    for single_byte in ("cp1252", "latin1"):
+        try:
+            return text.encode(single_byte).decode("utf-8"), "repaired"
+        except UnicodeError:
+            continue
+    return text, "ok"
+
+
+def repair_text(values: pd.Series, encoding: str) -> Tuple[pd.Series, pd.Series]:
+    """load_text_csv 로 읽은 문자열 컬럼의 깨진 셀을 복구하고 (복구된 값, 행별 상태) 를 반환합니다.
+
+    상태(ENCODING_STATUSES): ok / repaired(다른 인코딩 또는 mojibake 역변환으로 복구) /
+    garbled(복구 불가, 읽을 수 없는 바이트는 U+FFFD 로 표시). 의심 셀만 파이썬에서 처리합니다.
+    """
+    status = pd.Series(pd.Categorical(["ok"] * len(values), categories=ENCODING_STATUSES),
+                       index=values.index)
+    suspect = values.str.contains(_SUSPECT_TEXT, na=False)
+    if suspect.any():
+        values = values.copy()
+        results = [_repair_cell(text, encoding) for text in values[suspect]]
+        values[suspect] = [text for text, _ in results]
+        status[suspect] = [state for _, state in results]
+    return values, status
+
+
+def _worst_status(statuses: Sequence[pd.Series]) -> pd.Series:
+    codes = np.maximum.reduce([status.cat.codes.to_numpy() for status in statuses])
+    return pd.Series(pd.Categorical.from_codes(codes, categories=ENCODING_STATUSES), index=statuses[0].index)
+
+
+def _repair_chunk(chunk: pd.DataFrame, text_columns: Sequence[str], encoding: str) -> pd.DataFrame:
+    statuses = []
+    for column in text_columns:
+        if column in chunk:
+            chunk[column], status = repair_text(chunk[column], encoding)
+            statuses.append(status)
+    if statuses:
+        chunk["encoding_status"] = _worst_status(statuses)
+    return chunk
+
+
+def load_text_csv(
+    path: Union[str, Path],
+    text_columns: Sequence[str] = (),
+    chunksize: Optional[int] = None,
+    cache_path: Optional[Union[str, Path]] = None,
+    **read_kwargs,
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+    """인코딩을 감지해 CSV 를 한 번만 읽습니다 (인코딩을 바꿔 가며 다시 읽지 않음).
+
+    디코딩할 수 없는 바이트는 오류 대신 보존해 두었다가, text_columns 의 셀만 행 단위로
+    복구하고 `encoding_status` 컬럼(행의 text_columns 중 가장 나쁜 상태)을 추가합니다.
+    text_columns 밖의 컬럼에 남은 보존 바이트는 U+F7xx 문자로 남습니다.
+    """
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"CSV 파일을 찾을 수 없습니다: {path}")
+    encoding = sniff_encoding(path, cache_path=cache_path)
+    data = load_csv(path, chunksize=chunksize, encoding=encoding, encoding_errors=_ESCAPE_ERRORS,
+                    **read_kwargs)
+    if not text_columns:
+        return data
+    if chunksize is None:
+        return _repair_chunk(data, text_columns, encoding)
+    return (_repair_chunk(chunk, text_columns, encoding) for chunk in data)
+
+
+# ---------------------------------------------------------------------------
+# 특허 코퍼스 (출원 단위로 정규화한 Parquet 테이블)
+# ---------------------------------------------------------------------------
+
+PATENT_DIR_NAME = "HBM"
+# 원본 CSV 파일명 (raw_dir/HBM 아래). HBM_Gemini.csv 는 출원 행이 CPC 코드 수만큼,
+# With_Abstract 는 초록이 공보 행마다 반복되는 비정규화 PATSTAT 추출 결과입니다.
+PATENT_SOURCES: Dict[str, str] = {
+    "applications": "HBM_Gemini.csv",
+    "abstracts": "HBM_Gemini_With_Abstract.csv",
+    "publications": "HBM_Gemini_Export_Pub_Numbers.csv",
+}
+PATENT_TABLES = ("applications", "cpc", "cpc_symbols", "publications", "abstracts")
+PATENT_CHUNKSIZE = 200_000
+APPLICATION_COLUMNS = ["appln_id", "appln_auth", "appln_nr", "appln_filing_year", "appln_title"]
+# 깨진 인용부호 때문에 CPC 코드가 제목 끝에 붙어 읽힌 행 (예: '...??,G11C   5/025"')
+_MERGED_CPC = re.compile(r'^(?P<title>.*),(?P<cpc>[A-HY]\d{2}[A-Z]\s*\d+/\d+)"?$', re.S)
+
+
+def default_patent_dir(raw_dir: Union[str, Path]) -> Path:
+    """원본 디렉토리(data/raw)와 같은 수준의 data/interim/patents 경로를 반환합니다."""
+    return Path(raw_dir).parent / "interim" / "patents"
+
+
+def patent_source_paths(raw_dir: Union[str, Path]) -> List[Path]:
+    """특허 코퍼스의 입력 CSV 경로 목록."""
+    return [Path(raw_dir) / PATENT_DIR_NAME / filename for filename in PATENT_SOURCES.values()]
+
+
+def _read_patent_csv(
+    path: Path, usecols: Sequence[str], text_column: str, chunksize: int, cache_path: Optional[Path]
+) -> Iterator[pd.DataFrame]:
+    """특허 CSV 의 usecols 중 존재하는 컬럼을 문자열로 청크 단위로 읽습니다.
+
+    인코딩은 load_text_csv 로 감지하고 text_column(제목/초록)의 깨진 셀은 복구 또는 표시합니다.
+    """
+    wanted = set(usecols)
+    return load_text_csv(path, text_columns=[text_column], chunksize=chunksize, cache_path=cache_path,
+                         usecols=lambda column: column in wanted, dtype=str)
+
+
+def _appln_ids(values: pd.Series) -> pd.Series:
+    return pd.to_numeric(values, errors="coerce").astype("Int64")
+
+
+def _split_merged_cpc(chunk: pd.DataFrame) -> pd.DataFrame:
+    """CPC 가 비어 있고 제목 끝에 CPC 코드가 붙은 행을 제목/CPC 로 다시 나눕니다."""
+    missing = chunk["cpc_class_symbol"].isna() & chunk["appln_title"].notna()
+    if not missing.any():
+        return chunk
+    parts = chunk.loc[missing, "appln_title"].str.extract(_MERGED_CPC)
+    found = parts["cpc"].notna()
+    chunk = chunk.copy()
+    chunk.loc[found[found].index, "appln_title"] = parts.loc[found, "title"]
+    chunk.loc[found[found].index, "cpc_class_symbol"] = parts.loc[found, "cpc"]
+    return chunk
+
+
+def _normalize_applications(
+    path: Path, chunksize: int, cache_path: Optional[Path] = None
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """출원×CPC 행을 출원 표, (appln_id, cpc_id) 배정 표, CPC 코드 사전으로 나눕니다."""
+    applications, assignments = [], []
+    columns = APPLICATION_COLUMNS + ["encoding_status"]
+    chunks = _read_patent_csv(path, APPLICATION_COLUMNS + ["cpc_class_symbol"], "appln_title", chunksize, cache_path)
+    for chunk in chunks:
+        frame = _split_merged_cpc(chunk)
+        frame["appln_id"] = _appln_ids(frame["appln_id"])
+        frame = frame.dropna(subset=["appln_id"])
+        applications.append(frame[columns].drop_duplicates("appln_id"))
+        cpc = frame[["appln_id", "cpc_class_symbol"]].dropna()
+        cpc = cpc.assign(cpc_class_symbol=cpc["cpc_class_symbol"].str.strip()).drop_duplicates()
+        # 청크별 category 로 보관해 반복되는 코드 문자열을 한 번만 저장
+        assignments.append(cpc.assign(cpc_class_symbol=cpc["cpc_class_symbol"].astype("category")))
+
+    apps = (pd.concat(applications, ignore_index=True) if applications
+            else pd.DataFrame(columns=columns))
+    apps = apps.drop_duplicates("appln_id").sort_values("appln_id", kind="stable", ignore_index=True)
+    apps["appln_id"] = apps["appln_id"].astype(np.int64)
+    apps["appln_auth"] = apps["appln_auth"].astype("category")
+    apps["appln_filing_year"] = pd.to_numeric(apps["appln_filing_year"], errors="coerce").astype("Int16")
+    apps["encoding_status"] = apps["encoding_status"].astype(pd.CategoricalDtype(ENCODING_STATUSES))
+
+    if assignments:
+        symbols = union_categoricals([part["cpc_class_symbol"] for part in assignments], sort_categories=True)
+        cpc = pd.DataFrame({
+            "appln_id": np.concatenate([part["appln_id"].to_numpy(dtype=np.int64) for part in assignments]),
+            "cpc_id": symbols.codes.astype(np.int32),
+        })
+        categories = symbols.categories
+    else:
+        cpc = pd.DataFrame({"appln_id": np.empty(0, np.int64), "cpc_id": np.empty(0, np.int32)})
+        categories = pd.Index([], dtype=str)
+    cpc = cpc.drop_duplicates().sort_values(["appln_id", "cpc_id"], kind="stable", ignore_index=True)
+    cpc_symbols = pd.DataFrame({"cpc_id": np.arange(len(categories), dtype=np.int32),
+                                "cpc_symbol": categories.astype(str)})
+    return apps, cpc, cpc_symbols
+
+
+def _normalize_publications(
+    paths: Sequence[Path], chunksize: int, cache_path: Optional[Path] = None
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """공보 번호/초록 CSV 들에서 (appln_id, full_pub_number) 표와 출원별 초록 표를 만듭니다."""
+    publications, abstracts = [], []
+    for path in paths:
+        if not path.exists():
+            continue
+        for chunk in _read_patent_csv(path, ("appln_id", "full_pub_number", "Abstract"), "Abstract",
+                                      chunksize, cache_path):
+            chunk["appln_id"] = _appln_ids(chunk["appln_id"])
+            frame = chunk.dropna(subset=["appln_id"])
+            if "full_pub_number" in frame:
+                publications.append(frame[["appln_id", "full_pub_number"]].dropna().drop_duplicates())
+            if "Abstract" in frame:
+                text = frame["Abstract"].str.strip()
+                part = pd.DataFrame({"appln_id": frame["appln_id"], "abstract": text,
+                                     "encoding_status": frame["encoding_status"]})
+                abstracts.append(part[text.fillna("") != ""].drop_duplicates("appln_id"))
+
+    pubs = (pd.concat(publications, ignore_index=True).drop_duplicates() if publications
+            else pd.DataFrame({"appln_id": [], "full_pub_number": []}))
+    pubs = pubs.astype({"appln_id": np.int64, "full_pub_number": str})
+    pubs = pubs.sort_values(["appln_id", "full_pub_number"], kind="stable", ignore_index=True)
+    abst = (pd.concat(abstracts, ignore_index=True).drop_duplicates("appln_id") if abstracts
+            else pd.DataFrame({"appln_id": [], "abstract": [], "encoding_status": []}))
+    abst = abst.astype({"appln_id": np.int64, "abstract": str,
+                        "encoding_status": pd.CategoricalDtype(ENCODING_STATUSES)})
+    abst = abst.sort_values("appln_id", kind="stable", ignore_index=True)
+    return pubs, abst
+
+
+def _source_stamps(raw_dir: Path) -> dict:
+    stamps = {}
+    for path in patent_source_paths(raw_dir):
+        if path.exists():
+            stat = path.stat()
+            stamps[path.name] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    return stamps
+
+
+@dataclass
+class PatentCorpus:
+    """출원(appln_id) 단위로 정규화한 특허 테이블 모음.
+
+    - applications: 출원당 1행 (appln_id 오름차순, encoding_status 는 제목 인코딩 상태)
+    - cpc: 출원×CPC 배정 (appln_id, cpc_id), cpc_symbols: cpc_id -> CPC 기호 (기호 사전순)
+    - publications: 출원×공보 번호, abstracts: 출원당 초록 1개 (encoding_status 포함)
+    로드하지 않은 테이블은 None 입니다.
+    """
+
+    applications: Optional[pd.DataFrame] = None
+    cpc: Optional[pd.DataFrame] = None
+    cpc_symbols: Optional[pd.DataFrame] = None
+    publications: Optional[pd.DataFrame] = None
+    abstracts: Optional[pd.DataFrame] = None
+
+    @staticmethod
+    def _positions(keys: np.ndarray, appln_ids) -> np.ndarray:
+        """정렬된 keys 에서 appln_ids 의 위치 (없으면 -1)."""
+        appln_ids = np.asarray(appln_ids, dtype=np.int64)
+        pos = np.searchsorted(keys, appln_ids)
+        if not len(keys):
+            return np.full(len(appln_ids), -1, dtype=np.int64)
+        pos = np.minimum(pos, len(keys) - 1)
+        return np.where(keys[pos] == appln_ids, pos, -1)
+
+    def attach(self, frame: pd.DataFrame, columns: Sequence[str], table: str = "applications") -> pd.DataFrame:
+        """frame 의 appln_id 로 출원당 1행인 테이블(applications, abstracts)의 컬럼을 붙입니다.
+
+        두 테이블은 appln_id 로 정렬되어 있으므로 병합(merge) 대신 이진 탐색 위치로 값을 가져옵니다.
+        대응하는 행이 없으면 결측값이 됩니다.
+        """
+        source = getattr(self, table)
+        pos = self._positions(source["appln_id"].to_numpy(), frame["appln_id"].to_numpy())
+        out = frame.copy()
+        for column in columns:
+            # 위치 -1 은 RangeIndex 에 없으므로 reindex 결과가 결측이 됨
+            out[column] = source[column].reset_index(drop=True).reindex(pos).set_axis(frame.index)
+        return out
+
+    def symbols(self, cpc_ids) -> pd.Categorical:
+        """cpc_id 배열을 CPC 기호 Categorical 로 변환합니다 (문자열 복사 없음)."""
+        return pd.Categorical.from_codes(np.asarray(cpc_ids), categories=self.cpc_symbols["cpc_symbol"])
+
+    def cpc_frame(self, columns: Sequence[str] = ("appln_filing_year",), symbols: bool = False) -> pd.DataFrame:
+        """CPC 배정 표에 출원 컬럼(기본: 출원연도)을 붙인 분석용 표."""
+        frame = self.attach(self.cpc, columns)
+        if symbols:
+            frame["cpc_symbol"] = self.symbols(frame["cpc_id"].to_numpy())
+        return frame
+
+
+def build_patent_corpus(
+    raw_dir: Union[str, Path] = "data/raw",
+    corpus_dir: Optional[Union[str, Path]] = None,
+    chunksize: int = PATENT_CHUNKSIZE,
+) -> dict:
+    """원본 특허 CSV 를 정규화해 테이블별 Parquet 으로 저장하고 manifest 를 반환합니다.
+
+    각 원본은 감지한 인코딩으로 한 번만 읽으며(감지 결과는 corpus_dir 상위의 encodings.json 에 캐시),
+    applications/abstracts 의 encoding_status 컬럼에 제목/초록의 복구 여부를 기록합니다.
+    """
+    raw_dir = Path(raw_dir)
+    corpus_dir = Path(corpus_dir) if corpus_dir else default_patent_dir(raw_dir)
+    paths = dict(zip(PATENT_SOURCES, patent_source_paths(raw_dir), strict=True))
+    if not paths["applications"].exists():
+        raise FileNotFoundError(f"특허 CSV 파일을 찾을 수 없습니다: {paths['applications']}")
+
+    cache_path = corpus_dir.parent / ENCODING_CACHE_NAME
+    applications, cpc, cpc_symbols = _normalize_applications(paths["applications"], chunksize, cache_path)
+    publications, abstracts = _normalize_publications([paths["publications"], paths["abstracts"]],
+                                                      chunksize, cache_path)
+    tables = {"applications": applications, "cpc": cpc, "cpc_symbols": cpc_symbols,
+              "publications": publications, "abstracts": abstracts}
+
+    tmp_dir = corpus_dir.with_name(corpus_dir.name + ".tmp")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir(parents=True)
+    for name, table in tables.items():
+        pq.write_table(pa.Table.from_pandas(table, preserve_index=False), tmp_dir / f"{name}.parquet")
+    manifest = {
+        "sources": _source_stamps(raw_dir),
+        "rows": {name: len(table) for name, table in tables.items()},
+    }
+    _write_manifest(tmp_dir, manifest)
+    shutil.rmtree(corpus_dir, ignore_errors=True)
+    tmp_dir.rename(corpus_dir)
+    return manifest
+
+
+def load_patent_corpus(
+    raw_dir: Union[str, Path] = "data/raw",
+    corpus_dir: Optional[Union[str, Path]] = None,
+    tables: Optional[Iterable[str]] = None,
+    refresh: bool = True,
+) -> PatentCorpus:
+    """정규화된 특허 테이블을 로드합니다. refresh=True 이면 원본이 바뀐 경우 먼저 다시 생성합니다.
+
+    tables 로 읽을 테이블을 제한할 수 있습니다 (예: CPC 집계에는 applications, cpc, cpc_symbols).
+    """
+    raw_dir = Path(raw_dir)
+    corpus_dir = Path(corpus_dir) if corpus_dir else default_patent_dir(raw_dir)
+    manifest = _read_manifest(corpus_dir)
+    if manifest is None or (refresh and manifest.get("sources") != _source_stamps(raw_dir)):
+        build_patent_corpus(raw_dir, corpus_dir)
+
+    names = PATENT_TABLES if tables is None else tuple(tables)
+    unknown = set(names) - set(PATENT_TABLES)
+    if unknown:
+        raise ValueError(f"알 수 없는 특허 테이블: {sorted(unknown)}")
+    return PatentCorpus(**{name: pq.read_table(corpus_dir / f"{name}.parquet").to_pandas()
+                           for name in names})
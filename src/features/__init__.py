@@ -1,5 +1,57 @@
-"""특징 공학(feature engineering) 서브패키지."""
+"""특징 공학(feature engineering) 서브패키지.
 
-from .text import TextPreprocessor, batch_clean
+공개 이름은 처음 접근할 때 해당 하위 모듈을 import 합니다. 따라서 `src.features.keywords`
+처럼 하위 모듈 하나만 쓰는 스크립트와 워커 프로세스는 pandas/networkx 등 다른 모듈의
+import 비용을 내지 않습니다.
+"""
 
-__all__ = ["TextPreprocessor", "batch_clean"]
+from importlib import import_module
+
+_EXPORTS = {
+    "BurstDetector": "bursts",
+    "CellGraph": "centrality",
+    "CentralityPanel": "centrality",
+    "centrality_array": "centrality",
+    "centrality_from_graphs": "centrality",
+    "DocumentTermMatrix": "cooccurrence",
+    "cooccurrence_to_edges": "cooccurrence",
+    "cooccurrence_to_graph": "cooccurrence",
+    "rolling_cooccurrence": "cooccurrence",
+    "CPCIndex": "cpc",
+    "cpc_counts": "cpc",
+    "cpc_growth": "cpc",
+    "parse_cpc": "cpc",
+    "KeywordSets": "keyword_sets",
+    "TECH_KEYWORDS": "keywords",
+    "KeywordMatcher": "keywords",
+    "build_matcher": "keywords",
+    "extract_keywords_parallel": "parallel",
+    "extract_keyword_sets_parallel": "parallel",
+    "count_keywords_parallel": "parallel",
+    "sentence_table": "sentences",
+    "load_lexicon": "stopwords",
+    "load_stopwords": "stopwords",
+    "TermCountMatrix": "term_counts",
+    "TextPreprocessor": "text",
+    "batch_clean": "text",
+    "KoreanTokenizer": "text",
+    "build_tokenizer": "text",
+    "register_tokenizer": "text",
+    "TokenStore": "token_store",
+    "tokenize_articles": "token_store",
+    "find_crossovers": "transitions",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
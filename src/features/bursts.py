@@ -0,0 +1,282 @@
+"""신규 등장/급증 키워드(약한 신호) 스트리밍 탐지 모듈.
+
+기사별 토큰 목록을 기간(기본: 월)×스트림(기업, 전체)별 문서 빈도로 집계하고, 용어마다
+지수 감쇠 기준선(출현 비율의 지수가중 평균/분산) 대비 z-점수가 높은 용어를 기간별로 내보냅니다.
+
+- 기준선은 관측된 용어만 갱신합니다. 관측되지 않은 기간의 감쇠는 다음 관측 때
+  (1 - alpha)^(경과 기간) 로 한꺼번에 적용하므로, 배치 처리 비용은 새 기사 토큰 수에 비례합니다.
+- 상태는 용어별 1차원 배열(스트림당 기준선 두 개와 최초/최근 관측 기간)뿐이며,
+  용어×기간 행렬을 만들지 않으므로 수십만 개의 열린 어휘에도 사용할 수 있습니다.
+- 마지막 기간은 이후 기간의 기사가 들어올 때까지 열어 두고(집계 중), 닫힌 기간만 평가합니다.
+  열린 기간보다 앞선(이미 닫혔거나 건너뛴) 기간의 늦게 들어온 기사는 집계하지 않고
+  dropped_articles 로 셉니다.
+
+    detector = BurstDetector(half_life=6)
+    emerging = detector.update(df['date'], df['company'], tokens)
+    detector.save('data/interim/emerging_keywords')
+"""
+
+import json
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+ALL_STREAM = "All"
+EMERGING_COLUMNS = ["company", "period", "term", "count", "docs", "rate", "baseline", "zscore", "novel", "rank"]
+
+
+@dataclass
+class StreamState:
+    """스트림(기업 또는 전체) 하나의 용어별 기준선과 열린 기간 집계."""
+
+    s1: np.ndarray = field(default_factory=lambda: np.zeros(0))    # 출현 비율의 지수가중 평균
+    s2: np.ndarray = field(default_factory=lambda: np.zeros(0))    # 출현 비율 제곱의 지수가중 평균
+    last: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))   # 최근 관측 기간
+    first: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))  # 최초 관측 기간 (-1: 없음)
+    start: Optional[int] = None          # 첫 기간 (Period ordinal)
+    closed_periods: int = 0
+    last_closed: Optional[int] = None
+    open_period: Optional[int] = None
+    open_docs: int = 0
+    open_counts: Dict[int, int] = field(default_factory=dict)
+    dropped_articles: int = 0
+
+    def grow(self, size: int) -> None:
+        if size <= len(self.s1):
+            return
+        extra = size - len(self.s1)
+        self.s1 = np.concatenate([self.s1, np.zeros(extra)])
+        self.s2 = np.concatenate([self.s2, np.zeros(extra)])
+        self.last = np.concatenate([self.last, np.full(extra, -1, dtype=np.int64)])
+        self.first = np.concatenate([self.first, np.full(extra, -1, dtype=np.int64)])
+
+
+@dataclass
+class BurstDetector:
+    """지수 감쇠 기준선 대비 z-점수로 기간별 신규/급증 용어를 찾는 스트리밍 탐지기.
+
+    - half_life: 기준선 반감기 (기간 수)
+    - min_count: 평가할 최소 문서 빈도 (기간 내 해당 용어가 나온 기사 수)
+    - min_zscore: 내보낼 최소 z-점수
+    - warmup: 스트림의 처음 warmup 개 기간은 기준선만 쌓고 결과를 내보내지 않음
+    - smoothing: 기준선이 0 에 가까운 용어의 분산 하한 (가상 문서 수).
+      기준선이 0 이면 z-점수가 count / sqrt(smoothing) 이 됩니다
+    - top_n: 기간×스트림별 상위 몇 개를 내보낼지 (None 이면 조건을 만족하는 전체)
+    - freq: 기간 단위 (pandas Period 빈도)
+    """
+
+    half_life: float = 6.0
+    min_count: int = 3
+    min_zscore: float = 3.0
+    warmup: int = 3
+    smoothing: float = 1.0
+    top_n: Optional[int] = 20
+    freq: str = "M"
+    vocabulary: Dict[str, int] = field(default_factory=dict, repr=False)
+    streams: Dict[str, StreamState] = field(default_factory=dict, repr=False)
+
+    @property
+    def alpha(self) -> float:
+        return 1.0 - 0.5 ** (1.0 / self.half_life)
+
+    @property
+    def params(self) -> dict:
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.name not in ("vocabulary", "streams")}
+
+    @property
+    def dropped_articles(self) -> int:
+        return sum(state.dropped_articles for name, state in self.streams.items() if name != ALL_STREAM)
+
+    # ------------------------------------------------------------------
+    # 배치 갱신
+    # ------------------------------------------------------------------
+
+    def update(
+        self,
+        dates,
+        companies: Sequence[str],
+        token_lists: Iterable[Iterable[str]],
+    ) -> pd.DataFrame:
+        """기사 배치를 반영하고, 이번 배치로 닫힌 기간의 신규/급증 용어를 반환합니다.
+
+        dates 는 기사 날짜(datetime 계열), companies 는 기사별 기업명이며, 각 기사는
+        해당 기업 스트림과 전체('All') 스트림에 함께 집계됩니다.
+        """
+        periods = pd.PeriodIndex(pd.to_datetime(pd.Series(dates)), freq=self.freq).asi8
+        companies = np.asarray(companies, dtype=object).astype(str)
+
+        # 기사별 고유 용어 id (어휘는 처음 보는 용어마다 늘어남)
+        vocabulary = self.vocabulary
+        doc_terms: List[np.ndarray] = []
+        for tokens in token_lists:
+            ids = {vocabulary.setdefault(token, len(vocabulary)) for token in tokens}
+            doc_terms.append(np.fromiter(ids, dtype=np.int64, count=len(ids)))
+        if len(doc_terms) != len(periods):
+            raise ValueError(f"기사 수가 다릅니다: dates {len(periods)}, tokens {len(doc_terms)}")
+
+        frames = []
+        for stream in [*pd.unique(companies), ALL_STREAM]:
+            rows = np.arange(len(periods)) if stream == ALL_STREAM else np.flatnonzero(companies == stream)
+            frames.extend(self._update_stream(stream, periods[rows], [doc_terms[i] for i in rows]))
+        return self._frame(frames)
+
+    def flush(self) -> pd.DataFrame:
+        """열린 기간을 모두 닫고 평가합니다 (데이터 수집이 끝난 뒤 마지막 기간까지 볼 때)."""
+        frames = []
+        for stream, state in self.streams.items():
+            if state.open_period is not None:
+                frames.append(self._close(stream, state))
+        return self._frame(frames)
+
+    def _update_stream(self, stream: str, periods: np.ndarray, doc_terms: List[np.ndarray]) -> list:
+        state = self.streams.setdefault(stream, StreamState())
+        state.grow(len(self.vocabulary))
+        if len(periods) == 0:
+            return []
+        boundary = state.open_period if state.open_period is not None else state.last_closed
+        if boundary is not None:
+            late = periods < boundary if state.open_period is not None else periods <= boundary
+            state.dropped_articles += int(late.sum())
+            keep = np.flatnonzero(~late)
+            periods, doc_terms = periods[keep], [doc_terms[i] for i in keep]
+            if len(periods) == 0:
+                return []
+
+        # (기간, 용어) 문서 빈도와 기간별 기사 수
+        n_vocab = max(len(self.vocabulary), 1)
+        lengths = np.fromiter((len(ids) for ids in doc_terms), dtype=np.int64, count=len(doc_terms))
+        terms = np.concatenate(doc_terms) if doc_terms else np.zeros(0, dtype=np.int64)
+        keys, counts = np.unique(np.repeat(periods, lengths) * n_vocab + terms, return_counts=True)
+        key_periods, key_terms = keys // n_vocab, keys % n_vocab
+        docs_per_period = pd.Series(periods).value_counts().sort_index()
+
+        frames = []
+        for period, n_docs in docs_per_period.items():
+            if state.open_period is not None and period > state.open_period:
+                frames.append(self._close(stream, state))
+            if state.open_period is None:
+                state.open_period = int(period)
+                if state.start is None:
+                    state.start = int(period)
+            lo, hi = np.searchsorted(key_periods, [period, period + 1])
+            pending = state.open_counts
+            for term, count in zip(key_terms[lo:hi].tolist(), counts[lo:hi].tolist(), strict=True):
+                pending[term] = pending.get(term, 0) + count
+            state.open_docs += int(n_docs)
+        return frames
+
+    def _close(self, stream: str, state: StreamState) -> pd.DataFrame:
+        """열린 기간을 평가하고 기준선에 반영합니다 (관측된 용어만 갱신)."""
+        period, n_docs = state.open_period, state.open_docs
+        terms = np.fromiter(state.open_counts.keys(), dtype=np.int64, count=len(state.open_counts))
+        counts = np.fromiter(state.open_counts.values(), dtype=np.float64, count=len(state.open_counts))
+        state.open_period, state.open_docs, state.open_counts = None, 0, {}
+        state.last_closed = period
+        state.closed_periods += 1
+        state.grow(len(self.vocabulary))
+
+        keep = 1.0 - self.alpha
+        # 마지막 관측 이후 관측되지 않은 기간만큼 감쇠 (관측이 없던 용어는 기준선 0)
+        gap = np.where(state.last[terms] >= 0, period - state.last[terms] - 1, 0)
+        s1 = state.s1[terms] * keep ** gap
+        s2 = state.s2[terms] * keep ** gap
+        # 초기값 0 편향 보정: 스트림 시작 이후 지난 기간 수 기준 가중치 합
+        weight = 1.0 - keep ** (period - state.start)
+        mean = s1 / weight if weight > 0 else np.zeros_like(s1)
+        var = np.maximum(s2 / weight - mean ** 2, 0.0) if weight > 0 else np.zeros_like(s1)
+        rate = counts / n_docs
+        zscore = (rate - mean) / np.sqrt(var + (mean * n_docs + self.smoothing) / n_docs ** 2)
+        novel = state.first[terms] < 0
+
+        state.s1[terms] = keep * s1 + self.alpha * rate
+        state.s2[terms] = keep * s2 + self.alpha * rate ** 2
+        state.last[terms] = period
+        state.first[terms] = np.where(novel, period, state.first[terms])
+
+        if state.closed_periods <= self.warmup:
+            return pd.DataFrame()
+        emit = (counts >= self.min_count) & (zscore >= self.min_zscore)
+        order = np.flatnonzero(emit)[np.argsort(-zscore[emit], kind="stable")]
+        if self.top_n is not None:
+            order = order[:self.top_n]
+        terms_list = self.terms()
+        return pd.DataFrame({
+            "company": stream,
+            "period": str(pd.Period(ordinal=period, freq=self.freq)),
+            "term": [terms_list[i] for i in terms[order]],
+            "count": counts[order].astype(np.int64),
+            "docs": n_docs,
+            "rate": rate[order],
+            "baseline": mean[order],
+            "zscore": zscore[order],
+            "novel": novel[order],
+            "rank": np.arange(1, len(order) + 1),
+        })
+
+    def terms(self) -> List[str]:
+        """용어 id 순서의 어휘 목록."""
+        if len(getattr(self, "_terms", ())) != len(self.vocabulary):
+            self._terms = list(self.vocabulary)
+        return self._terms
+
+    @staticmethod
+    def _frame(frames: list) -> pd.DataFrame:
+        frames = [frame for frame in frames if len(frame)]
+        if not frames:
+            return pd.DataFrame(columns=EMERGING_COLUMNS)
+        return pd.concat(frames, ignore_index=True)[EMERGING_COLUMNS]
+
+    # ------------------------------------------------------------------
+    # 상태 저장/복원
+    # ------------------------------------------------------------------
+
+    def save(self, path: Union[str, Path]) -> None:
+        """상태를 디렉토리에 저장합니다 (state.json, terms/baselines/pending.parquet)."""
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        baselines, pending, meta = [], [], {}
+        for stream, state in self.streams.items():
+            seen = np.flatnonzero(state.first >= 0)
+            baselines.append(pd.DataFrame({
+                "stream": stream, "term_id": seen, "s1": state.s1[seen], "s2": state.s2[seen],
+                "last": state.last[seen], "first": state.first[seen],
+            }))
+            pending.append(pd.DataFrame({
+                "stream": stream,
+                "term_id": np.fromiter(state.open_counts.keys(), dtype=np.int64, count=len(state.open_counts)),
+                "count": np.fromiter(state.open_counts.values(), dtype=np.int64, count=len(state.open_counts)),
+            }))
+            meta[stream] = {f.name: getattr(state, f.name) for f in fields(state)
+                            if f.name not in ("s1", "s2", "last", "first", "open_counts")}
+        pd.DataFrame({"term": self.terms()}).to_parquet(path / "terms.parquet", index=False)
+        for name, frames in (("baselines", baselines), ("pending", pending)):
+            table = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=["stream", "term_id"])
+            table.to_parquet(path / f"{name}.parquet", index=False)
+        with open(path / "state.json", "w", encoding="utf-8") as f:
+            json.dump({"params": self.params, "streams": meta}, f, ensure_ascii=False, indent=2)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "BurstDetector":
+        """save 로 저장한 상태를 읽습니다."""
+        path = Path(path)
+        with open(path / "state.json", encoding="utf-8") as f:
+            saved = json.load(f)
+        detector = cls(**saved["params"])
+        terms = pd.read_parquet(path / "terms.parquet")["term"].tolist()
+        detector.vocabulary = {term: i for i, term in enumerate(terms)}
+        baselines = pd.read_parquet(path / "baselines.parquet")
+        pending = pd.read_parquet(path / "pending.parquet")
+        for stream, meta in saved["streams"].items():
+            state = StreamState(**meta)
+            state.grow(len(terms))
+            rows = baselines[baselines["stream"] == stream]
+            ids = rows["term_id"].to_numpy(dtype=np.int64)
+            state.s1[ids], state.s2[ids] = rows["s1"].to_numpy(), rows["s2"].to_numpy()
+            state.last[ids], state.first[ids] = rows["last"].to_numpy(), rows["first"].to_numpy()
+            rows = pending[pending["stream"] == stream]
+            state.open_counts = dict(zip(rows["term_id"].tolist(), rows["count"].tolist(), strict=True))
+            detector.streams[stream] = state
+        return detector
@@ -0,0 +1,305 @@
+"""희소 공출현 행렬 기반 중심성 계산 모듈.
+
+연도(또는 연도×기업 등) 셀마다 키워드×키워드 가중 인접 행렬을 희소 행렬로 만들고
+중심성 지표를 행렬 연산으로 한 번에 계산합니다. 셀의 노드는 임계값 이상 엣지를 가진
+키워드이며(networkx 그래프와 동일), 지표 정의는 networkx 기본값과 같습니다.
+
+- degree_centrality: 이웃 수 / (노드 수 - 1)
+- weighted_degree: 엣지 가중치 합
+- eigenvector: (A + I) 거듭제곱 반복, L2 정규화 (`nx.eigenvector_centrality(G, weight='weight')`)
+- pagerank: alpha=0.85 가중 PageRank (`nx.pagerank`)
+- betweenness: 비가중 최단 경로 매개 중심성, 정규화 (`nx.betweenness_centrality`).
+  여러 출발 노드의 BFS 를 행렬 곱으로 묶어 계산하며, 노드가 많으면 출발 노드를 표본 추출
+
+`CentralityPanel` 은 셀별 행렬과 결과를 보관해 바뀐 셀만 다시 계산하며, 파일로 저장해
+다음 실행에서 이어 쓸 수 있습니다.
+"""
+
+import pickle
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Hashable, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+DEFAULT_MEASURES = ("degree_centrality", "weighted_degree", "eigenvector", "pagerank")
+ALL_MEASURES = DEFAULT_MEASURES + ("betweenness",)
+# BFS 묶음 크기 상한 (노드 수 × 출발 노드 수 원소의 dense 행렬)
+_BFS_BLOCK_ELEMENTS = 1 << 22
+
+
+@dataclass
+class CellGraph:
+    """셀 하나의 대칭 가중 인접 행렬과 노드(키워드) 목록."""
+
+    nodes: np.ndarray
+    adjacency: sparse.csr_matrix
+
+    @classmethod
+    def from_edges(cls, edges: pd.DataFrame, min_weight: float = 1) -> "CellGraph":
+        """source, target, weight 컬럼의 엣지 표로 생성합니다 (min_weight 미만 엣지 제외)."""
+        edges = edges[edges["weight"] >= min_weight]
+        codes, nodes = pd.factorize(pd.concat([edges["source"], edges["target"]], ignore_index=True))
+        m = len(edges)
+        src, dst = codes[:m], codes[m:]
+        weight = edges["weight"].to_numpy(dtype=np.float64)
+        n = len(nodes)
+        adjacency = sparse.coo_matrix(
+            (np.concatenate([weight, weight]), (np.concatenate([src, dst]), np.concatenate([dst, src]))),
+            shape=(n, n),
+        ).tocsr()
+        adjacency.sum_duplicates()
+        return cls(np.asarray(nodes, dtype=object), adjacency)
+
+    @classmethod
+    def from_graph(cls, G) -> "CellGraph":
+        """networkx 그래프로 생성합니다 (노드 순서 유지, 가중치 없는 엣지는 1)."""
+        nodes = np.asarray(list(G.nodes()), dtype=object)
+        index = {node: i for i, node in enumerate(nodes)}
+        edges = np.array([(index[u], index[v], w) for u, v, w in G.edges(data="weight", default=1)],
+                         dtype=np.float64).reshape(-1, 3)
+        src, dst = edges[:, 0].astype(np.intp), edges[:, 1].astype(np.intp)
+        off_diagonal = src != dst
+        adjacency = sparse.coo_matrix(
+            (np.concatenate([edges[:, 2], edges[off_diagonal, 2]]),
+             (np.concatenate([src, dst[off_diagonal]]), np.concatenate([dst, src[off_diagonal]]))),
+            shape=(len(nodes), len(nodes)),
+        ).tocsr()
+        return cls(nodes, adjacency)
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.nodes)
+
+    @property
+    def n_edges(self) -> int:
+        """무방향 엣지 수 (자기 루프 포함, networkx number_of_edges 와 같음)."""
+        self_loops = int(np.count_nonzero(self.adjacency.diagonal()))
+        return (self.adjacency.nnz - self_loops) // 2 + self_loops
+
+    def fingerprint(self) -> Tuple:
+        """내용 비교용 키 (노드, 구조, 가중치가 같으면 같음)."""
+        A = self.adjacency
+        return (tuple(self.nodes), A.indptr.tobytes(), A.indices.tobytes(), A.data.tobytes())
+
+
+def degree_centrality(A: sparse.csr_matrix) -> np.ndarray:
+    n = A.shape[0]
+    degree = np.diff(A.indptr).astype(np.float64)
+    return degree / (n - 1) if n > 1 else np.ones(n)
+
+
+def weighted_degree(A: sparse.csr_matrix) -> np.ndarray:
+    return np.asarray(A.sum(axis=1)).ravel()
+
+
+def eigenvector_centrality(A: sparse.csr_matrix, max_iter: int = 1000, tol: float = 1e-6) -> np.ndarray:
+    """(A + I) 거듭제곱 반복. 수렴하지 않으면 마지막 반복값을 반환합니다."""
+    n = A.shape[0]
+    if n == 0:
+        return np.zeros(0)
+    x = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        last = x
+        x = last + A @ last
+        norm = np.sqrt(x @ x) or 1.0
+        x = x / norm
+        if np.abs(x - last).sum() < n * tol:
+            break
+    return x
+
+
+def pagerank(A: sparse.csr_matrix, alpha: float = 0.85, max_iter: int = 100, tol: float = 1e-6) -> np.ndarray:
+    n = A.shape[0]
+    if n == 0:
+        return np.zeros(0)
+    out_weight = weighted_degree(A)
+    dangling = out_weight == 0
+    inv = np.divide(1.0, out_weight, out=np.zeros(n), where=~dangling)
+    transition_t = (sparse.diags(inv) @ A).T.tocsr()  # x @ P == P.T @ x
+    x = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        last = x
+        x = alpha * (transition_t @ last + last[dangling].sum() / n) + (1 - alpha) / n
+        if np.abs(x - last).sum() < n * tol:
+            break
+    return x
+
+
+def betweenness_centrality(
+    A: sparse.csr_matrix,
+    samples: Optional[int] = None,
+    seed: Optional[int] = 0,
+) -> np.ndarray:
+    """비가중 매개 중심성 (정규화, 끝점 제외).
+
+    samples 를 지정하고 노드 수보다 작으면 그만큼의 출발 노드만 사용해 추정합니다
+    (`nx.betweenness_centrality(G, k=samples)` 와 같은 보정).
+    """
+    n = A.shape[0]
+    if n <= 2:
+        return np.zeros(n)
+    binary = A.copy()
+    binary.data = np.ones_like(binary.data)
+    if samples is not None and samples < n:
+        sources = np.sort(np.random.default_rng(seed).choice(n, size=samples, replace=False))
+    else:
+        sources = np.arange(n)
+
+    result = np.zeros(n)
+    block = max(1, _BFS_BLOCK_ELEMENTS // n)
+    for start in range(0, len(sources), block):
+        batch = sources[start:start + block]
+        cols = np.arange(len(batch))
+        # 1) 출발 노드별 BFS: 단계별 최단 경로 수(sigma)와 도달 단계
+        sigma = np.zeros((n, len(batch)))
+        sigma[batch, cols] = 1.0
+        frontier = sigma.copy()
+        visited = sigma > 0
+        levels = [visited.copy()]
+        while True:
+            paths = binary @ frontier
+            paths[visited] = 0.0
+            reached = paths > 0
+            if not reached.any():
+                break
+            sigma += paths
+            visited |= reached
+            levels.append(reached)
+            frontier = paths
+        # 2) 역순으로 의존도(delta) 누적: delta_v += sigma_v * sum_w (1 + delta_w) / sigma_w
+        delta = np.zeros_like(sigma)
+        for depth in range(len(levels) - 1, 1, -1):
+            weight = np.where(levels[depth], (1.0 + delta) / np.where(sigma > 0, sigma, 1.0), 0.0)
+            delta += np.where(levels[depth - 1], (binary @ weight) * sigma, 0.0)
+        result += delta.sum(axis=1)
+
+    k = len(sources)
+    if k == n:
+        return result / ((n - 1) * (n - 2))
+    is_source = np.zeros(n, dtype=bool)
+    is_source[sources] = True
+    scale_source = 1.0 / ((k - 1) * (n - 2)) if k > 1 else np.nan
+    return result * np.where(is_source, scale_source, 1.0 / (k * (n - 2)))
+
+
+def centrality_frame(
+    cell: CellGraph,
+    measures: Sequence[str] = DEFAULT_MEASURES,
+    betweenness_samples: Optional[int] = None,
+    seed: Optional[int] = 0,
+) -> pd.DataFrame:
+    """셀 그래프의 노드별 중심성 표 (keyword + 지표 컬럼)."""
+    unknown = set(measures) - set(ALL_MEASURES)
+    if unknown:
+        raise ValueError(f"알 수 없는 중심성 지표: {sorted(unknown)} (가능한 값: {ALL_MEASURES})")
+    A = cell.adjacency
+    compute = {
+        "degree_centrality": lambda: degree_centrality(A),
+        "weighted_degree": lambda: weighted_degree(A),
+        "eigenvector": lambda: eigenvector_centrality(A),
+        "pagerank": lambda: pagerank(A),
+        "betweenness": lambda: betweenness_centrality(A, betweenness_samples, seed),
+    }
+    frame = pd.DataFrame({"keyword": cell.nodes})
+    for measure in measures:
+        frame[measure] = compute[measure]()
+    return frame
+
+
+@dataclass
+class CentralityPanel:
+    """셀(연도 등)별 그래프와 중심성 결과. `update` 는 내용이 바뀐 셀만 다시 계산합니다.
+
+    - measures: 계산할 지표 (ALL_MEASURES 중)
+    - betweenness_samples: 매개 중심성 출발 노드 표본 수 (None 이면 전체)
+    - min_weight: 엣지 표로 갱신할 때 적용할 최소 공출현 횟수
+    """
+
+    measures: Sequence[str] = DEFAULT_MEASURES
+    betweenness_samples: Optional[int] = None
+    min_weight: float = 1
+    seed: Optional[int] = 0
+    cells: Dict[Hashable, CellGraph] = field(default_factory=dict)
+    frames: Dict[Hashable, pd.DataFrame] = field(default_factory=dict)
+
+    def update(self, key: Hashable, cell: CellGraph) -> bool:
+        """셀을 갱신합니다. 내용이 같으면 다시 계산하지 않고 False 를 반환합니다."""
+        previous = self.cells.get(key)
+        if previous is not None and previous.fingerprint() == cell.fingerprint():
+            return False
+        self.cells[key] = cell
+        self.frames[key] = centrality_frame(cell, self.measures, self.betweenness_samples, self.seed)
+        return True
+
+    def replace(self, cells: Dict[Hashable, CellGraph]) -> list:
+        """셀 전체를 교체합니다. cells 에 없는 키는 제거하고, 다시 계산한 키 목록을 반환합니다."""
+        for cell_key in set(self.cells) - set(cells):
+            self.remove(cell_key)
+        return [cell_key for cell_key, cell in sorted(cells.items()) if self.update(cell_key, cell)]
+
+    def update_edges(self, edges: pd.DataFrame, key: str = "year") -> list:
+        """key 컬럼으로 나눈 엣지 표(source, target, weight)로 셀 전체를 교체합니다 (`replace`)."""
+        return self.replace({cell_key: CellGraph.from_edges(group, self.min_weight)
+                             for cell_key, group in edges.groupby(key, sort=True)})
+
+    def update_graphs(self, graphs: Dict[Hashable, object]) -> list:
+        """{키: networkx.Graph} 로 셀 전체를 교체합니다 (`replace`)."""
+        return self.replace({cell_key: CellGraph.from_graph(G) for cell_key, G in graphs.items()})
+
+    def remove(self, key: Hashable) -> None:
+        self.cells.pop(key, None)
+        self.frames.pop(key, None)
+
+    def to_frame(self, key_name: str = "year") -> pd.DataFrame:
+        """셀 키 × 키워드 tidy 표 (노드가 없는 셀은 제외)."""
+        frames = [frame.assign(**{key_name: cell_key}) for cell_key, frame in sorted(self.frames.items())
+                  if len(frame)]
+        columns = [key_name, "keyword", *self.measures]
+        if not frames:
+            return pd.DataFrame(columns=columns)
+        return pd.concat(frames, ignore_index=True)[columns]
+
+    def to_array(self, measure: str, key_name: str = "year") -> pd.DataFrame:
+        """지표 하나의 셀 키 × 키워드 행렬 (노드가 아닌 칸은 0)."""
+        return centrality_array(self.to_frame(key_name), measure, key_name)
+
+    def params(self) -> Tuple:
+        return tuple(self.measures), self.betweenness_samples, self.min_weight, self.seed
+
+    def save(self, path: Union[str, Path]) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: Union[str, Path], **params) -> "CentralityPanel":
+        """저장된 패널을 읽습니다. 파일이 없거나 설정(params)이 다르면 빈 패널을 반환합니다."""
+        panel = cls(**params)
+        path = Path(path)
+        if path.exists():
+            with open(path, "rb") as f:
+                stored = pickle.load(f)
+            if isinstance(stored, cls) and stored.params() == panel.params():
+                return stored
+        return panel
+
+
+def centrality_array(frame: pd.DataFrame, measure: str, key_name: str = "year") -> pd.DataFrame:
+    """tidy 중심성 표를 셀 키 × 키워드 행렬로 바꿉니다 (노드가 아닌 칸은 0)."""
+    return frame.pivot(index=key_name, columns="keyword", values=measure).sort_index().fillna(0.0)
+
+
+def centrality_from_graphs(
+    graphs: Dict[Hashable, object],
+    measures: Sequence[str] = DEFAULT_MEASURES,
+    betweenness_samples: Optional[int] = None,
+    key_name: str = "year",
+) -> pd.DataFrame:
+    """{키: networkx.Graph} 의 셀별 중심성을 tidy 표로 계산합니다."""
+    panel = CentralityPanel(measures=measures, betweenness_samples=betweenness_samples)
+    panel.update_graphs(graphs)
+    return panel.to_frame(key_name)
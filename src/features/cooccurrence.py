@@ -0,0 +1,184 @@
+"""희소 행렬 기반 키워드 공출현(co-occurrence) 계산 모듈.
+
+기사별 키워드 목록을 문서×키워드 이진 희소 행렬 X 로 한 번만 인코딩하고,
+임의의 기사 부분집합(연도, 기업, 분기 등)에 대한 키워드×키워드 공출현 행렬을
+희소 행렬 곱(X.T @ X)으로 계산합니다. 월/분기 단위 이동 구간 공출현은 기간별 행렬을
+더하고 빼는 방식(rolling_cooccurrence)으로 갱신합니다.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from .keyword_sets import KeywordSets
+
+
+@dataclass
+class DocumentTermMatrix:
+    """문서×키워드 이진 희소 행렬과 키워드 사전."""
+
+    matrix: sparse.csr_matrix
+    vocabulary: List[str]
+
+    @classmethod
+    def from_keywords(
+        cls,
+        keyword_lists: Iterable[Iterable[str]],
+        vocabulary: Optional[Sequence[str]] = None,
+    ) -> "DocumentTermMatrix":
+        """기사별 키워드 목록으로부터 행렬을 생성합니다.
+
+        vocabulary 를 지정하면 해당 사전 밖의 키워드는 무시하고, 지정하지 않으면
+        등장한 키워드를 정렬해 사전을 만듭니다. 한 기사 내 중복 키워드는 1로 셉니다.
+        keyword_lists 로 KeywordSets 를 주면 문자열 리스트를 만들지 않고 번호 배열에서 바로 생성합니다.
+        """
+        if isinstance(keyword_lists, KeywordSets):
+            return cls.from_keyword_sets(keyword_lists, vocabulary)
+        keyword_lists = [list(keywords) if isinstance(keywords, (list, tuple, set, frozenset, np.ndarray)) else []
+                         for keywords in keyword_lists]
+        if vocabulary is None:
+            vocabulary = sorted({kw for keywords in keyword_lists for kw in keywords})
+        vocabulary = list(vocabulary)
+        index = {kw: i for i, kw in enumerate(vocabulary)}
+
+        indptr = np.zeros(len(keyword_lists) + 1, dtype=np.int64)
+        indices: List[int] = []
+        for row, keywords in enumerate(keyword_lists):
+            ids = {index[kw] for kw in keywords if kw in index}
+            indices.extend(sorted(ids))
+            indptr[row + 1] = len(indices)
+
+        data = np.ones(len(indices), dtype=np.int32)
+        matrix = sparse.csr_matrix(
+            (data, np.asarray(indices, dtype=np.int32), indptr),
+            shape=(len(keyword_lists), len(vocabulary)),
+        )
+        return cls(matrix=matrix, vocabulary=vocabulary)
+
+    @classmethod
+    def from_keyword_sets(
+        cls,
+        keyword_sets: KeywordSets,
+        vocabulary: Optional[Sequence[str]] = None,
+    ) -> "DocumentTermMatrix":
+        """KeywordSets 로부터 생성합니다 (`from_keywords` 와 같은 사전 규칙)."""
+        source = np.asarray(keyword_sets.vocabulary, dtype=object)
+        if vocabulary is None:
+            used = np.unique(keyword_sets.ids)
+            vocabulary = sorted(source[used].tolist())
+        vocabulary = list(vocabulary)
+        index = {kw: i for i, kw in enumerate(vocabulary)}
+        # 원래 사전 번호 -> 새 사전 번호 (-1: 사전 밖)
+        remap = np.fromiter((index.get(kw, -1) for kw in source), dtype=np.int64, count=len(source))
+        cols = remap[keyword_sets.ids.astype(np.int64)]
+        known = cols >= 0
+        matrix = sparse.csr_matrix(
+            (np.ones(known.sum(), dtype=np.int32), (keyword_sets.rows()[known], cols[known])),
+            shape=(len(keyword_sets), len(vocabulary)),
+        )
+        matrix.sum_duplicates()
+        matrix.data[:] = 1
+        return cls(matrix=matrix, vocabulary=vocabulary)
+
+    @property
+    def n_documents(self) -> int:
+        return self.matrix.shape[0]
+
+    def cooccurrence(self, rows=None) -> sparse.csr_matrix:
+        """선택한 기사들에 대한 키워드×키워드 공출현 행렬 (상삼각, 대각 제외).
+
+        rows 는 불리언 마스크 또는 행 번호 배열이며, None 이면 전체 기사를 사용합니다.
+        """
+        X = self.matrix if rows is None else self.matrix[np.asarray(rows)]
+        return cooccurrence_matrix(X)
+
+    def grouped_cooccurrence(self, keys) -> Dict[Hashable, sparse.csr_matrix]:
+        """그룹(예: 연도×기업)별 공출현 행렬을 한 번의 그룹 분할로 계산합니다.
+
+        keys 는 행과 같은 길이의 Series/배열 또는 여러 열의 DataFrame 이며,
+        DataFrame 이면 그룹 키는 열 값의 튜플이 됩니다. 키가 결측인 행은 제외됩니다.
+        """
+        if isinstance(keys, pd.DataFrame):
+            grouper = keys.reset_index(drop=True).groupby(list(keys.columns), sort=True, observed=True)
+        else:
+            grouper = pd.Series(np.asarray(keys)).groupby(np.asarray(keys), sort=True)
+        return {key: cooccurrence_matrix(self.matrix[positions])
+                for key, positions in grouper.indices.items()}
+
+
+def cooccurrence_matrix(X: sparse.spmatrix) -> sparse.csr_matrix:
+    """문서×키워드 이진 행렬로부터 상삼각(i < j) 공출현 빈도 행렬을 계산합니다."""
+    X = sparse.csr_matrix(X)
+    C = (X.T @ X).tocsr()
+    return sparse.triu(C, k=1, format="csr")
+
+
+def threshold_matrix(C: sparse.spmatrix, min_weight: int = 1) -> sparse.coo_matrix:
+    """min_weight 미만의 공출현을 제거한 COO 행렬을 반환합니다."""
+    C = sparse.coo_matrix(C)
+    keep = C.data >= min_weight
+    return sparse.coo_matrix((C.data[keep], (C.row[keep], C.col[keep])), shape=C.shape)
+
+
+def cooccurrence_to_edges(
+    C: sparse.spmatrix, vocabulary: Sequence[str], min_weight: int = 1
+) -> pd.DataFrame:
+    """공출현 행렬을 (source, target, weight) 엣지 리스트로 변환합니다."""
+    C = threshold_matrix(C, min_weight)
+    vocab = np.asarray(vocabulary, dtype=object)
+    return pd.DataFrame({
+        'source': vocab[C.row],
+        'target': vocab[C.col],
+        'weight': C.data.astype(np.int64),
+    })
+
+
+def cooccurrence_to_graph(
+    C: sparse.spmatrix, vocabulary: Sequence[str], min_weight: int = 1
+) -> nx.Graph:
+    """공출현 행렬을 가중 무방향 NetworkX 그래프로 변환합니다."""
+    C = threshold_matrix(C, min_weight)
+    G = nx.Graph()
+    G.add_weighted_edges_from(
+        zip((vocabulary[i] for i in C.row), (vocabulary[j] for j in C.col), C.data.tolist(), strict=True)
+    )
+    return G
+
+
+def rolling_cooccurrence(
+    period_matrices: Dict[Hashable, sparse.spmatrix],
+    periods: Sequence[Hashable],
+    window: int,
+    step: int = 1,
+) -> Iterator[Tuple[Hashable, Hashable, sparse.csr_matrix]]:
+    """기간별 공출현 행렬로 이동 구간(window 개 기간) 공출현 행렬을 차례로 계산합니다.
+
+    구간을 한 기간씩 옮길 때마다 새로 들어오는 기간의 행렬을 더하고 빠지는 기간의 행렬을
+    빼므로, 계산량은 구간 길이와 무관하게 기간 수에 비례합니다.
+
+    Parameters:
+    - period_matrices: {기간: 공출현 행렬} (모두 같은 사전/크기). 없는 기간은 0 으로 간주
+    - periods: 빠짐없이 정렬된 전체 기간 목록 (예: pd.period_range(..., freq='M'))
+    - window: 구간 길이(기간 수), step: 결과를 내보낼 간격(기간 수)
+
+    Yields:
+    - (구간 첫 기간, 구간 마지막 기간, 공출현 행렬). 기간 수가 window 보다 적으면 결과 없음
+    """
+    if window < 1 or step < 1:
+        raise ValueError(f"window 와 step 은 1 이상이어야 합니다: window={window}, step={step}")
+    periods = list(periods)
+    shape = next(iter(period_matrices.values())).shape if period_matrices else (0, 0)
+    empty = sparse.csr_matrix(shape, dtype=np.int64)
+    running = empty
+    for i, period in enumerate(periods):
+        running = running + period_matrices.get(period, empty)
+        if i >= window:
+            running = running - period_matrices.get(periods[i - window], empty)
+            running.eliminate_zeros()
+        first = i - window + 1
+        if first >= 0 and first % step == 0:
+            yield periods[first], period, running.tocsr()
@@ -0,0 +1,202 @@
+"""CPC(협력특허분류) 계층 색인과 기술 분류별 집계 모듈.
+
+`G11C   5/04` 같은 CPC 기호를 섹션(G) / 클래스(11) / 서브클래스(C) / 메인그룹(5) / 서브그룹(04)
+정수로 분해하고, 계층별 정수 코드를 상위 코드의 자릿수를 이어 붙이는 방식으로 만듭니다.
+따라서 상위 코드 하나는 서브그룹 코드의 연속 구간에 대응하며, 접두(예: 'G11C', 'G11C 7')
+검색은 정렬된 서브그룹 코드에 대한 이진 탐색 두 번으로 끝납니다.
+
+출원×CPC 표(`PatentCorpus.cpc_frame()`)의 기간×계층 코드별 고유 출원 수와 전년 대비 증가율은
+NumPy 정수 연산(bincount)으로 계산합니다.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+CPC_LEVELS = ("section", "class", "subclass", "group", "subgroup")
+SECTIONS = "ABCDEFGHY"
+# 계층별 하위 자리 크기: 코드(level) = 코드(상위 level) * 크기 + 해당 level 번호
+_RADIX = {"section": len(SECTIONS), "class": 100, "subclass": 26, "group": 10_000, "subgroup": 1_000_000}
+# 서브그룹은 소수처럼 비교하므로(5/025 < 5/04 < 5/1018) 오른쪽을 0 으로 채운 6자리 정수로 저장
+_SUBGROUP_DIGITS = 6
+_CPC_SYMBOL = re.compile(r"^\s*(?P<section>[A-HY])(?:(?P<class>\d{2})(?:(?P<subclass>[A-Z])"
+                         r"(?:\s*(?P<group>\d{1,4})(?:\s*/\s*(?P<subgroup>\d{1,6}))?)?)?)?\s*$")
+
+
+def _level_position(level: str) -> int:
+    if level not in CPC_LEVELS:
+        raise ValueError(f"알 수 없는 CPC 계층: {level} (가능한 값: {CPC_LEVELS})")
+    return CPC_LEVELS.index(level)
+
+
+def parse_cpc(symbols: Sequence[str]) -> pd.DataFrame:
+    """CPC 기호를 계층별 정수(section, class, subclass, group, subgroup)로 분해합니다.
+
+    섹션은 SECTIONS 의 위치, 서브클래스는 알파벳 위치(A=0), 서브그룹은 6자리로 오른쪽을 채운
+    정수입니다 (04 -> 40000). 'G11C' 처럼 중간까지만 있는 기호는 나머지를 0 으로,
+    해석할 수 없는 기호는 모든 값을 -1 로 둡니다. 공백 수와 대소문자 차이는 무시합니다.
+    """
+    parts = pd.Series(np.asarray(symbols, dtype=object)).astype(str).str.upper().str.extract(_CPC_SYMBOL)
+    valid = parts["section"].notna().to_numpy()
+    section = np.full(len(parts), -1, dtype=np.int64)
+    section[valid] = [SECTIONS.index(s) for s in parts.loc[valid, "section"]]
+    subclass = parts["subclass"].fillna("A").str.slice(0, 1).map(ord).to_numpy(dtype=np.int64) - ord("A")
+    subgroup = parts["subgroup"].fillna("0").str.ljust(_SUBGROUP_DIGITS, "0")
+    result = pd.DataFrame({
+        "section": section,
+        "class": pd.to_numeric(parts["class"]).fillna(0).to_numpy(dtype=np.int64),
+        "subclass": np.where(parts["subclass"].notna(), subclass, 0),
+        "group": pd.to_numeric(parts["group"]).fillna(0).to_numpy(dtype=np.int64),
+        "subgroup": pd.to_numeric(subgroup).to_numpy(dtype=np.int64),
+    })
+    result.loc[~valid, :] = -1
+    return result.astype({"section": np.int8, "class": np.int8, "subclass": np.int8,
+                          "group": np.int16, "subgroup": np.int32})
+
+
+def level_codes(parts: pd.DataFrame, level: str) -> np.ndarray:
+    """parse_cpc 결과에서 level 까지의 정수 코드 (무효 기호는 -1)."""
+    position = _level_position(level)
+    codes = np.zeros(len(parts), dtype=np.int64)
+    for name in CPC_LEVELS[:position + 1]:
+        codes = codes * _RADIX[name] + parts[name].to_numpy(dtype=np.int64)
+    return np.where(parts["section"].to_numpy() >= 0, codes, -1)
+
+
+def _decode(codes: np.ndarray, level: str) -> pd.DataFrame:
+    """level 코드를 다시 계층별 정수로 나눕니다 (하위 계층은 0)."""
+    position = _level_position(level)
+    codes = np.asarray(codes, dtype=np.int64)
+    parts = {name: np.zeros(len(codes), dtype=np.int64) for name in CPC_LEVELS}
+    for name in reversed(CPC_LEVELS[:position + 1]):
+        codes, parts[name] = np.divmod(codes, _RADIX[name])
+    return pd.DataFrame(parts)
+
+
+def _subgroup_text(subgroup: int) -> str:
+    return f"{subgroup:0{_SUBGROUP_DIGITS}d}".rstrip("0").ljust(2, "0")
+
+
+def level_labels(codes: np.ndarray, level: str) -> np.ndarray:
+    """level 코드의 표시용 기호 (예: subclass 'G11C', group 'G11C 5/00', subgroup 'G11C 5/04').
+
+    집계 결과의 열 이름처럼 고유 코드에 대해서만 호출하는 것을 전제로 합니다.
+    """
+    position = _level_position(level)
+    parts = _decode(codes, level)
+
+    def label(section: int, cls: int, subclass: int, group: int, subgroup: int) -> str:
+        text = SECTIONS[section]
+        if position >= 1:
+            text += f"{cls:02d}"
+        if position >= 2:
+            text += chr(ord("A") + subclass)
+        if position >= 3:
+            text += f" {group}/" + (_subgroup_text(subgroup) if position == 4 else "00")
+        return text
+
+    return np.array([label(*row) for row in zip(*(parts[name].tolist() for name in CPC_LEVELS), strict=True)],
+                    dtype=object)
+
+
+@dataclass
+class CPCIndex:
+    """cpc_id(= symbols 의 위치)별 CPC 계층 정수와 접두 검색용 정렬 색인."""
+
+    symbols: np.ndarray
+    parts: pd.DataFrame
+    order: np.ndarray
+    sorted_codes: np.ndarray
+
+    @classmethod
+    def from_symbols(cls, symbols: Sequence[str]) -> "CPCIndex":
+        symbols = np.asarray(symbols, dtype=object)
+        parts = parse_cpc(symbols)
+        codes = level_codes(parts, "subgroup")
+        order = np.argsort(codes, kind="stable")
+        return cls(symbols, parts, order, codes[order])
+
+    @classmethod
+    def from_corpus(cls, corpus) -> "CPCIndex":
+        """PatentCorpus 의 cpc_symbols 표(cpc_id 는 0 부터 연속)로 생성합니다."""
+        return cls.from_symbols(corpus.cpc_symbols.sort_values("cpc_id")["cpc_symbol"].to_numpy())
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def codes(self, level: str) -> np.ndarray:
+        """cpc_id 별 level 코드 (무효 기호는 -1). `index.codes('group')[cpc_ids]` 처럼 사용합니다."""
+        return level_codes(self.parts, level)
+
+    def _prefix_range(self, prefix: str) -> Tuple[int, int]:
+        """접두에 속하는 서브그룹 코드 구간 [first, stop)."""
+        match = _CPC_SYMBOL.match(prefix.upper())
+        if match is None:
+            raise ValueError(f"CPC 접두를 해석할 수 없습니다: {prefix!r}")
+        level = [name for name in CPC_LEVELS if match.group(name) is not None][-1]
+        width = int(np.prod([_RADIX[name] for name in CPC_LEVELS[_level_position(level) + 1:]], dtype=np.int64))
+        first = int(level_codes(parse_cpc([prefix]), level)[0]) * width
+        return first, first + width
+
+    def prefix(self, prefix: str) -> np.ndarray:
+        """접두(섹션/클래스/서브클래스/메인그룹/서브그룹)에 속하는 cpc_id 배열 (계층 순서)."""
+        first, stop = self._prefix_range(prefix)
+        lo, hi = np.searchsorted(self.sorted_codes, [first, stop])
+        return self.order[lo:hi]
+
+    def prefix_mask(self, prefix: str) -> np.ndarray:
+        """cpc_id 별 접두 포함 여부 (길이 len(index) 의 불리언 배열)."""
+        mask = np.zeros(len(self), dtype=bool)
+        mask[self.prefix(prefix)] = True
+        return mask
+
+
+def cpc_counts(
+    frame: pd.DataFrame,
+    index: CPCIndex,
+    level: str = "subclass",
+    period: str = "appln_filing_year",
+    prefix: Optional[str] = None,
+) -> pd.DataFrame:
+    """기간(행) × level CPC 코드(열)별 고유 출원 수.
+
+    Parameters:
+    - frame: appln_id, cpc_id, period 컬럼을 가진 출원×CPC 표 (`PatentCorpus.cpc_frame()`)
+    - index: cpc_id 를 해석할 CPCIndex
+    - level: 집계 계층 (CPC_LEVELS)
+    - period: 정수 기간 컬럼. 결과 행은 최소~최대 기간을 빠짐없이 포함(없는 기간은 0)
+    - prefix: 지정하면 해당 접두에 속하는 코드만 집계 (예: 'G11C')
+
+    한 출원이 같은 상위 코드 아래 여러 CPC 를 가져도 1건으로 셉니다. 열 이름은 level_labels 기호이며,
+    열 순서는 CPC 계층 순서입니다.
+    """
+    cpc_ids = frame["cpc_id"].to_numpy(dtype=np.int64)
+    codes = index.codes(level)[cpc_ids]
+    periods = pd.to_numeric(frame[period])
+    keep = (codes >= 0) & periods.notna().to_numpy()
+    if prefix is not None:
+        keep &= index.prefix_mask(prefix)[cpc_ids]
+    pairs = pd.DataFrame({"appln_id": frame["appln_id"].to_numpy()[keep], "code": codes[keep],
+                          "period": periods.to_numpy()[keep].astype(np.int64)})
+    pairs = pairs[~pairs.duplicated(["appln_id", "code"])]
+
+    if pairs.empty:
+        return pd.DataFrame(np.zeros((0, 0), dtype=np.int64), index=pd.Index([], name=period),
+                            columns=pd.Index([], name=level))
+    column, unique_codes = pd.factorize(pairs["code"], sort=True)
+    first = int(pairs["period"].min())
+    n_periods = int(pairs["period"].max()) - first + 1
+    counts = np.bincount((pairs["period"].to_numpy() - first) * len(unique_codes) + column,
+                         minlength=n_periods * len(unique_codes)).reshape(n_periods, len(unique_codes))
+    return pd.DataFrame(counts,
+                        index=pd.RangeIndex(first, first + n_periods, name=period),
+                        columns=pd.Index(level_labels(unique_codes, level), name=level))
+
+
+def cpc_growth(counts: pd.DataFrame, periods: int = 1) -> pd.DataFrame:
+    """cpc_counts 결과의 전기 대비 증가율 ((현재 - 이전) / 이전). 이전 값이 0 이면 NaN."""
+    previous = counts.shift(periods)
+    return (counts - previous) / previous.where(previous > 0)
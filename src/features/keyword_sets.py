@@ -0,0 +1,142 @@
+"""기사별 키워드 집합의 압축 표현 모듈.
+
+기사마다 파이썬 문자열 리스트를 두는 대신, CSR 형식의 NumPy 배열 두 개
+(indptr: 기사별 시작 위치, ids: 키워드 번호)와 키워드 사전으로 보관합니다.
+키워드 사전이 32767개 이하이면 ids 는 int16, 전체 키워드 수가 2^31 미만이면 indptr 은
+int32 를 사용하므로 기사 500만 건(기사당 키워드 5개)이 수십 MB 에 들어갑니다.
+문자열 변환은 화면 출력 등 필요한 행에 대해서만 수행합니다.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def _ids_dtype(n_keywords: int) -> np.dtype:
+    return np.dtype(np.int16 if n_keywords <= np.iinfo(np.int16).max + 1 else np.int32)
+
+
+def _indptr_dtype(n_ids: int) -> np.dtype:
+    return np.dtype(np.int32 if n_ids <= np.iinfo(np.int32).max else np.int64)
+
+
+@dataclass
+class KeywordSets:
+    """기사별 키워드 번호 목록 (CSR: ids[indptr[i]:indptr[i + 1]] 가 i 번째 기사의 키워드)."""
+
+    indptr: np.ndarray
+    ids: np.ndarray
+    vocabulary: Tuple[str, ...]
+
+    @classmethod
+    def from_lists(
+        cls,
+        keyword_lists: Iterable[Iterable[str]],
+        vocabulary: Optional[Sequence[str]] = None,
+    ) -> "KeywordSets":
+        """기사별 키워드 목록으로부터 생성합니다.
+
+        vocabulary 를 지정하면 사전 밖의 키워드는 무시하고, 지정하지 않으면 등장한 순서대로
+        사전을 만듭니다. 기사 안의 키워드 순서는 유지하고 중복은 한 번만 남깁니다.
+        """
+        index: Dict[str, int] = {} if vocabulary is None else {kw: i for i, kw in enumerate(vocabulary)}
+        grow = vocabulary is None
+        lengths: List[int] = []
+        ids: List[int] = []
+        for keywords in keyword_lists:
+            start = len(ids)
+            seen = set()
+            for kw in keywords if isinstance(keywords, (list, tuple, set, frozenset, np.ndarray)) else ():
+                i = index.setdefault(kw, len(index)) if grow else index.get(kw)
+                if i is not None and i not in seen:
+                    seen.add(i)
+                    ids.append(i)
+            lengths.append(len(ids) - start)
+        vocabulary = tuple(index) if grow else tuple(vocabulary)
+        return cls.from_lengths(np.asarray(lengths, dtype=np.int64), np.asarray(ids, dtype=np.int64), vocabulary)
+
+    @classmethod
+    def from_lengths(cls, lengths: np.ndarray, ids: np.ndarray, vocabulary: Sequence[str]) -> "KeywordSets":
+        """기사별 키워드 수와 이어 붙인 키워드 번호로 생성합니다 (dtype 은 자동으로 축소)."""
+        indptr = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+        return cls(indptr.astype(_indptr_dtype(len(ids))),
+                   np.asarray(ids).astype(_ids_dtype(len(vocabulary))), tuple(vocabulary))
+
+    @classmethod
+    def concat(cls, parts: Sequence["KeywordSets"]) -> "KeywordSets":
+        """같은 사전을 쓰는 KeywordSets 들을 행 방향으로 이어 붙입니다."""
+        if not parts:
+            return cls.from_lists([], vocabulary=())
+        vocabulary = parts[0].vocabulary
+        if any(part.vocabulary != vocabulary for part in parts[1:]):
+            raise ValueError("키워드 사전이 다른 KeywordSets 는 이어 붙일 수 없습니다.")
+        return cls.from_lengths(np.concatenate([part.counts() for part in parts]),
+                                np.concatenate([part.ids for part in parts]), vocabulary)
+
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
+
+    def __getitem__(self, row: int) -> List[str]:
+        """row 번째 기사의 키워드 문자열 목록 (출력용)."""
+        return [self.vocabulary[i] for i in self.ids[self.indptr[row]:self.indptr[row + 1]]]
+
+    @property
+    def nbytes(self) -> int:
+        return self.indptr.nbytes + self.ids.nbytes
+
+    def counts(self) -> np.ndarray:
+        """기사별 키워드 수."""
+        return np.diff(self.indptr).astype(np.int64)
+
+    def rows(self) -> np.ndarray:
+        """ids 원소별 기사 번호 (COO 행 번호)."""
+        return np.repeat(np.arange(len(self)), self.counts())
+
+    def subset(self, rows) -> "KeywordSets":
+        """불리언 마스크 또는 행 번호 배열로 고른 기사들 (순서 유지)."""
+        rows = np.asarray(rows)
+        rows = np.flatnonzero(rows) if rows.dtype == bool else rows.astype(np.int64)
+        starts = self.indptr[rows].astype(np.int64)
+        lengths = self.indptr[rows + 1].astype(np.int64) - starts
+        # 각 기사 구간 [start, start + length) 를 한 번에 펼친 위치 배열
+        offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        return KeywordSets.from_lengths(lengths, self.ids[np.repeat(starts, lengths) + offsets],
+                                        self.vocabulary)
+
+    def where(self, frame: pd.DataFrame, **conditions) -> "KeywordSets":
+        """frame(기사와 같은 행 순서)의 컬럼 조건으로 기사를 고릅니다.
+
+        값이 리스트/튜플/집합/range 이면 포함 여부로 비교합니다. 예: `where(df, year=2024, company='Samsung')`
+        """
+        mask = np.ones(len(self), dtype=bool)
+        for column, value in conditions.items():
+            values = frame[column]
+            if isinstance(value, (list, tuple, set, frozenset, range)):
+                mask &= values.isin(list(value)).to_numpy()
+            else:
+                mask &= (values == value).to_numpy()
+        return self.subset(mask)
+
+    def split(self, keys) -> Dict[Hashable, "KeywordSets"]:
+        """그룹(예: 연도, 연도×기업)별 KeywordSets. keys 는 Series 또는 여러 열의 DataFrame 입니다."""
+        if isinstance(keys, pd.DataFrame):
+            grouper = keys.reset_index(drop=True).groupby(list(keys.columns), sort=True, observed=True)
+        else:
+            grouper = pd.Series(np.asarray(keys)).groupby(np.asarray(keys), sort=True)
+        return {key: self.subset(positions) for key, positions in grouper.indices.items()}
+
+    def to_lists(self, rows=None) -> List[List[str]]:
+        """기사별 키워드 문자열 목록 (출력/호환용, rows 로 일부만 변환 가능)."""
+        target = self if rows is None else self.subset(rows)
+        vocab = np.asarray(target.vocabulary, dtype=object)
+        return [vocab[target.ids[start:end]].tolist()
+                for start, end in zip(target.indptr[:-1].tolist(), target.indptr[1:].tolist(), strict=True)]
+
+    def frequencies(self) -> pd.Series:
+        """키워드별 등장 기사 수 (많은 순)."""
+        counts = np.bincount(self.ids.astype(np.int64), minlength=len(self.vocabulary))
+        return (pd.Series(counts, index=pd.Index(self.vocabulary, name="keyword"), name="articles")
+                .sort_values(ascending=False, kind="stable"))
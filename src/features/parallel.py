@@ -0,0 +1,157 @@
+"""멀티프로세스 키워드 추출 모듈.
+
+기사 목록을 연속된 샤드(chunk)로 나누어 `ProcessPoolExecutor` 워커에 분배하고,
+결과를 원래 순서대로 이어 붙입니다. 키워드 사전은 워커 초기화 시 한 번만 전달해
+워커마다 매처를 한 번 컴파일하며, 각 작업에는 텍스트 샤드만 직렬화(pickle)됩니다.
+"""
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from .keyword_sets import KeywordSets
+from .keywords import TECH_KEYWORDS, KeywordMatcher, build_matcher
+
+# 워커당 샤드 수. 여러 샤드로 나누어 워커 간 부하를 고르게 합니다.
+SHARDS_PER_WORKER = 4
+# 샤드 최소 크기. 작업 단위 직렬화/전송 비용을 기사 여러 건에 나누어 부담합니다.
+MIN_CHUNKSIZE = 512
+
+_worker_matcher: Optional[KeywordMatcher] = None
+
+
+def resolve_workers(workers: Optional[int] = None) -> int:
+    """워커 수를 정합니다. None 또는 0 이하이면 CPU 코어 수를 사용합니다."""
+    if workers is None or workers <= 0:
+        workers = os.cpu_count() or 1
+    return workers
+
+
+def shard(items: Sequence, workers: int, chunksize: Optional[int] = None) -> List[Sequence]:
+    """items 를 원래 순서를 유지하는 연속 구간으로 나눕니다."""
+    if chunksize is None:
+        chunksize = max(MIN_CHUNKSIZE, math.ceil(len(items) / (workers * SHARDS_PER_WORKER)))
+    return [items[i:i + chunksize] for i in range(0, len(items), chunksize)]
+
+
+def map_shards(
+    func: Callable[[Sequence], list],
+    items: Iterable,
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    initializer: Optional[Callable] = None,
+    initargs: Tuple = (),
+) -> list:
+    """샤드 단위 함수 func 를 병렬 실행하고 결과를 원래 순서대로 이어 붙입니다.
+
+    func 는 샤드(리스트)를 받아 같은 길이의 결과 리스트를 반환하는 모듈 수준 함수여야 합니다.
+    워커가 1개이거나 샤드가 하나뿐이면 현재 프로세스에서 실행합니다.
+    """
+    items = list(items)
+    workers = resolve_workers(workers)
+    shards = shard(items, workers, chunksize)
+    if workers == 1 or len(shards) <= 1:
+        if initializer is not None:
+            initializer(*initargs)
+        return [result for part in shards for result in func(part)]
+
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(shards)), initializer=initializer, initargs=initargs
+    ) as executor:
+        return [result for part in executor.map(func, shards) for result in part]
+
+
+def _init_matcher(keywords: Tuple[str, ...], case_sensitive: bool) -> None:
+    global _worker_matcher
+    _worker_matcher = build_matcher(keywords, case_sensitive=case_sensitive)
+
+
+def _extract_shard(texts: Sequence[str]) -> List[List[str]]:
+    return [_worker_matcher.extract(text) for text in texts]
+
+
+def _extract_ids_shard(texts: Sequence[str]) -> List[KeywordSets]:
+    # 샤드 전체를 하나의 KeywordSets 로 반환해 문자열 리스트 직렬화를 피합니다.
+    matcher = _worker_matcher
+    lengths = np.zeros(len(texts), dtype=np.int64)
+    ids: List[int] = []
+    for row, text in enumerate(texts):
+        found = matcher.extract_ids(text)
+        lengths[row] = len(found)
+        ids.extend(found)
+    return [KeywordSets.from_lengths(lengths, np.asarray(ids, dtype=np.int64), matcher.keywords)]
+
+
+def _count_shard(texts: Sequence[str]) -> List[sparse.csr_matrix]:
+    # 샤드 전체를 하나의 희소 행렬로 반환해 결과 직렬화 비용을 줄입니다.
+    matcher = _worker_matcher
+    n_terms = len(matcher.keywords)
+    indptr = [0]
+    indices: List[int] = []
+    data: List[int] = []
+    for text in texts:
+        for j, n in enumerate(matcher.count(text).values()):
+            if n:
+                indices.append(j)
+                data.append(n)
+        indptr.append(len(indices))
+    return [sparse.csr_matrix(
+        (np.asarray(data, dtype=np.int32), np.asarray(indices, dtype=np.int32),
+         np.asarray(indptr, dtype=np.int64)),
+        shape=(len(texts), n_terms),
+    )]
+
+
+def extract_keywords_parallel(
+    texts: Iterable[str],
+    keywords: Sequence[str] = TECH_KEYWORDS,
+    case_sensitive: bool = False,
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+) -> List[List[str]]:
+    """기사별 등장 키워드 목록(`KeywordMatcher.extract`)을 병렬로 구합니다."""
+    return map_shards(_extract_shard, texts, workers, chunksize,
+                      initializer=_init_matcher, initargs=(tuple(keywords), case_sensitive))
+
+
+def extract_keyword_sets_parallel(
+    texts: Iterable[str],
+    keywords: Sequence[str] = TECH_KEYWORDS,
+    case_sensitive: bool = False,
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+) -> KeywordSets:
+    """`extract_keywords_parallel` 과 같은 결과를 압축 표현(KeywordSets)으로 구합니다.
+
+    사전은 중복을 제거한 키워드 순서(`KeywordMatcher.keywords`)입니다.
+    """
+    keywords = tuple(keywords)
+    parts = map_shards(_extract_ids_shard, texts, workers, chunksize,
+                       initializer=_init_matcher, initargs=(keywords, case_sensitive))
+    if not parts:
+        return KeywordSets.from_lists([], vocabulary=build_matcher(keywords, case_sensitive=case_sensitive).keywords)
+    return KeywordSets.concat(parts)
+
+
+def count_keywords_parallel(
+    texts: Iterable[str],
+    keywords: Sequence[str],
+    case_sensitive: bool = False,
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+) -> sparse.csr_matrix:
+    """기사×키워드 빈도(`KeywordMatcher.count`) 희소 행렬을 병렬로 구합니다.
+
+    열 순서는 중복을 제거한 키워드 순서(`KeywordMatcher.keywords`)와 같습니다.
+    """
+    keywords = tuple(keywords)
+    parts = map_shards(_count_shard, texts, workers, chunksize,
+                       initializer=_init_matcher, initargs=(keywords, case_sensitive))
+    n_terms = len(build_matcher(keywords, case_sensitive=case_sensitive).keywords)
+    if not parts:
+        return sparse.csr_matrix((0, n_terms), dtype=np.int32)
+    return sparse.vstack(parts, format="csr")
@@ -0,0 +1,45 @@
+"""문장 단위 테이블 변환 모듈.
+
+기사 텍스트를 벡터화된 `str.split`/`explode` 로 한 번에 문장 테이블로 펼쳐,
+문장 단위 패턴 탐색(마일스톤 추출 등)을 행 반복 없이 수행할 수 있게 합니다.
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+# 문장 경계: 마침표/느낌표/물음표 뒤 공백. 캡처 그룹으로 분할해 경계 길이를 보존합니다.
+SENTENCE_BOUNDARY = re.compile(r"([.!?]\s+)")
+
+SENTENCE_COLUMNS = ["row", "sentence_id", "offset", "sentence"]
+
+
+def sentence_table(texts: pd.Series) -> pd.DataFrame:
+    """기사 텍스트를 문장 테이블로 펼칩니다.
+
+    반환 컬럼:
+    - row: texts 에서의 위치(0부터)
+    - sentence_id: 기사 내 문장 순번
+    - offset: 기사 텍스트에서 문장이 시작하는 문자 위치
+    - sentence: 문장 (`re.split(r'[.!?]\\s+', text)` 결과와 같음)
+    """
+    texts = pd.Series(texts).fillna("").astype(str).reset_index(drop=True)
+    if texts.empty:
+        return pd.DataFrame({col: pd.Series(dtype=dtype) for col, dtype in
+                             zip(SENTENCE_COLUMNS, ["int64", "int64", "int64", "str"], strict=True)})
+
+    # [문장, 경계, 문장, 경계, ..., 문장] 순으로 펼쳐지므로 짝수 번째 조각이 문장입니다.
+    pieces = texts.str.split(SENTENCE_BOUNDARY, regex=True).explode()
+    row = pieces.index.to_numpy()
+    position = pieces.groupby(row).cumcount().to_numpy()
+    lengths = pieces.str.len().to_numpy(dtype=np.int64)
+    ends = pd.Series(lengths).groupby(row).cumsum().to_numpy()
+
+    keep = position % 2 == 0
+    return pd.DataFrame({
+        "row": row[keep].astype(np.int64),
+        "sentence_id": (position[keep] // 2).astype(np.int64),
+        "offset": (ends - lengths)[keep],
+        "sentence": pieces.to_numpy()[keep],
+    })
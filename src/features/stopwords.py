@@ -0,0 +1,90 @@
+"""불용어 사전 지연 로딩 모듈.
+
+불용어는 처음 사용할 때 한 번만 읽고 언어별 frozenset 으로 메모리에 보관합니다.
+조회 순서는 다음과 같습니다.
+
+1. 디스크 캐시 (`data/interim/stopwords/{language}.txt`, 한 줄에 한 단어)
+2. NLTK stopwords 코퍼스 (필요하면 다운로드를 한 번 시도하고, 성공하면 캐시에 기록)
+3. 둘 다 불가능하면(오프라인 등) 경고 후 빈 사전
+
+같은 디렉토리의 단어 사전(예: 한국어 명사 사전 korean_nouns.txt)은 `load_lexicon` 으로 읽습니다.
+
+NLTK 는 2단계에서만 import 하므로 패키지를 import 하거나 워커 프로세스를 띄울 때는
+NLTK import/다운로드 비용이 들지 않습니다.
+"""
+
+import io
+import warnings
+from functools import lru_cache
+from pathlib import Path
+from typing import FrozenSet, Optional, Union
+
+STOPWORDS_DIR = Path(__file__).resolve().parents[2] / "data" / "interim" / "stopwords"
+
+
+def _read_cache(path: Path) -> FrozenSet[str]:
+    with open(path, encoding="utf-8") as f:
+        return frozenset(line.strip() for line in f if line.strip())
+
+
+def _write_cache(path: Path, words: FrozenSet[str]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write("\n".join(sorted(words)) + "\n")
+        tmp.replace(path)
+    except OSError:  # 읽기 전용 환경 등: 캐시 없이 계속 진행
+        pass
+
+
+def _nltk_stopwords(language: str) -> Optional[FrozenSet[str]]:
+    try:
+        import nltk
+        from nltk.corpus import stopwords
+    except ImportError:
+        return None
+    try:
+        return frozenset(stopwords.words(language))
+    except LookupError:
+        pass
+    except OSError:  # 코퍼스는 있으나 해당 언어 파일이 없는 경우
+        return None
+    if not nltk.download("stopwords", quiet=True, raise_on_error=False, print_error_to=io.StringIO()):
+        return None
+    try:
+        return frozenset(stopwords.words(language))
+    except (LookupError, OSError):
+        return None
+
+
+@lru_cache(maxsize=None)
+def _load(language: str, cache_dir: Path) -> FrozenSet[str]:
+    path = cache_dir / f"{language}.txt"
+    if path.exists():
+        return _read_cache(path)
+    words = _nltk_stopwords(language)
+    if words is None:
+        warnings.warn(f"'{language}' 불용어를 찾을 수 없어 빈 사전을 사용합니다 ({path} 에 추가할 수 있습니다).")
+        return frozenset()
+    _write_cache(path, words)
+    return words
+
+
+def load_stopwords(language: str, cache_dir: Optional[Union[str, Path]] = None) -> FrozenSet[str]:
+    """언어별 불용어 집합을 반환합니다. 같은 언어는 프로세스당 한 번만 읽습니다."""
+    return _load(language, Path(cache_dir) if cache_dir else STOPWORDS_DIR)
+
+
+@lru_cache(maxsize=None)
+def _load_lexicon(name: str, cache_dir: Path) -> FrozenSet[str]:
+    path = cache_dir / f"{name}.txt"
+    if not path.exists():
+        warnings.warn(f"단어 사전 {path} 가 없어 빈 사전을 사용합니다.")
+        return frozenset()
+    return _read_cache(path)
+
+
+def load_lexicon(name: str, cache_dir: Optional[Union[str, Path]] = None) -> FrozenSet[str]:
+    """불용어 디렉토리의 단어 사전(`{name}.txt`, 한 줄에 한 단어)을 반환합니다 (NLTK 조회 없음)."""
+    return _load_lexicon(name, Path(cache_dir) if cache_dir else STOPWORDS_DIR)
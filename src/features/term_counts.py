@@ -0,0 +1,120 @@
+"""기사×용어 빈도 행렬 모듈.
+
+트렌드/감성/기술-사회 영향 분석에서 사용하는 사전 용어의 합집합에 대해
+기사별 출현 빈도를 희소 행렬로 한 번만 계산하고, 월/분기/연도 등 임의의
+그룹 집계는 이 행렬의 그룹 합(group-by sum)으로 구합니다.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from .keywords import build_matcher
+from .parallel import count_keywords_parallel
+
+
+@dataclass
+class TermCountMatrix:
+    """기사×용어 빈도 희소 행렬과 용어 사전."""
+
+    matrix: sparse.csr_matrix
+    vocabulary: List[str]
+
+    @classmethod
+    def from_texts(
+        cls,
+        texts: Iterable[str],
+        vocabulary: Sequence[str],
+        case_sensitive: bool = False,
+        workers: Optional[int] = 1,
+    ) -> "TermCountMatrix":
+        """기사 텍스트에서 사전 용어별 빈도(`str.count` 와 같은 비중첩 빈도)를 셉니다.
+
+        workers 가 1보다 크거나 None 이면 기사를 샤드로 나누어 여러 프로세스에서 셉니다.
+        """
+        vocabulary = list(build_matcher(vocabulary, case_sensitive=case_sensitive).keywords)
+        matrix = count_keywords_parallel(texts, vocabulary, case_sensitive=case_sensitive, workers=workers)
+        return cls(matrix=matrix, vocabulary=vocabulary)
+
+    @classmethod
+    def from_tokens(
+        cls,
+        token_lists: Iterable[Iterable[str]],
+        vocabulary: Optional[Sequence[str]] = None,
+    ) -> "TermCountMatrix":
+        """기사별 토큰 목록(예: `tokenize_articles` 결과)에서 토큰 빈도를 셉니다.
+
+        부분 문자열이 아닌 토큰 단위로 세며, vocabulary 를 지정하지 않으면 등장한 토큰을
+        정렬해 사전을 만듭니다.
+        """
+        token_lists = [list(tokens) for tokens in token_lists]
+        if vocabulary is None:
+            vocabulary = sorted({token for tokens in token_lists for token in tokens})
+        vocabulary = list(dict.fromkeys(vocabulary))
+        index = {term: i for i, term in enumerate(vocabulary)}
+
+        rows = np.repeat(np.arange(len(token_lists)), [len(tokens) for tokens in token_lists])
+        cols = np.fromiter((index.get(token, -1) for tokens in token_lists for token in tokens),
+                           dtype=np.int64, count=len(rows))
+        known = cols >= 0
+        matrix = sparse.csr_matrix(
+            (np.ones(known.sum(), dtype=np.int32), (rows[known], cols[known])),
+            shape=(len(token_lists), len(vocabulary)),
+        )
+        matrix.sum_duplicates()
+        return cls(matrix=matrix, vocabulary=vocabulary)
+
+    @property
+    def n_documents(self) -> int:
+        return self.matrix.shape[0]
+
+    def term_indices(self, terms: Sequence[str]) -> np.ndarray:
+        index = {term: i for i, term in enumerate(self.vocabulary)}
+        missing = [term for term in terms if term not in index]
+        if missing:
+            raise KeyError(f"사전에 없는 용어입니다: {missing}")
+        return np.asarray([index[term] for term in terms], dtype=np.int64)
+
+    def counts(self, terms: Sequence[str], rows=None) -> sparse.csr_matrix:
+        """선택한 기사(rows)×용어(terms) 부분 행렬."""
+        X = self.matrix if rows is None else self.matrix[np.asarray(rows)]
+        return X[:, self.term_indices(terms)]
+
+    def total(self, terms: Sequence[str], rows=None) -> np.ndarray:
+        """기사별로 terms 빈도를 합한 배열 (예: 감성 사전 전체 빈도)."""
+        return np.asarray(self.counts(terms, rows).sum(axis=1)).ravel()
+
+    def inverted_index(self, terms: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+        """용어 -> 해당 용어가 한 번 이상 등장한 기사 행 번호(오름차순) 역색인."""
+        terms = list(self.vocabulary) if terms is None else list(terms)
+        X = sparse.csc_matrix(self.matrix[:, self.term_indices(terms)])
+        X.sort_indices()
+        return {term: X.indices[X.indptr[j]:X.indptr[j + 1]].astype(np.int64)
+                for j, term in enumerate(terms)}
+
+    def aggregate(self, keys, terms: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """그룹별 용어 빈도 합계.
+
+        keys 는 행과 같은 길이의 Series 또는 여러 열의 DataFrame 입니다.
+        그룹 지시 행렬(그룹×기사)과 빈도 행렬의 곱으로 계산하며, 결과의 인덱스는
+        정렬된 그룹 키, 컬럼은 terms (기본값: 전체 사전) 입니다.
+        """
+        terms = list(self.vocabulary) if terms is None else list(terms)
+        if isinstance(keys, pd.DataFrame):
+            grouper = keys.reset_index(drop=True).groupby(list(keys.columns), sort=True, observed=True)
+        else:
+            keys = pd.Series(np.asarray(keys), name=getattr(keys, "name", None))
+            grouper = keys.groupby(keys, sort=True, observed=True)
+        codes = grouper.ngroup().to_numpy()
+        group_index = grouper.size().index
+
+        valid = codes >= 0
+        indicator = sparse.csr_matrix(
+            (np.ones(valid.sum(), dtype=np.int64), (codes[valid], np.flatnonzero(valid))),
+            shape=(len(group_index), self.n_documents),
+        )
+        sums = (indicator @ self.matrix[:, self.term_indices(terms)]).toarray()
+        return pd.DataFrame(sums, index=group_index, columns=terms)
@@ -1,17 +1,16 @@
 """텍스트 전처리 관련 함수 모음."""
 
+import hashlib
 import re
-from dataclasses import dataclass
-from typing import Iterable, List
+from dataclasses import dataclass, field
+from typing import Callable, ClassVar, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
 
-import nltk
-from nltk.corpus import stopwords
+from .parallel import map_shards
+from .stopwords import load_lexicon, load_stopwords
 
-# 필요한 리소스가 없는 경우 자동 다운로드
-try:  # pragma: no cover - 런타임에서만 실행
-    stopwords.words("english")
-except LookupError:  # pragma: no cover
-    nltk.download("stopwords", quiet=True)
+_NUMBERS = re.compile(r"\d+")
+# clean_many 에서 문서를 이어 붙일 때 쓰는 구분자 (단어 문자가 아니므로 토큰에 섞이지 않음)
+_DOC_SEPARATOR = "\x00"
 
 
 @dataclass
@@ -22,27 +21,265 @@ class TextPreprocessor:
     min_token_length: int = 2
 
     def __post_init__(self):
-        self._stopwords = set()
-        for lang in self.languages:
-            try:
-                self._stopwords.update(stopwords.words(lang))
-            except OSError:
-                nltk.download("stopwords", quiet=True)
-                self._stopwords.update(stopwords.words(lang))
+        self.languages = tuple(self.languages)
+        self._stopwords: Optional[FrozenSet[str]] = None
+        self._compile()
 
-    def clean(self, text: str) -> str:
+    @property
+    def stopwords(self) -> FrozenSet[str]:
+        """불용어 집합. 처음 사용할 때 언어별 사전을 읽습니다 (`load_stopwords`)."""
+        if self._stopwords is None:
+            self._stopwords = frozenset().union(*(load_stopwords(lang) for lang in self.languages))
+        return self._stopwords
+
+    def _compile(self) -> None:
+        # `\b\w+\b` 토큰 중 min_token_length 미만을 버리는 것과 같은 패턴
+        self._token = re.compile(r"\b\w{%d,}\b" % max(1, self.min_token_length))
+        # 토큰 경계가 되는 문자: 단어 문자(\w)가 아닌 문자와, 숫자 제거 시 숫자
+        boundary = re.compile(r"\W|\d" if self.remove_numbers else r"\W")
+        # ASCII 경계 문자는 UTF-8 바이트 변환표 한 번으로 공백으로 바꿉니다 (구분자는 유지).
+        self._ascii_table = bytes(
+            32 if i and boundary.fullmatch(chr(i)) else i for i in range(128)
+        ) + bytes(range(128, 256))
+        # 비ASCII 경계 문자(문장 부호, 전각 숫자 등)는 버퍼에 실제로 있는 것만 치환합니다.
+        self._non_ascii_boundaries = [re.compile(r"[^\x00-\x7f\w]")]
+        if self.remove_numbers:
+            self._non_ascii_boundaries.append(re.compile(r"[^\x00-\x7f\D]"))
+
+    def _normalize(self, text: str) -> str:
         if self.lowercase:
             text = text.lower()
         if self.remove_numbers:
-            text = re.sub(r"\d+", " ", text)
-        tokens = [
-            token
-            for token in re.findall(r"\b\w+\b", text)
-            if len(token) >= self.min_token_length and token not in self._stopwords
-        ]
-        return " ".join(tokens)
+            text = _NUMBERS.sub(" ", text)
+        return text
+
+    def tokens(self, text: str) -> List[str]:
+        """문서 하나의 정제된 토큰 목록."""
+        stop = self.stopwords
+        return [token for token in self._token.findall(self._normalize(text)) if token not in stop]
+
+    def clean(self, text: str) -> str:
+        return " ".join(self.tokens(text))
+
+    def clean_many(
+        self,
+        texts: Iterable[str],
+        return_tokens: bool = False,
+        workers: Optional[int] = 1,
+    ) -> Union[List[str], List[List[str]]]:
+        """여러 문서를 한 번에 정제합니다. 결과는 `clean` (또는 `tokens`) 과 같습니다.
+
+        문서들을 구분자로 이어 붙인 하나의 버퍼에 소문자 변환, 경계 문자(비단어 문자/숫자)의
+        공백 치환, 공백 분할을 각각 한 번씩 적용해 문서별 정규식 호출을 없앱니다.
+        workers 가 1보다 크거나 None 이면 문서를 샤드로 나누어 여러 프로세스에서 처리합니다.
+        문자열이 아닌 값은 빈 문서로 취급합니다.
+        """
+        texts = [text if isinstance(text, str) else "" for text in texts]
+        if workers != 1:
+            return map_shards(_clean_shard, texts, workers,
+                              initializer=_init_preprocessor, initargs=(self, return_tokens))
+        return self._clean_buffer(texts, return_tokens)
+
+    def _clean_buffer(self, texts: List[str], return_tokens: bool) -> Union[List[str], List[List[str]]]:
+        if not texts:
+            return []
+        buffer = _DOC_SEPARATOR.join(texts)
+        if buffer.count(_DOC_SEPARATOR) != len(texts) - 1:
+            # 원문에 구분자 문자가 있으면 문서별로 처리
+            return [self.tokens(text) if return_tokens else self.clean(text) for text in texts]
+
+        if self.lowercase:
+            buffer = buffer.lower()
+        if not buffer.isascii():
+            for pattern in self._non_ascii_boundaries:
+                for ch in set(pattern.findall(buffer)):
+                    buffer = buffer.replace(ch, " ")
+        buffer = (buffer.encode("utf-8", "surrogatepass").translate(self._ascii_table)
+                  .decode("utf-8", "surrogatepass"))
+        tokens = buffer.replace(_DOC_SEPARATOR, " " + _DOC_SEPARATOR + " ").split()
+
+        # 짧은 토큰과 불용어는 고유 토큰 단위로 판정한 뒤 한 번의 집합 조회로 거릅니다.
+        stop = self.stopwords
+        drop = {token for token in set(tokens)
+                if token != _DOC_SEPARATOR
+                and (len(token) < self.min_token_length or token in stop)}
+        if drop:
+            tokens = [token for token in tokens if token not in drop]
+        docs = " ".join(tokens).split(_DOC_SEPARATOR)
+        if return_tokens:
+            return [doc.split() for doc in docs]
+        return [doc.strip() for doc in docs]
+
+
+_worker_preprocessor: Optional[TextPreprocessor] = None
+_worker_return_tokens = False
+
+
+def _init_preprocessor(preprocessor: TextPreprocessor, return_tokens: bool) -> None:
+    global _worker_preprocessor, _worker_return_tokens
+    _worker_preprocessor = preprocessor
+    _worker_return_tokens = return_tokens
+
+
+def _clean_shard(texts: List[str]) -> list:
+    return _worker_preprocessor._clean_buffer(list(texts), _worker_return_tokens)
 
 
 def batch_clean(texts: Iterable[str], preprocessor: TextPreprocessor) -> List[str]:
     """주어진 문자열 반복자에 대해 전처리를 수행합니다."""
-    return [preprocessor.clean(text) for text in texts]
+    return preprocessor.clean_many(texts)
+
+
+# ---------------------------------------------------------------------------
+# 한국어 토크나이저
+# ---------------------------------------------------------------------------
+
+# 명사 뒤에 붙는 조사와 (명사+하다/되다) 서술/연결 어미. 긴 것부터 검사합니다.
+KOREAN_SUFFIXES: Tuple[str, ...] = tuple(sorted({
+    # 조사
+    '으로부터', '에서부터', '이라고', '이라는', '에게서', '으로서', '으로써', '으로는', '으로도',
+    '에서는', '에서도', '에서의', '에게는', '까지는', '부터는', '보다는', '와의', '과의', '에는',
+    '에도', '이나', '이며', '이고', '이다', '이란', '라는', '라고', '에서', '에게', '한테', '으로',
+    '로서', '로써', '로는', '로도', '부터', '까지', '처럼', '보다', '마저', '조차', '은', '는', '이',
+    '가', '을', '를', '의', '에', '로', '와', '과', '도', '만',
+    # 서술/연결 어미
+    '했으며', '했다', '한다', '하는', '하고', '하며', '하여', '해서', '했고', '하기', '한', '할',
+    '됐다', '된다', '되는', '되며', '되고', '된',
+}, key=lambda suffix: (-len(suffix), suffix)))
+
+# 명사의 끝 글자로도 흔한 한 글자 조사 ('고밀도', '어레이', '민주주의', '전문가').
+# 남는 어간이 명사 사전(data/interim/stopwords/korean_nouns.txt)에 있거나 영문/숫자로 끝날 때만 뗍니다.
+KOREAN_AMBIGUOUS_PARTICLES: FrozenSet[str] = frozenset({'이', '가', '도', '로', '의', '만', '과'})
+
+_KOREAN_TOKEN = re.compile(r"[A-Za-z0-9]*[가-힣]+|[A-Za-z][A-Za-z0-9]*")
+_LATIN_TERM = re.compile(r"\b[A-Za-z]+[0-9]+[A-Za-z]*\b|\b[A-Za-z]{2,}\b")
+_KOREAN_RUN = re.compile(r"[가-힣]{2,}")
+
+
+def _config_key(name: str, *parts) -> str:
+    digest = hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=6).hexdigest()
+    return f"{name}-{digest}"
+
+
+@dataclass(frozen=True)
+class KoreanTokenizer:
+    """조사/어미를 떼어 내는 순수 파이썬 한국어 명사 토크나이저 (외부 형태소 분석기 불필요).
+
+    한글 어절은 사전(KOREAN_SUFFIXES)의 가장 긴 접미사를 한 번 떼어 내되 어간이
+    min_length 글자 이상 남을 때만 뗍니다. 명사 사전(lexicon)에 있는 단어는 그대로 두고,
+    명사 끝 글자와 겹치는 한 글자 조사(KOREAN_AMBIGUOUS_PARTICLES)는 어간이 사전에 있거나
+    영문/숫자로 끝날 때만 떼며, 숫자만 남는 어절('10만')은 떼지 않습니다.
+    'HBM3E를' 처럼 영문/숫자 뒤에 조사가 붙은 어절도 같은 규칙으로 'HBM3E' 가 됩니다.
+
+    >>> tokenizer = KoreanTokenizer(stopword_languages=())
+    >>> [tokenizer.strip_suffix(word) for word in ['고밀도', '해상도', '신뢰도', '어레이', '게이트웨이',
+    ...                                            '반도체회로', '민주주의', '10만']]
+    ['고밀도', '해상도', '신뢰도', '어레이', '게이트웨이', '반도체회로', '민주주의', '10만']
+    >>> [tokenizer.strip_suffix(word) for word in ['신뢰도가', '삼성전자의', 'HBM3E를', 'HBM이',
+    ...                                            '파운드리는', '애널리스트가', '투자가']]
+    ['신뢰도', '삼성전자', 'HBM3E', 'HBM', '파운드리', '애널리스트', '투자가']
+    """
+
+    name: ClassVar[str] = "korean"
+
+    stopword_languages: Tuple[str, ...] = ("korean",)
+    min_length: int = 2
+    suffixes: Tuple[str, ...] = KOREAN_SUFFIXES
+    ambiguous: FrozenSet[str] = KOREAN_AMBIGUOUS_PARTICLES
+    lexicon: str = "korean_nouns"
+    _stopwords: Optional[FrozenSet[str]] = field(default=None, init=False, repr=False, compare=False)
+    _nouns: Optional[FrozenSet[str]] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def stopwords(self) -> FrozenSet[str]:
+        if self._stopwords is None:
+            words = frozenset().union(*(load_stopwords(lang) for lang in self.stopword_languages))
+            object.__setattr__(self, "_stopwords", words)
+        return self._stopwords
+
+    @property
+    def nouns(self) -> FrozenSet[str]:
+        """명사 사전. 처음 사용할 때 data/interim/stopwords/{lexicon}.txt 를 읽습니다 (`load_lexicon`)."""
+        if self._nouns is None:
+            object.__setattr__(self, "_nouns", load_lexicon(self.lexicon))
+        return self._nouns
+
+    @property
+    def cache_key(self) -> str:
+        """설정이 바뀌면 달라지는 캐시 키 (토큰 저장소 디렉토리 이름)."""
+        return _config_key(self.name, self.min_length, self.suffixes, sorted(self.ambiguous),
+                           sorted(self.nouns), sorted(self.stopwords))
+
+    def strip_suffix(self, word: str) -> str:
+        nouns = self.nouns
+        if word in nouns:
+            return word
+        for suffix in self.suffixes:
+            if word.endswith(suffix) and len(word) - len(suffix) >= self.min_length:
+                stem = word[:-len(suffix)]
+                if stem.isdigit():
+                    return word
+                if suffix in self.ambiguous and stem not in nouns and not stem[-1].isascii():
+                    return word
+                return stem
+        return word
+
+    def __call__(self, text: str) -> List[str]:
+        if not isinstance(text, str):
+            return []
+        stop = self.stopwords
+        tokens = []
+        for word in _KOREAN_TOKEN.findall(text):
+            stem = self.strip_suffix(word)
+            if len(stem) >= self.min_length and stem not in stop:
+                tokens.append(stem)
+        return tokens
+
+
+@dataclass(frozen=True)
+class RegexNounTokenizer:
+    """영문/숫자 기술 용어와 2글자 이상 한글 연속열을 그대로 추출하는 정규식 근사 토크나이저.
+
+    조사를 떼지 않으므로 '파운드리'와 '파운드리는'이 다른 토큰이 됩니다 (비교/기존 결과 재현용).
+    """
+
+    name: ClassVar[str] = "regex"
+
+    stopword_languages: Tuple[str, ...] = ("korean",)
+
+    @property
+    def cache_key(self) -> str:
+        return _config_key(self.name, _LATIN_TERM.pattern, _KOREAN_RUN.pattern,
+                           sorted(self._stopwords()))
+
+    def _stopwords(self) -> FrozenSet[str]:
+        return frozenset().union(*(load_stopwords(lang) for lang in self.stopword_languages))
+
+    def __call__(self, text: str) -> List[str]:
+        if not isinstance(text, str):
+            return []
+        stop = self._stopwords()
+        words = _LATIN_TERM.findall(text) + _KOREAN_RUN.findall(text)
+        return [w for w in words if w not in stop and len(w) > 1]
+
+
+# 토크나이저 이름 -> 생성자. 같은 인터페이스(텍스트 -> 토큰 목록, cache_key)를 갖는
+# 클래스를 등록하면 토큰 캐시/키워드 단계에서 그대로 사용할 수 있습니다.
+TOKENIZERS: Dict[str, Callable[..., Callable[[str], List[str]]]] = {
+    KoreanTokenizer.name: KoreanTokenizer,
+    RegexNounTokenizer.name: RegexNounTokenizer,
+}
+
+
+def register_tokenizer(name: str, factory: Callable[..., Callable[[str], List[str]]]) -> None:
+    """사용자 정의 토크나이저를 등록합니다."""
+    TOKENIZERS[name] = factory
+
+
+def build_tokenizer(name: str = "korean", **options) -> Callable[[str], List[str]]:
+    """등록된 토크나이저를 생성합니다."""
+    try:
+        factory = TOKENIZERS[name]
+    except KeyError:
+        raise ValueError(f"알 수 없는 토크나이저입니다: {name} (사용 가능: {sorted(TOKENIZERS)})") from None
+    return factory(**options)
@@ -0,0 +1,128 @@
+"""기사 토큰 캐시 모듈.
+
+토큰화는 파이프라인에서 가장 비싼 단계이고 코퍼스는 실행 사이에 대부분 그대로이므로,
+기사 텍스트의 내용 해시를 키로 토큰 목록을 로컬 Parquet 저장소에 보관합니다.
+저장소는 토크나이저 설정별 디렉토리(`data/interim/tokens/{cache_key}/`)로 분리되어
+토크나이저나 사전이 바뀌면 자동으로 새 캐시를 사용합니다.
+"""
+
+import hashlib
+import uuid
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from .parallel import map_shards
+from .text import build_tokenizer
+
+TOKENS_DIR = Path(__file__).resolve().parents[2] / "data" / "interim" / "tokens"
+# 조각 파일이 이 수를 넘으면 하나로 합칩니다.
+MAX_PARTS = 32
+
+_SCHEMA = pa.schema([("hash", pa.int64()), ("tokens", pa.list_(pa.string()))])
+
+_worker_tokenizer = None
+
+
+def content_hashes(texts: Iterable[str]) -> np.ndarray:
+    """텍스트 내용의 blake2b 8바이트 해시(int64). 문자열이 아닌 값은 빈 문자열로 취급합니다."""
+    return np.fromiter(
+        (int.from_bytes(hashlib.blake2b((text if isinstance(text, str) else "").encode("utf-8"),
+                                        digest_size=8).digest(), "little", signed=True)
+         for text in texts),
+        dtype=np.int64,
+    )
+
+
+def _init_tokenizer(tokenizer) -> None:
+    global _worker_tokenizer
+    _worker_tokenizer = tokenizer
+
+
+def _tokenize_shard(texts: Sequence[str]) -> List[List[str]]:
+    return [_worker_tokenizer(text) for text in texts]
+
+
+class TokenStore:
+    """내용 해시 -> 토큰 목록 캐시 (토크나이저 설정별 Parquet 조각 파일 디렉토리)."""
+
+    def __init__(self, tokenizer: Optional[Callable[[str], List[str]]] = None,
+                 cache_dir: Optional[Union[str, Path]] = None):
+        self.tokenizer = tokenizer if tokenizer is not None else build_tokenizer()
+        self.path = Path(cache_dir or TOKENS_DIR) / self.tokenizer.cache_key
+
+    def _parts(self) -> List[Path]:
+        return sorted(self.path.glob("*.parquet")) if self.path.exists() else []
+
+    def get(self, hashes: np.ndarray) -> Dict[int, List[str]]:
+        """저장된 토큰 중 hashes 에 해당하는 것만 읽습니다."""
+        parts = self._parts()
+        if not parts or len(hashes) == 0:
+            return {}
+        table = ds.dataset([str(p) for p in parts], schema=_SCHEMA, format="parquet").to_table(
+            filter=pc.field("hash").isin(pa.array(np.unique(hashes)))
+        )
+        return dict(zip(table.column("hash").to_pylist(), table.column("tokens").to_pylist(), strict=True))
+
+    def put(self, hashes: Sequence[int], tokens: Sequence[List[str]]) -> None:
+        """새 토큰을 조각 파일로 추가합니다."""
+        if len(hashes) == 0:
+            return
+        self.path.mkdir(parents=True, exist_ok=True)
+        table = pa.table({"hash": pa.array(hashes, pa.int64()), "tokens": pa.array(tokens, pa.list_(pa.string()))},
+                         schema=_SCHEMA)
+        tmp = self.path / f".{uuid.uuid4().hex}.tmp"
+        pq.write_table(table, tmp)
+        tmp.replace(self.path / f"part-{uuid.uuid4().hex}.parquet")
+        if len(self._parts()) > MAX_PARTS:
+            self.compact()
+
+    def compact(self) -> None:
+        """조각 파일을 중복 없는 하나의 파일로 합칩니다."""
+        parts = self._parts()
+        if len(parts) <= 1:
+            return
+        table = ds.dataset([str(p) for p in parts], schema=_SCHEMA, format="parquet").to_table()
+        _, first = np.unique(table.column("hash").to_numpy(), return_index=True)
+        tmp = self.path / f".{uuid.uuid4().hex}.tmp"
+        pq.write_table(table.take(pa.array(np.sort(first))), tmp)
+        tmp.replace(self.path / f"part-{uuid.uuid4().hex}.parquet")
+        for part in parts:
+            part.unlink()
+
+    def tokenize(self, texts: Iterable[str], workers: Optional[int] = 1) -> List[List[str]]:
+        """기사별 토큰 목록. 캐시에 없는 기사만 토큰화하고 결과를 저장합니다."""
+        texts = list(texts)
+        hashes = content_hashes(texts)
+        cached = self.get(hashes)
+
+        missing: Dict[int, str] = {}
+        for h, text in zip(hashes.tolist(), texts, strict=True):
+            if h not in cached and h not in missing:
+                missing[h] = text
+        if missing:
+            new_tokens = map_shards(_tokenize_shard, list(missing.values()), workers,
+                                    initializer=_init_tokenizer, initargs=(self.tokenizer,))
+            self.put(list(missing), new_tokens)
+            cached.update(zip(missing, new_tokens, strict=True))
+        return [cached[h] for h in hashes.tolist()]
+
+
+def tokenize_articles(
+    texts: Iterable[str],
+    tokenizer: Union[str, Callable[[str], List[str]], None] = "korean",
+    cache_dir: Optional[Union[str, Path]] = None,
+    workers: Optional[int] = 1,
+) -> List[List[str]]:
+    """기사 텍스트를 토큰화합니다 (내용 해시 기반 캐시 사용).
+
+    tokenizer 는 등록된 이름(`TOKENIZERS`) 또는 토크나이저 객체입니다.
+    """
+    if isinstance(tokenizer, str):
+        tokenizer = build_tokenizer(tokenizer)
+    return TokenStore(tokenizer, cache_dir).tokenize(texts, workers=workers)
@@ -0,0 +1,94 @@
+"""키워드 중심성 역전(토픽 전환) 탐지 모듈.
+
+기간×키워드 중심성 행렬(`CentralityPanel.to_array` 결과)에서 키워드 쌍 (old, new) 의
+역전 시점, 즉 직전 기간에는 new ≤ old 였다가 해당 기간에 new > old 가 된 시점을 찾습니다.
+모든 키워드 쌍을 NumPy 브로드캐스팅으로 한 번에 비교하며, 키워드가 많으면 old 키워드를
+묶음 단위로 나눠 메모리를 (기간 수 × 묶음 크기 × 키워드 수) 로 제한합니다.
+"""
+
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+CROSSOVER_COLUMNS = ["old", "new", "period", "previous_period", "gap_before", "gap_after",
+                     "magnitude", "persistent"]
+# 묶음당 비교 원소 수 상한 (기간 × old 묶음 × new 키워드)
+_BLOCK_ELEMENTS = 1 << 24
+
+
+def _crossover_events(old: np.ndarray, new: np.ndarray):
+    """(기간 × 쌍) 값 행렬 두 개에서 역전 이벤트의 (기간 위치, 쌍 위치, 직전 차이, 역전 후 차이, 지속 여부)."""
+    diff = new - old
+    crossed = (diff[:-1] <= 0) & (diff[1:] > 0)
+    t, pair = np.nonzero(crossed)
+    t = t + 1
+    # 역전 후 끝까지 new > old 가 유지되는지: 마지막 new <= old 기간보다 뒤인지 비교
+    not_above = diff <= 0
+    last_not_above = np.where(not_above.any(axis=0),
+                              len(diff) - 1 - np.argmax(not_above[::-1], axis=0), -1)
+    return t, pair, -diff[t - 1, pair], diff[t, pair], t > last_not_above[pair]
+
+
+def find_crossovers(
+    values: pd.DataFrame,
+    pairs: Optional[Sequence[Tuple[str, str]]] = None,
+    min_magnitude: float = 0.0,
+    persistent_only: bool = False,
+) -> pd.DataFrame:
+    """키워드 쌍의 중심성 역전 시점을 찾아 역전 크기 순으로 반환합니다.
+
+    Parameters:
+    - values: 기간(행) × 키워드(열) 중심성 행렬. 기간은 정렬되어 있어야 하며 결측은 0 으로 간주
+    - pairs: 비교할 (old, new) 쌍 목록. None 이면 모든 순서쌍
+    - min_magnitude: 역전 크기(gap_before + gap_after)가 이 값 이상인 이벤트만 반환
+    - persistent_only: True 이면 역전 후 마지막 기간까지 new > old 가 유지된 이벤트만 반환
+
+    Returns:
+    - DataFrame: old, new, period(역전 기간), previous_period, gap_before(직전 old - new),
+      gap_after(역전 기간 new - old), magnitude, persistent
+    """
+    X = values.fillna(0.0).to_numpy(dtype=np.float64)
+    periods = values.index.to_numpy()
+    keywords = values.columns.to_numpy(dtype=object)
+    n_periods, n_keywords = X.shape
+    if n_periods < 2 or n_keywords == 0:
+        return pd.DataFrame(columns=CROSSOVER_COLUMNS)
+
+    if pairs is not None:
+        position = {keyword: i for i, keyword in enumerate(keywords)}
+        pairs = [(old, new) for old, new in pairs if old in position and new in position]
+        old_idx = np.array([position[old] for old, _ in pairs], dtype=np.intp)
+        new_idx = np.array([position[new] for _, new in pairs], dtype=np.intp)
+        t, pair, before, after, persistent = _crossover_events(X[:, old_idx], X[:, new_idx])
+        chunks = [(t, old_idx[pair], new_idx[pair], before, after, persistent)]
+    else:
+        block = max(1, _BLOCK_ELEMENTS // (n_periods * n_keywords))
+        chunks = []
+        for start in range(0, n_keywords, block):
+            stop = min(start + block, n_keywords)
+            # (기간, old 묶음, new 전체) 를 (기간, 쌍) 으로 펼쳐 비교
+            old = np.broadcast_to(X[:, start:stop, None], (n_periods, stop - start, n_keywords))
+            new = np.broadcast_to(X[:, None, :], (n_periods, stop - start, n_keywords))
+            t, pair, before, after, persistent = _crossover_events(
+                old.reshape(n_periods, -1), new.reshape(n_periods, -1)
+            )
+            chunks.append((t, start + pair // n_keywords, pair % n_keywords, before, after, persistent))
+
+    t, old_pos, new_pos, before, after, persistent = (np.concatenate(parts) for parts in zip(*chunks, strict=True))
+    magnitude = before + after
+    keep = magnitude >= min_magnitude
+    if persistent_only:
+        keep &= persistent
+    result = pd.DataFrame({
+        "old": keywords[old_pos[keep]],
+        "new": keywords[new_pos[keep]],
+        "period": periods[t[keep]],
+        "previous_period": periods[t[keep] - 1],
+        "gap_before": before[keep],
+        "gap_after": after[keep],
+        "magnitude": magnitude[keep],
+        "persistent": persistent[keep],
+    })
+    return result.sort_values(["magnitude", "period"], ascending=[False, True], kind="stable",
+                              ignore_index=True)
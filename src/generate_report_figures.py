@@ -5,15 +5,17 @@ import numpy as np
 import seaborn as sns
 import networkx as nx
 import os
-import re
-from itertools import combinations
-from collections import Counter
 from sklearn.linear_model import LinearRegression
 
-# 설정
-OUTPUT_DIR = "/home/arkwith/SKKU/tech_forcast/reports/Figure"
-DATA_RAW_DIR = "/home/arkwith/SKKU/tech_forcast/data/raw"
-DATA_PROC_DIR = "/home/arkwith/SKKU/tech_forcast/data/processed"
+from src.data.loaders import load_news_corpus
+from src.features.cooccurrence import DocumentTermMatrix, cooccurrence_to_graph
+from src.features.keywords import build_matcher
+from src.pipeline.config import config_path
+
+# 설정 (경로는 configs/pipeline_config.yaml 기준)
+OUTPUT_DIR = config_path("reports", "figure_dir")
+DATA_RAW_DIR = config_path("data", "raw_dir")
+DATA_PROC_DIR = config_path("data", "processed_dir")
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 # 폰트 설정
@@ -201,41 +203,26 @@ def draw_forecast():
 def draw_network():
     # 간단한 네트워크 생성을 위해 최근 데이터만 로드하여 그리기 (시간 절약)
     try:
-        sam_df = pd.read_csv(os.path.join(DATA_RAW_DIR, "samsung_news.csv"))
-        sk_df = pd.read_csv(os.path.join(DATA_RAW_DIR, "skhynix_news.csv"))
-    except:
+        news_df = load_news_corpus(DATA_RAW_DIR, columns=['date', 'company', 'text'])
+    except FileNotFoundError:
         return
+    sam_df = news_df[news_df['company'] == 'Samsung']
+    sk_df = news_df[news_df['company'] == 'SKHynix']
 
     # 전처리 함수
+    targets = ['HBM', 'DDR', 'AI', '파운드리', '수율', '엔비디아', 'GPU', 'TSMC', 'GAA', '패키징', 'SK하이닉스', '삼성전자']
+    matcher = build_matcher(targets)
+
     def extract_keywords(text):
-        text = str(text)
-        techs = re.findall(r'\b[A-Za-z][A-Za-z0-9]+\b', text)
-        korean = re.findall(r'[가-힣]{2,}', text)
-        targets = set(['HBM', 'DDR', 'AI', '파운드리', '수율', '엔비디아', 'GPU', 'TSMC', 'GAA', '패키징', 'SK하이닉스', '삼성전자'])
-        found = []
-        for w in techs + korean:
-            for t in targets:
-                if t in w.upper() or w.upper() in t:
-                    found.append(t)
-                    break
-        return list(set(found))
+        return matcher.extract(str(text))
 
     def create_graph(df, title, filename):
-        # 최근 500개만 사용
+        # 최근 500개만 사용 (코퍼스는 날짜순 정렬)
         subset = df.tail(500).copy()
-        subset['text'] = subset['title'].fillna('') + " " + subset['content'].fillna('')
         subset['keywords'] = subset['text'].apply(extract_keywords)
         
-        edge_list = []
-        for k in subset['keywords']:
-            if len(k) > 1:
-                edge_list.extend(combinations(sorted(k), 2))
-        
-        edge_counts = Counter(edge_list)
-        G = nx.Graph()
-        for (u, v), c in edge_counts.items():
-            if c >= 10: # Threshold
-                G.add_edge(u, v, weight=c)
+        dtm = DocumentTermMatrix.from_keywords(subset['keywords'], vocabulary=targets)
+        G = cooccurrence_to_graph(dtm.cooccurrence(), dtm.vocabulary, min_weight=10) # Threshold
         
         plt.figure(figsize=(10, 8))
         pos = nx.spring_layout(G, k=0.6, seed=42)
@@ -261,7 +248,7 @@ def main():
     draw_heatmap()
     draw_forecast()
     draw_network()
-    print("All figures generated in reports/Figure/")
+    print(f"All figures generated in {OUTPUT_DIR}/")
 
 if __name__ == "__main__":
     main()
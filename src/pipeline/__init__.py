@@ -0,0 +1 @@
+"""파이프라인 실행 지원 서브패키지 (설정, 단계 캐시, 계측, 실행기 `python -m src.pipeline`)."""
@@ -0,0 +1,417 @@
+"""파이프라인 단계(stage) 결과의 디스크 메모이제이션.
+
+단계 함수의 입력을 지문(fingerprint)으로 요약해 같은 입력이면 저장된 결과를 읽습니다.
+지문은 다음을 합친 해시입니다.
+
+- 입력 데이터 파일의 내용 해시 (크기/수정 시각이 같으면 이전 해시를 재사용)
+- `configs/pipeline_config.yaml` 중 단계가 지정한 섹션
+- 코드 버전: 단계 함수(와 지정한 함수)의 소스, 지정한 패키지/모듈 파일의 해시
+- 함수 인자 (DataFrame 은 `pd.util.hash_pandas_object` 로 요약)
+
+결과는 `data/interim/stage_cache/{stage}/{key}/` 에 DataFrame 은 Parquet, 배열/희소 행렬은
+npz 로 저장하며(그 밖의 값은 pickle), 전체 크기가 상한을 넘으면 가장 오래 사용하지 않은
+항목부터 지웁니다.
+"""
+
+import functools
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import pickle
+import shutil
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+from pyarrow import ArrowException
+from scipy import sparse
+
+from .config import load_config, resolve_path
+
+_META_NAME = "meta.json"
+_FILE_HASHES_NAME = "_file_hashes.json"
+
+PathsLike = Union[str, Path, Iterable[Union[str, Path]], Callable[[], Iterable[Union[str, Path]]]]
+
+
+# ---------------------------------------------------------------------------
+# 지문 계산
+# ---------------------------------------------------------------------------
+
+def _hasher():
+    return hashlib.blake2b(digest_size=16)
+
+
+def _hash_file(path: Path) -> str:
+    h = _hasher()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _iter_files(paths: Iterable[Union[str, Path]]):
+    for item in paths:
+        path = Path(item)
+        if path.is_dir():
+            yield from sorted(p for p in path.rglob("*") if p.is_file())
+        else:
+            yield path
+
+
+def _update_value(h, value: Any) -> None:
+    """값을 해시에 반영합니다. DataFrame/배열은 내용 해시, 그 밖의 값은 repr/pickle."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        h.update(repr((type(value).__name__, getattr(value, "name", None), value.shape,
+                       [str(t) for t in np.atleast_1d(value.dtypes)])).encode("utf-8"))
+        try:
+            h.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+        except TypeError:  # 리스트 등 해시할 수 없는 값이 있는 컬럼
+            h.update(pickle.dumps(value, protocol=4))
+    elif isinstance(value, np.ndarray):
+        h.update(repr((value.dtype.str, value.shape)).encode("utf-8"))
+        h.update(np.ascontiguousarray(value).tobytes() if value.dtype != object else pickle.dumps(value))
+    elif sparse.issparse(value):
+        value = sparse.csr_matrix(value)
+        for part in (value.data, value.indices, value.indptr, np.asarray(value.shape)):
+            _update_value(h, part)
+    elif isinstance(value, dict):
+        for key in sorted(value, key=repr):
+            h.update(repr(key).encode("utf-8"))
+            _update_value(h, value[key])
+    elif isinstance(value, (list, tuple)):
+        h.update(f"{type(value).__name__}:{len(value)}".encode("utf-8"))
+        for item in value:
+            _update_value(h, item)
+    elif value is None or isinstance(value, (str, int, float, bool, bytes, Path)):
+        h.update(repr(value).encode("utf-8"))
+    else:
+        h.update(pickle.dumps(value, protocol=4))
+
+
+def _code_sources(code: Iterable[Union[str, Callable]]):
+    """코드 항목별 (이름, 소스 해시). 함수는 소스, 모듈/패키지는 파일 내용을 해시합니다."""
+    modules = []
+    for item in code:
+        if callable(item):
+            try:
+                source = inspect.getsource(item).encode("utf-8")
+            except (OSError, TypeError):  # 대화형 세션 등 소스 파일이 없는 함수
+                source = getattr(getattr(item, "__code__", None), "co_code", repr(item).encode("utf-8"))
+            yield f"{item.__module__}.{item.__qualname__}", hashlib.blake2b(source, digest_size=16).hexdigest()
+        else:
+            modules.append(item)
+    for path in _module_files(modules):
+        yield str(path), None
+
+
+def _module_files(names: Iterable[str]):
+    for name in names:
+        module = importlib.import_module(name)
+        path = Path(inspect.getfile(module))
+        if path.name == "__init__.py":
+            yield from sorted(path.parent.rglob("*.py"))
+        else:
+            yield path
+
+
+# ---------------------------------------------------------------------------
+# 직렬화 (DataFrame -> Parquet, 배열/희소 행렬 -> npz, 나머지 -> pickle)
+# ---------------------------------------------------------------------------
+
+def _save_value(value: Any, path: Path) -> dict:
+    if value is None:
+        return {"kind": "none"}
+    if isinstance(value, pd.Series):
+        value.to_frame(name="__series__" if value.name is None else value.name).to_parquet(path.with_suffix(".parquet"))
+        return {"kind": "series", "unnamed": value.name is None}
+    if isinstance(value, pd.DataFrame):
+        try:
+            value.to_parquet(path.with_suffix(".parquet"))
+            return {"kind": "dataframe"}
+        except (TypeError, ValueError, ArrowException):  # Parquet 로 표현할 수 없는 컬럼
+            path.with_suffix(".parquet").unlink(missing_ok=True)
+    if isinstance(value, np.ndarray) and value.dtype != object:
+        np.savez(path.with_suffix(".npz"), value=value)
+        return {"kind": "ndarray"}
+    if sparse.issparse(value):
+        sparse.save_npz(path.with_suffix(".npz"), sparse.csr_matrix(value))
+        return {"kind": "sparse"}
+    if isinstance(value, dict) and all(isinstance(k, str) for k in value):
+        path.mkdir()
+        return {"kind": "dict", "items": {k: _save_value(v, path / f"{i:04d}") for i, (k, v) in enumerate(value.items())}}
+    if isinstance(value, (tuple, list)):
+        path.mkdir()
+        return {"kind": type(value).__name__, "items": [_save_value(v, path / f"{i:04d}") for i, v in enumerate(value)]}
+    with open(path.with_suffix(".pkl"), "wb") as f:
+        pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return {"kind": "pickle"}
+
+
+def _load_value(meta: dict, path: Path) -> Any:
+    kind = meta["kind"]
+    if kind == "none":
+        return None
+    if kind == "series":
+        series = pd.read_parquet(path.with_suffix(".parquet")).iloc[:, 0]
+        return series.rename(None) if meta["unnamed"] else series
+    if kind == "dataframe":
+        return pd.read_parquet(path.with_suffix(".parquet"))
+    if kind == "ndarray":
+        with np.load(path.with_suffix(".npz")) as data:
+            return data["value"]
+    if kind == "sparse":
+        return sparse.load_npz(path.with_suffix(".npz"))
+    if kind == "dict":
+        return {k: _load_value(m, path / f"{i:04d}") for i, (k, m) in enumerate(meta["items"].items())}
+    if kind in ("tuple", "list"):
+        items = [_load_value(m, path / f"{i:04d}") for i, m in enumerate(meta["items"])]
+        return tuple(items) if kind == "tuple" else items
+    with open(path.with_suffix(".pkl"), "rb") as f:
+        return pickle.load(f)
+
+
+def _dir_size(path: Path) -> int:
+    return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+
+
+# ---------------------------------------------------------------------------
+# 캐시
+# ---------------------------------------------------------------------------
+
+@dataclass
+class StageCache:
+    """단계 결과 저장소.
+
+    - root: 저장 디렉토리 (기본값: 설정의 cache.dir)
+    - max_bytes: 전체 크기 상한. 넘으면 마지막 사용 시각이 오래된 항목부터 삭제
+    - force: True 이면 저장된 결과를 무시하고 다시 계산해 덮어씀
+    - enabled: False 이면 캐시를 사용하지 않음
+    """
+
+    root: Path
+    max_bytes: int = 2 << 30
+    force: bool = False
+    enabled: bool = True
+
+    @classmethod
+    def from_config(cls, config: Optional[dict] = None, **overrides) -> "StageCache":
+        config = load_config() if config is None else config
+        cache_config = config.get("cache", {})
+        options = {
+            "root": resolve_path(cache_config.get("dir", "data/interim/stage_cache")),
+            "max_bytes": int(cache_config.get("max_size_mb", 2048)) << 20,
+        }
+        options.update(overrides)
+        return cls(**options)
+
+    def __post_init__(self):
+        self.root = Path(self.root)
+
+    # 지문 ---------------------------------------------------------------
+
+    def file_hashes(self, paths: Iterable[Union[str, Path]]) -> Dict[str, str]:
+        """파일별 내용 해시. (크기, 수정 시각)이 그대로인 파일은 이전에 계산한 해시를 씁니다."""
+        index_path = self.root / _FILE_HASHES_NAME
+        try:
+            with open(index_path, encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            index = {}
+        result, changed = {}, False
+        for path in _iter_files(paths):
+            key = str(path.resolve())
+            if not path.exists():
+                result[key] = "missing"
+                continue
+            stat = path.stat()
+            entry = index.get(key)
+            if not entry or entry["size"] != stat.st_size or entry["mtime_ns"] != stat.st_mtime_ns:
+                entry = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "hash": _hash_file(path)}
+                index[key] = entry
+                changed = True
+            result[key] = entry["hash"]
+        if changed:
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp = index_path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(index, f)
+            tmp.replace(index_path)
+        return result
+
+    def fingerprint(
+        self,
+        stage: str,
+        files: Iterable[Union[str, Path]] = (),
+        config: Optional[dict] = None,
+        code: Iterable[Union[str, Callable]] = (),
+        args: Optional[dict] = None,
+    ) -> str:
+        h = _hasher()
+        h.update(stage.encode("utf-8"))
+        for name, digest in sorted(self.file_hashes(files).items()):
+            h.update(f"file:{Path(name).name}:{digest}".encode("utf-8"))
+        h.update(json.dumps(config or {}, sort_keys=True, default=str).encode("utf-8"))
+        sources = list(_code_sources(code))
+        module_hashes = self.file_hashes(Path(name) for name, digest in sources if digest is None)
+        for name, digest in sorted(sources):
+            h.update(f"code:{name}:{digest or module_hashes[str(Path(name).resolve())]}".encode("utf-8"))
+        _update_value(h, args or {})
+        return h.hexdigest()
+
+    # 저장/조회 -----------------------------------------------------------
+
+    def _entry(self, stage: str, key: str) -> Path:
+        return self.root / stage / key
+
+    def load(self, stage: str, key: str) -> Any:
+        """저장된 결과를 반환합니다. 없으면 KeyError."""
+        entry = self._entry(stage, key)
+        meta_path = entry / _META_NAME
+        if self.force or not meta_path.exists():
+            raise KeyError(key)
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        value = _load_value(meta["value"], entry / "value")
+        os.utime(meta_path)  # 마지막 사용 시각 (LRU)
+        return value
+
+    def save(self, stage: str, key: str, value: Any) -> None:
+        entry = self._entry(stage, key)
+        tmp = entry.parent / f".{key}.{uuid.uuid4().hex}.tmp"
+        tmp.mkdir(parents=True)
+        try:
+            meta = {"stage": stage, "created": time.time(), "value": _save_value(value, tmp / "value")}
+            meta["size"] = _dir_size(tmp)
+            with open(tmp / _META_NAME, "w", encoding="utf-8") as f:
+                json.dump(meta, f, ensure_ascii=False)
+            if entry.exists():
+                shutil.rmtree(entry)
+            tmp.rename(entry)
+        finally:
+            if tmp.exists():
+                shutil.rmtree(tmp)
+        self.evict()
+
+    def entries(self):
+        """(마지막 사용 시각, 크기, 경로) 목록."""
+        result = []
+        for meta_path in self.root.glob(f"*/*/{_META_NAME}"):
+            try:
+                with open(meta_path, encoding="utf-8") as f:
+                    size = json.load(f)["size"]
+                result.append((meta_path.stat().st_mtime, size, meta_path.parent))
+            except (OSError, ValueError, KeyError):
+                continue
+        return result
+
+    def evict(self) -> None:
+        """전체 크기가 max_bytes 이하가 될 때까지 오래 사용하지 않은 항목을 삭제합니다."""
+        entries = sorted(self.entries(), key=lambda e: e[0])
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
+    def clear(self, stage: Optional[str] = None) -> None:
+        target = self.root / stage if stage else self.root
+        shutil.rmtree(target, ignore_errors=True)
+
+    # 데코레이터 -----------------------------------------------------------
+
+    def stage(
+        self,
+        name: Optional[str] = None,
+        files: PathsLike = (),
+        config_sections: Sequence[str] = (),
+        code: Sequence[Union[str, Callable]] = (),
+        ignore: Sequence[str] = (),
+    ) -> Callable:
+        """단계 함수를 메모이즈하는 데코레이터.
+
+        - files: 입력 데이터 파일/디렉토리 (호출 시점에 경로를 정하려면 인자 없는 함수)
+        - config_sections: 지문에 포함할 설정 섹션 이름
+        - code: 단계 함수 외에 지문에 포함할 함수 또는 모듈/패키지 이름 (예: 'src.features').
+          함수는 그 함수의 소스만, 모듈/패키지 이름은 파일 전체를 해시하므로 이름으로 넘긴
+          모듈은 어느 부분을 고쳐도(같은 파일의 그림 코드 포함) 캐시가 무효화됩니다.
+        - ignore: 결과에 영향을 주지 않아 지문에서 제외할 인자 이름 (예: 'workers')
+        """
+        def decorator(func: Callable) -> Callable:
+            stage_name = name or func.__name__
+            signature = inspect.signature(func)
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                call_args = {k: v for k, v in bound.arguments.items() if k not in ignore}
+                paths = files() if callable(files) else ([files] if isinstance(files, (str, Path)) else files)
+                config = load_config()
+                key = self.fingerprint(
+                    stage_name,
+                    files=paths,
+                    config={section: config.get(section) for section in config_sections},
+                    code=(func, *code),
+                    args=call_args,
+                )
+                try:
+                    return self.load(stage_name, key)
+                except KeyError:
+                    pass
+                value = func(*args, **kwargs)
+                self.save(stage_name, key, value)
+                return value
+
+            wrapper.cache = self
+            return wrapper
+
+        return decorator
+
+
+_default_cache: Optional[StageCache] = None
+
+
+def get_stage_cache() -> StageCache:
+    """프로세스 기본 캐시 (설정 파일 기준)."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = StageCache.from_config()
+    return _default_cache
+
+
+def configure_stage_cache(**options) -> StageCache:
+    """기본 캐시 옵션(force, enabled, root, max_bytes)을 바꿉니다. 예: CLI 의 --force."""
+    cache = get_stage_cache()
+    for key, value in options.items():
+        setattr(cache, key, Path(value) if key == "root" else value)
+    return cache
+
+
+def cached_stage(
+    name: Optional[str] = None,
+    files: PathsLike = (),
+    config_sections: Sequence[str] = (),
+    code: Sequence[Union[str, Callable]] = (),
+    ignore: Sequence[str] = (),
+) -> Callable:
+    """기본 캐시(`get_stage_cache`)를 사용하는 `StageCache.stage` 데코레이터.
+
+    캐시 객체는 호출 시점에 조회하므로 `configure_stage_cache` 설정이 그대로 반영됩니다.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            staged = get_stage_cache().stage(name or func.__name__, files, config_sections, code, ignore)(func)
+            return staged(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,37 @@
+"""파이프라인 설정(configs/pipeline_config.yaml) 로딩 유틸리티."""
+
+import copy
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Union
+
+import yaml
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_CONFIG_PATH = PROJECT_ROOT / "configs" / "pipeline_config.yaml"
+# 다른 설정 파일을 쓰려면 이 환경 변수에 경로를 지정합니다 (하위 프로세스에도 전달됨).
+CONFIG_ENV = "PIPELINE_CONFIG"
+
+
+@lru_cache(maxsize=None)
+def _read_config(path: Path) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return yaml.safe_load(f) or {}
+
+
+def load_config(path: Optional[Union[str, Path]] = None) -> dict:
+    """설정 파일을 읽어 dict 로 반환합니다 (반환값은 수정해도 캐시에 영향이 없는 복사본)."""
+    path = Path(path or os.environ.get(CONFIG_ENV) or DEFAULT_CONFIG_PATH)
+    return copy.deepcopy(_read_config(path.resolve()))
+
+
+def resolve_path(path: Union[str, Path]) -> Path:
+    """설정의 상대 경로를 프로젝트 최상위 디렉토리 기준 절대 경로로 바꿉니다."""
+    path = Path(path).expanduser()
+    return path if path.is_absolute() else PROJECT_ROOT / path
+
+
+def config_path(section: str, key: str) -> Path:
+    """설정의 경로 항목(예: `config_path("data", "raw_dir")`)을 절대 경로로 반환합니다."""
+    return resolve_path(load_config()[section][key])
@@ -0,0 +1,305 @@
+"""설정 기반 파이프라인 실행기 (`python -m src.pipeline`).
+
+분석 스크립트를 단계(stage)로 등록하고 의존 관계(DAG) 순서로 실행합니다.
+
+    ingest ─┬─ trends
+            ├─ impact ── figures
+            └─ networks
+
+- 경로는 모두 `configs/pipeline_config.yaml` 에서 읽습니다 (`PIPELINE_CONFIG` 로 다른 설정 지정).
+- 의존 단계가 끝난 단계들은 프로세스 풀에서 동시에 실행합니다.
+- 출력 파일이 모두 있고 입력 파일/코드보다 새로우면 그 단계는 건너뜁니다 (`--force` 로 무시).
+- 단계별 시간/메모리는 `tracking.experiment_dir` 에 실행 리포트(JSON/CSV)로 저장됩니다.
+"""
+
+import argparse
+import importlib
+import os
+import sys
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.data.loaders import NEWS_SOURCES, default_corpus_dir, update_news_corpus
+
+from .config import CONFIG_ENV, PROJECT_ROOT, load_config, resolve_path
+from .tracking import Tracker, measure
+
+
+@dataclass(frozen=True)
+class Stage:
+    """파이프라인 단계.
+
+    - target: 실행 함수 ('모듈:함수')
+    - deps: 먼저 끝나야 하는 단계 이름
+    - inputs/outputs: 입출력 파일. `{raw_dir}` 등 설정 경로 키를 사용할 수 있음 (`pipeline_paths`)
+    - code: 최신 여부 판단에 포함할 소스 파일/디렉토리 (프로젝트 최상위 기준)
+    - options: 실행 함수에 전달할 실행 옵션 ('incremental', 'workers')
+    """
+
+    name: str
+    target: str
+    deps: Tuple[str, ...] = ()
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
+    code: Tuple[str, ...] = ()
+    options: Tuple[str, ...] = ()
+
+
+_CORPUS_MANIFEST = "{corpus_dir}/_manifest.json"
+_LIBRARY_CODE = ("src/data", "src/features", "src/pipeline/cache.py")
+
+STAGES: Dict[str, Stage] = {stage.name: stage for stage in (
+    Stage(
+        "ingest", "src.pipeline.runner:ingest",
+        inputs=tuple(f"{{raw_dir}}/{filename}" for filename, _ in NEWS_SOURCES.values()),
+        outputs=(_CORPUS_MANIFEST,),
+        code=("src/data",),
+    ),
+    Stage(
+        "trends", "src.analyze_news:main", deps=("ingest",),
+        inputs=(_CORPUS_MANIFEST,),
+        outputs=("{processed_dir}/tech_trends_timeseries.csv", "{processed_dir}/tech_milestones.csv"),
+        code=("src/analyze_news.py", *_LIBRARY_CODE),
+        options=("incremental", "workers"),
+    ),
+    Stage(
+        "impact", "src.analyze_news_v2:main", deps=("ingest",),
+        inputs=(_CORPUS_MANIFEST,),
+        outputs=("{processed_dir}/tech_social_impact.csv", "{processed_dir}/market_sentiment.csv",
+                 "{processed_dir}/tech_trends_quarterly.csv"),
+        code=("src/analyze_news_v2.py", *_LIBRARY_CODE),
+        options=("incremental", "workers"),
+    ),
+    Stage(
+        "networks", "src.temporal_network_analysis:main", deps=("ingest",),
+        inputs=(_CORPUS_MANIFEST,),
+        outputs=("{interim_dir}/network_counts.parquet", "{interim_dir}/network_monthly_counts.parquet",
+                 "{interim_dir}/network_article_stats.parquet", "{interim_dir}/rolling_centrality.parquet",
+                 "{processed_dir}/topic_transitions.csv", "{processed_dir}/topic_transitions_rolling.csv",
+                 "{processed_dir}/emerging_keywords.csv",
+                 "{figure_dir}/fig_07_company_strategy_evolution.png",
+                 "{figure_dir}/fig_08_temporal_centrality_heatmap.png",
+                 "{figure_dir}/fig_10_topic_transition_analysis.png",
+                 "{figure_dir}/fig_11_temporal_keyword_evolution.png"),
+        code=("src/temporal_network_analysis.py", *_LIBRARY_CODE),
+        options=("incremental", "workers"),
+    ),
+    Stage(
+        "figures", "src.generate_report_figures:main", deps=("ingest", "impact"),
+        inputs=(_CORPUS_MANIFEST, "{processed_dir}/tech_trends_quarterly.csv",
+                "{processed_dir}/tech_social_impact.csv"),
+        outputs=tuple(f"{{figure_dir}}/{name}" for name in (
+            "fig_01_research_framework.png", "fig_02_tech_trends.png", "fig_03_tech_social_heatmap.png",
+            "fig_04_forecast_hbm.png", "fig_05_network_skhynix.png", "fig_06_network_samsung.png",
+        )),
+        code=("src/generate_report_figures.py", *_LIBRARY_CODE),
+    ),
+)}
+
+
+def ingest() -> None:
+    """원본 뉴스 CSV 의 변경분을 Parquet 코퍼스에 반영합니다."""
+    manifest = update_news_corpus(resolve_path(load_config()["data"]["raw_dir"]))
+    print(f"News corpus: {manifest['rows']:,} articles (generation {manifest['generation']}, "
+          f"batch {manifest['batch']})")
+
+
+# ---------------------------------------------------------------------------
+# 그래프/최신 여부
+# ---------------------------------------------------------------------------
+
+def pipeline_paths(config: dict) -> Dict[str, Path]:
+    """단계 입출력 경로에 쓰는 디렉토리 (설정 기준 절대 경로)."""
+    data = config["data"]
+    raw_dir = resolve_path(data["raw_dir"])
+    return {
+        "raw_dir": raw_dir,
+        "interim_dir": resolve_path(data["interim_dir"]),
+        "processed_dir": resolve_path(data["processed_dir"]),
+        "figure_dir": resolve_path(config["reports"]["figure_dir"]),
+        "corpus_dir": default_corpus_dir(raw_dir),
+    }
+
+
+def select_stages(names: Optional[Iterable[str]] = None, stages: Dict[str, Stage] = STAGES) -> List[str]:
+    """선택한 단계와 그 선행 단계를 실행 순서(위상 정렬)로 반환합니다."""
+    names = list(stages) if not names else list(names)
+    unknown = [name for name in names if name not in stages]
+    if unknown:
+        raise ValueError(f"알 수 없는 단계: {', '.join(unknown)} (가능한 값: {', '.join(stages)})")
+
+    order, visiting = [], set()
+
+    def visit(name):
+        if name in order:
+            return
+        if name in visiting:
+            raise ValueError(f"단계 의존 관계에 순환이 있습니다: {name}")
+        visiting.add(name)
+        for dep in stages[name].deps:
+            visit(dep)
+        visiting.discard(name)
+        order.append(name)
+
+    for name in names:
+        visit(name)
+    return order
+
+
+def _mtimes(paths: Iterable[Path]) -> List[float]:
+    result = []
+    for path in paths:
+        if path.is_dir():
+            result.extend(p.stat().st_mtime for p in path.rglob("*.py"))
+        elif path.exists():
+            result.append(path.stat().st_mtime)
+    return result
+
+
+def is_up_to_date(stage: Stage, paths: Dict[str, Path]) -> bool:
+    """출력이 모두 있고, 가장 오래된 출력이 입력·코드보다 새로우면 True."""
+    if not stage.outputs:
+        return False
+    outputs = [Path(spec.format(**paths)) for spec in stage.outputs]
+    if not all(path.exists() for path in outputs):
+        return False
+    sources = [Path(spec.format(**paths)) for spec in stage.inputs]
+    sources += [PROJECT_ROOT / path for path in stage.code]
+    newest_source = max(_mtimes(sources), default=0.0)
+    return min(_mtimes(outputs)) >= newest_source
+
+
+# ---------------------------------------------------------------------------
+# 실행
+# ---------------------------------------------------------------------------
+
+def _run_stage(name: str, target: str, kwargs: dict, force: bool, profile_path: Optional[Path] = None) -> dict:
+    """(워커 프로세스) 단계 함수를 실행하고 계측 결과(`StageRecord` dict)를 반환합니다."""
+    if force:
+        from .cache import configure_stage_cache
+        configure_stage_cache(force=True)
+    module_name, func_name = target.split(":")
+    func = getattr(importlib.import_module(module_name), func_name)
+    with measure(name, profile_path=profile_path) as record:
+        func(**kwargs)
+    return asdict(record)
+
+
+def run_pipeline(
+    names: Optional[Sequence[str]] = None,
+    force: bool = False,
+    incremental: Optional[bool] = None,
+    workers: Optional[int] = None,
+    stage_workers: Optional[int] = None,
+    dry_run: bool = False,
+    profile: bool = False,
+    stages: Dict[str, Stage] = STAGES,
+) -> Dict[str, str]:
+    """단계를 DAG 순서로 실행하고 단계별 상태(done/skipped/failed/blocked)를 반환합니다.
+
+    incremental/workers/stage_workers 가 None 이면 설정의 `pipeline` 섹션 값을 사용합니다.
+    workers 는 동시에 실행할 단계 수, stage_workers 는 단계 내부(키워드 추출 등) 프로세스 수입니다.
+    profile=True 이면 단계별 cProfile 결과(.prof)를 실행 리포트와 함께 저장합니다.
+    """
+    config = load_config()
+    pipeline_config = config.get("pipeline") or {}
+    paths = pipeline_paths(config)
+    order = select_stages(names, stages)
+
+    incremental = pipeline_config.get("incremental", True) if incremental is None else incremental
+    workers = workers or pipeline_config.get("workers") or min(len(order), os.cpu_count() or 1)
+    stage_workers = (stage_workers or pipeline_config.get("stage_workers")
+                     or max(1, (os.cpu_count() or 1) // workers))
+    options = {"incremental": incremental, "workers": stage_workers}
+
+    status: Dict[str, str] = {}
+    pending = list(order)
+    running = {}
+    tracker = Tracker("pipeline", profile=profile)
+
+    def ready():
+        for name in list(pending):
+            deps = [dep for dep in stages[name].deps if dep in order]
+            if any(status.get(dep) in ("failed", "blocked") for dep in deps):
+                pending.remove(name)
+                status[name] = "blocked"
+                print(f"[pipeline] {name}: blocked (선행 단계 실패)")
+            elif all(status.get(dep) in ("done", "skipped") for dep in deps):
+                pending.remove(name)
+                yield name
+
+    def start(name, pool):
+        stage = stages[name]
+        if not force and is_up_to_date(stage, paths):
+            status[name] = "skipped"
+            print(f"[pipeline] {name}: up to date")
+            return
+        if dry_run:
+            status[name] = "done"
+            print(f"[pipeline] {name}: would run {stage.target}")
+            return
+        args = (name, stage.target, {key: options[key] for key in stage.options}, force,
+                tracker.experiment_dir / f"{tracker.run_id}-{name}.prof" if profile else None)
+        print(f"[pipeline] {name}: start")
+        if pool is None:
+            finish(name, lambda: _run_stage(*args))
+        else:
+            running[pool.submit(_run_stage, *args)] = name
+
+    def finish(name, result):
+        try:
+            record = result()
+        except Exception:
+            status[name] = "failed"
+            print(f"[pipeline] {name}: failed\n{traceback.format_exc()}", file=sys.stderr)
+        else:
+            status[name] = "done"
+            tracker.add(record)
+            print(f"[pipeline] {name}: done in {record['wall_s']:.1f}s")
+
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 and not dry_run else None
+    try:
+        while pending or running:
+            for name in list(ready()):
+                start(name, pool)
+            if running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    finish(running.pop(future), future.result)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        if tracker.write() is not None:
+            tracker.print_summary()
+    return status
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.pipeline", description="뉴스 분석 파이프라인 실행")
+    parser.add_argument("stages", nargs="*", help=f"실행할 단계 (선행 단계 포함, 기본값: 전체). {', '.join(STAGES)}")
+    parser.add_argument("--config", help=f"설정 파일 (기본값: configs/pipeline_config.yaml, 환경 변수 {CONFIG_ENV})")
+    parser.add_argument("--force", action="store_true", help="최신 여부와 단계 캐시를 무시하고 모두 다시 실행")
+    parser.add_argument("--full", action="store_true", help="증분 처리 대신 전체 기사를 다시 분석")
+    parser.add_argument("--workers", type=int, default=None, help="동시에 실행할 단계 수")
+    parser.add_argument("--stage-workers", type=int, default=None, help="단계 내부 프로세스 수")
+    parser.add_argument("--dry-run", action="store_true", help="실행하지 않고 실행할 단계만 출력")
+    parser.add_argument("--profile", action="store_true", help="단계별 cProfile 결과(.prof) 저장")
+    args = parser.parse_args(argv)
+    try:
+        select_stages(args.stages)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.config:
+        # 워커 프로세스와 각 스크립트의 경로 설정도 같은 설정 파일을 읽도록 환경 변수로 전달
+        os.environ[CONFIG_ENV] = str(Path(args.config).resolve())
+    status = run_pipeline(
+        args.stages, force=args.force, incremental=False if args.full else None,
+        workers=args.workers, stage_workers=args.stage_workers, dry_run=args.dry_run,
+        profile=args.profile,
+    )
+    print("[pipeline] " + ", ".join(f"{name}={state}" for name, state in status.items()))
+    return 1 if any(state in ("failed", "blocked") for state in status.values()) else 0
@@ -0,0 +1,251 @@
+"""단계별 실행 시간/메모리/처리량 계측.
+
+`track_stage` 컨텍스트 매니저(또는 `tracked` 데코레이터)로 감싼 구간마다 다음을 기록합니다.
+
+- wall_s, cpu_s: 경과 시간과 프로세스 CPU 시간 (child_cpu_s: 종료된 워커 프로세스의 CPU 시간)
+- rss_mb, rss_delta_mb: 구간 종료 시 RSS 와 시작 대비 증가량 (psutil 이 있을 때)
+- peak_rss_mb: 프로세스 최대 RSS (resource 모듈, 누적 최대값)
+- tracemalloc_peak_mb: 구간 중 Python 할당 최대량 (trace_memory=True 일 때, 실행이 느려짐)
+- rows, rows_per_s: 처리 건수를 지정한 경우의 처리량
+
+활성 `Tracker` 가 있으면 기록이 그 실행 리포트에 추가되고, 종료 시
+`tracking.experiment_dir`(기본 reports/experiments)에 JSON/CSV 로 저장됩니다.
+profile=True 이면 구간마다 cProfile 결과(.prof)도 저장합니다. 구간이 중첩되면 가장 바깥
+구간만 프로파일하며, 안쪽 구간의 실행은 바깥 구간의 .prof 에 포함됩니다.
+실패한 구간도 error 에 예외 이름을 남겨 리포트에 기록됩니다.
+
+    with Tracker("temporal_network_analysis"):
+        with track_stage("keywords") as stage:
+            ...
+            stage.rows = len(df)
+"""
+
+import cProfile
+import csv
+import functools
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Union
+
+from .config import load_config, resolve_path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def _rss_mb() -> Optional[float]:
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process().memory_info().rss / 2**20
+
+
+def _peak_rss_mb(who: int) -> Optional[float]:
+    if resource is None:
+        return None
+    kb = resource.getrusage(who).ru_maxrss
+    return kb / 2**20 if sys.platform == "darwin" else kb / 2**10  # macOS 는 바이트 단위
+
+
+@dataclass
+class StageRecord:
+    """한 구간의 계측 결과. rows 는 구간 안에서 지정할 수 있습니다."""
+
+    stage: str
+    started: str = ""
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    child_cpu_s: float = 0.0
+    rss_mb: Optional[float] = None
+    rss_delta_mb: Optional[float] = None
+    peak_rss_mb: Optional[float] = None
+    child_peak_rss_mb: Optional[float] = None
+    tracemalloc_peak_mb: Optional[float] = None
+    rows: Optional[int] = None
+    rows_per_s: Optional[float] = None
+    profile: Optional[str] = None
+    error: Optional[str] = None
+
+
+# 프로세스에는 활성 프로파일러가 하나만 있을 수 있으므로 중첩 구간은 프로파일하지 않습니다.
+# (안쪽에서 enable/disable 하면 바깥 프로파일러의 훅이 끊기고, Python 3.12+ 에서는 ValueError)
+_profiling = False
+
+
+@contextmanager
+def measure(
+    stage: str,
+    rows: Optional[int] = None,
+    trace_memory: bool = False,
+    profile_path: Optional[Union[str, Path]] = None,
+) -> Iterator[StageRecord]:
+    """구간을 계측해 StageRecord 를 채웁니다 (Tracker 없이도 사용 가능).
+
+    profile_path 는 이미 프로파일 중인 구간 안에서는 무시됩니다 (record.profile 은 None).
+    """
+    global _profiling
+    record = StageRecord(stage=stage, started=datetime.now().isoformat(timespec="seconds"), rows=rows)
+    start_rss = _rss_mb()
+    tracing = trace_memory and not tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.start()
+    elif trace_memory:
+        tracemalloc.reset_peak()
+    profiler = cProfile.Profile() if profile_path and not _profiling else None
+    start_times = os.times()
+    start_wall = time.perf_counter()
+    if profiler is not None:
+        profiler.enable()
+        _profiling = True
+    try:
+        yield record
+    except BaseException as exc:
+        record.error = type(exc).__name__
+        raise
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            _profiling = False
+        record.wall_s = time.perf_counter() - start_wall
+        end_times = os.times()
+        record.cpu_s = (end_times.user + end_times.system) - (start_times.user + start_times.system)
+        record.child_cpu_s = ((end_times.children_user + end_times.children_system)
+                              - (start_times.children_user + start_times.children_system))
+        if trace_memory:
+            record.tracemalloc_peak_mb = tracemalloc.get_traced_memory()[1] / 2**20
+            if tracing:
+                tracemalloc.stop()
+        record.rss_mb = _rss_mb()
+        if start_rss is not None and record.rss_mb is not None:
+            record.rss_delta_mb = record.rss_mb - start_rss
+        if resource is not None:
+            record.peak_rss_mb = _peak_rss_mb(resource.RUSAGE_SELF)
+            record.child_peak_rss_mb = _peak_rss_mb(resource.RUSAGE_CHILDREN)
+        if record.rows is not None and record.wall_s > 0:
+            record.rows_per_s = record.rows / record.wall_s
+        if profiler is not None:
+            Path(profile_path).parent.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(str(profile_path))
+            record.profile = str(profile_path)
+
+
+class Tracker:
+    """실행 하나의 구간 기록을 모아 리포트로 저장합니다.
+
+    - name: 실행 이름 (리포트 파일명 접두사)
+    - experiment_dir: 저장 디렉토리 (기본값: 설정의 tracking.experiment_dir)
+    - profile: True 이면 구간마다 cProfile 결과를 `{리포트}-{구간}.prof` 로 저장 (중첩 구간은 바깥 구간에 포함)
+    - trace_memory: True 이면 구간별 tracemalloc 최대 할당량 기록
+    """
+
+    def __init__(self, name: str, experiment_dir: Optional[Union[str, Path]] = None,
+                 profile: bool = False, trace_memory: bool = False):
+        if experiment_dir is None:
+            experiment_dir = (load_config().get("tracking") or {}).get("experiment_dir", "reports/experiments")
+        self.name = name
+        self.experiment_dir = resolve_path(experiment_dir)
+        self.profile = profile
+        self.trace_memory = trace_memory
+        self.started = datetime.now()
+        self.run_id = f"{name}-{self.started:%Y%m%d-%H%M%S}"
+        self.records: List[StageRecord] = []
+
+    def __enter__(self) -> "Tracker":
+        _active.append(self)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        _active.remove(self)
+        self.write()
+        self.print_summary()
+
+    @contextmanager
+    def stage(self, name: str, rows: Optional[int] = None) -> Iterator[StageRecord]:
+        profile_path = self.experiment_dir / f"{self.run_id}-{name}.prof" if self.profile else None
+        record = None
+        try:
+            with measure(name, rows, self.trace_memory, profile_path) as record:
+                yield record
+        finally:
+            # 실패한 구간도 리포트에 남깁니다 (error 에 예외 이름)
+            if record is not None:
+                self.records.append(record)
+
+    def add(self, record: Union[StageRecord, dict]) -> None:
+        """다른 프로세스에서 계측한 기록을 추가합니다."""
+        self.records.append(record if isinstance(record, StageRecord) else StageRecord(**record))
+
+    def write(self) -> Optional[Path]:
+        """`{experiment_dir}/{run_id}.json` 과 `.csv` 를 저장하고 JSON 경로를 반환합니다."""
+        if not self.records:
+            return None
+        self.experiment_dir.mkdir(parents=True, exist_ok=True)
+        path = self.experiment_dir / f"{self.run_id}.json"
+        report = {
+            "run": self.name,
+            "started": self.started.isoformat(timespec="seconds"),
+            "argv": sys.argv,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "stages": [asdict(record) for record in self.records],
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        with open(path.with_suffix(".csv"), "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=[field.name for field in fields(StageRecord)])
+            writer.writeheader()
+            writer.writerows(asdict(record) for record in self.records)
+        return path
+
+    def print_summary(self) -> None:
+        print(f"\n[{self.name}] stage timings (report: {self.experiment_dir / self.run_id}.json)")
+        for r in self.records:
+            memory = f"peak {r.peak_rss_mb:,.0f}MB" if r.peak_rss_mb is not None else ""
+            throughput = f"{r.rows_per_s:,.0f} rows/s" if r.rows_per_s is not None else ""
+            if r.error:
+                throughput = f"failed ({r.error})"
+            print(f"  {r.stage:24s} wall {r.wall_s:8.2f}s  cpu {r.cpu_s + r.child_cpu_s:8.2f}s  "
+                  f"{memory:>14s}  {throughput}")
+
+
+_active: List[Tracker] = []
+
+
+@contextmanager
+def track_stage(name: str, rows: Optional[int] = None) -> Iterator[StageRecord]:
+    """구간을 계측합니다. 활성 Tracker 가 있으면 그 리포트에 기록합니다."""
+    if _active:
+        with _active[-1].stage(name, rows) as record:
+            yield record
+    else:
+        with measure(name, rows) as record:
+            yield record
+
+
+def tracked(name: Optional[str] = None, rows: Optional[Callable] = None) -> Callable:
+    """함수 호출을 `track_stage` 로 계측하는 데코레이터.
+
+    rows 는 (반환값) -> 처리 건수 함수입니다. 예: `@tracked(rows=len)`
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with track_stage(name or func.__name__) as record:
+                result = func(*args, **kwargs)
+                if rows is not None:
+                    record.rows = rows(result)
+            return result
+        return wrapper
+    return decorator
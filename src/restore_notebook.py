@@ -1,6 +1,8 @@
 import json
 import os
 
+from src.pipeline.config import PROJECT_ROOT
+
 # 노트북 내용 정의 (JSON 구조)
 notebook_content = {
  "cells": [
@@ -194,7 +196,7 @@ notebook_content = {
 }
 
 # 파일 생성
-output_path = "/home/arkwith/SKKU/tech_forcast/notebooks/01_exploration.ipynb"
+output_path = os.path.join(PROJECT_ROOT, "notebooks", "01_exploration.ipynb")
 os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
 with open(output_path, 'w', encoding='utf-8') as f:
@@ -12,14 +12,28 @@
 
 import pandas as pd
 import numpy as np
-import networkx as nx
 import matplotlib.pyplot as plt
 import seaborn as sns
-import re
 import os
-from collections import Counter
-from itertools import combinations
+import argparse
 import warnings
+from scipy import sparse
+
+from src.data.incremental import commit_full_run, start_incremental_run, update_aggregate_table
+from src.data.loaders import load_news_corpus, news_source_paths
+from src.features.bursts import BurstDetector
+from src.features.centrality import ALL_MEASURES, CentralityPanel, centrality_array
+from src.features.cooccurrence import (
+    DocumentTermMatrix, cooccurrence_to_edges, cooccurrence_to_graph, rolling_cooccurrence,
+)
+from src.features.keywords import TECH_KEYWORDS, build_matcher
+from src.features.parallel import extract_keyword_sets_parallel
+from src.features.token_store import tokenize_articles
+from src.features.transitions import find_crossovers
+from src.pipeline.cache import cached_stage, configure_stage_cache
+from src.pipeline.config import config_path, load_config
+from src.pipeline.tracking import Tracker, track_stage
+
 warnings.filterwarnings('ignore')
 
 # 시각화 설정
@@ -29,157 +43,191 @@ plt.rcParams["font.family"] = font_name
 plt.rcParams["axes.unicode_minus"] = False
 plt.rcParams['figure.figsize'] = (16, 10)
 
-# 경로 설정
-DATA_DIR = "data/raw"
-OUTPUT_DIR = "reports/Figure"
+# 경로 설정 (configs/pipeline_config.yaml 기준)
+DATA_DIR = config_path("data", "raw_dir")
+OUTPUT_DIR = config_path("reports", "figure_dir")
+PROCESSED_DIR = config_path("data", "processed_dir")
+INTERIM_DIR = config_path("data", "interim_dir")
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 
 def load_and_preprocess():
-    """뉴스 데이터 로드 및 연도 정보 추가"""
-    sam_df = pd.read_csv(os.path.join(DATA_DIR, "samsung_news.csv"))
-    sk_df = pd.read_csv(os.path.join(DATA_DIR, "skhynix_news.csv"))
-    
-    sam_df['company'] = 'Samsung'
-    sk_df['company'] = 'SKHynix'
-    
-    df = pd.concat([sam_df, sk_df], ignore_index=True)
-    df['text'] = df['title'].fillna('') + " " + df['content'].fillna('')
-    df['date'] = pd.to_datetime(df['date'], format='mixed', errors='coerce')
-    df = df.dropna(subset=['date']).sort_values('date')
-    
-    # 연도 추출
-    df['year'] = df['date'].dt.year
-    
-    # 2014-2024년 필터링
-    df = df[(df['year'] >= 2014) & (df['year'] <= 2024)]
-    
-    def clean_text(text):
-        text = str(text)
-        text = re.sub(r'<[^>]+>', '', text)
-        text = re.sub(r'\s+', ' ', text).strip()
-        return text
-    
-    df['processed_text'] = df['text'].apply(clean_text)
+    """뉴스 코퍼스(Parquet)에서 2014-2024년 기사 로드
+
+    날짜 정규화, 연도 추출, 제목+본문 결합 및 HTML 정제는 코퍼스 적재 시 1회 수행됩니다.
+    """
+    df = load_news_corpus(DATA_DIR, columns=['date', 'company', 'year', 'text'],
+                          years=range(2014, 2025))
+    df['processed_text'] = df['text']
     return df
 
 
 def extract_keywords_advanced(text):
-    """향상된 키워드 추출: 기술, 제품, 응용 분야 모두 포함"""
+    """향상된 키워드 추출: 기술, 제품, 응용 분야 모두 포함
+
+    확장 키워드 세트(TECH_KEYWORDS)를 컴파일한 매처로 문서를 한 번만 순회합니다.
+    """
     if not isinstance(text, str):
         return []
-    
-    # 확장된 키워드 세트
-    target_keywords = [
-        # 메모리 기술
-        'HBM', 'HBM2', 'HBM3', 'HBM3E',
-        'DDR', 'DDR4', 'DDR5', 'LPDDR',
-        'DRAM', 'NAND', 'SSD', 'V-NAND',
-        
-        # 제조 기술
-        'EUV', 'GAA', '파운드리', '패키징',
-        '10나노', '7나노', '5나노', '3나노', '2나노',
-        
-        # 응용 분야
-        'AI', '인공지능', '머신러닝', 'GPU',
-        '서버', '데이터센터', '클라우드',
-        '자율주행', '전기차', '차량용',
-        '스마트폰', '모바일', '5G',
-        
-        # 기업/파트너
-        '엔비디아', 'NVIDIA', 'AMD', 'Intel',
-        'TSMC', '삼성전자', 'SK하이닉스',
-        
-        # 비즈니스
-        '양산', '개발', '출시', '공급',
-        '투자', '매출', '수율', '점유율',
-        
-        # 차세대 기술
-        'CXL', 'PIM', 'CIS', 'AP',
-        '하이브리드본딩', '3D', 'TSV'
-    ]
-    
-    found = set()
-    text_upper = text.upper()
-    
-    for keyword in target_keywords:
-        keyword_upper = keyword.upper()
-        if keyword_upper in text_upper or keyword in text:
-            found.add(keyword)
-    
-    return list(found)
+    return build_matcher(TECH_KEYWORDS).extract(text)
+
+
+ALL_COMPANIES = 'All'
+
 
+NETWORK_COUNT_COLUMNS = ['year', 'company', 'source', 'target', 'weight']
+CENTRALITY_MEASURES = ALL_MEASURES
+# 매개 중심성을 전체 노드 대신 표본 출발 노드로 추정하는 기준 노드 수
+BETWEENNESS_SAMPLES = 500
+# 연도별 중심성 네트워크의 기업별 최소 공출현 횟수
+CENTRALITY_MIN_EDGE_WEIGHT = {ALL_COMPANIES: 5, 'Samsung': 3, 'SKHynix': 3}
+# 이동 구간 네트워크 기본값 (설정의 features.rolling_network 로 변경)
+ROLLING_NETWORK = {'freq': 'M', 'window': 12, 'step': 1, 'min_edge_weight': 5}
+# 신규 등장/급증 키워드 탐지 기본값 (설정의 features.emerging_keywords 로 변경, BurstDetector 참고)
+EMERGING_KEYWORDS = {'tokenizer': 'korean', 'freq': 'M', 'half_life': 6, 'min_count': 3,
+                     'min_zscore': 3.0, 'warmup': 3, 'top_n': 20}
 
-def build_yearly_networks(df, company_filter=None, min_edge_weight=3):
+
+def count_cooccurrence_cells(df, period='year', keywords=None):
     """
-    연도별 네트워크 생성
+    (기간 × 기업) 셀별 키워드 공출현 횟수 (임계값 적용 전)
+    
+    셀별 공출현 행렬을 한 번의 그룹 분할로 계산해 엣지 리스트로 반환합니다.
+    기사 단위로 합산 가능하므로 증분 실행 시 기존 결과에 더해 병합할 수 있습니다.
     
     Parameters:
-    - df: 전체 데이터프레임
-    - company_filter: 'Samsung', 'SKHynix', 또는 None (전체)
-    - min_edge_weight: 최소 공출현 횟수
+    - period: 기간 컬럼 ('year' 또는 'YYYY-MM' 문자열의 'month')
+    - keywords: df 와 같은 행 순서의 KeywordSets (None 이면 df['keywords'] 의 기사별 목록 사용)
     
     Returns:
-    - dict: {year: networkx.Graph}
+    - DataFrame: {period}, company, source, target, weight (source < target)
     """
-    if company_filter:
-        df = df[df['company'] == company_filter].copy()
+    dtm = DocumentTermMatrix.from_keywords(df['keywords'] if keywords is None else keywords)
+    cells = dtm.grouped_cooccurrence(df[[period, 'company']])
+    
+    frames = []
+    for (key, company), cooc in cells.items():
+        edges = cooccurrence_to_edges(cooc, dtm.vocabulary)
+        edges.insert(0, 'company', str(company))
+        edges.insert(0, period, int(key) if period == 'year' else str(key))
+        frames.append(edges)
+    if not frames:
+        return pd.DataFrame(columns=[period, *NETWORK_COUNT_COLUMNS[1:]])
+    return pd.concat(frames, ignore_index=True)
+
+
+def yearly_counts_from_monthly(monthly_counts):
+    """월별 공출현 횟수를 연도별로 합산 (count_cooccurrence_cells(df) 와 같은 결과)"""
+    if monthly_counts.empty:
+        return pd.DataFrame(columns=NETWORK_COUNT_COLUMNS)
+    return (monthly_counts.assign(year=monthly_counts['month'].str[:4].astype('int64'))
+            .groupby(NETWORK_COUNT_COLUMNS[:-1], as_index=False, sort=True)['weight'].sum())
+
+
+def rolling_networks_from_counts(monthly_counts, window=12, step=1, freq='M',
+                                 company=ALL_COMPANIES, min_edge_weight=3, as_edges=False):
+    """
+    월별 공출현 횟수로 이동 구간(rolling window) 네트워크 생성
     
-    yearly_networks = {}
-    years = sorted(df['year'].unique())
+    기간별 공출현 행렬을 한 번 만든 뒤 구간을 옮길 때마다 들어오는 기간을 더하고
+    나가는 기간을 빼므로(rolling_cooccurrence), 구간 길이와 무관하게 기간 수에 비례해 계산합니다.
     
-    for year in years:
-        year_df = df[df['year'] == year]
-        
-        # 키워드 공출현 계산
-        edge_list = []
-        for keywords in year_df['keywords']:
-            if len(keywords) > 1:
-                edge_list.extend(combinations(sorted(keywords), 2))
-        
-        edge_counts = Counter(edge_list)
-        
-        # 네트워크 구축
-        G = nx.Graph()
-        for (u, v), count in edge_counts.items():
-            if count >= min_edge_weight:
-                G.add_edge(u, v, weight=count)
-        
-        yearly_networks[year] = G
-        print(f"Year {year}: {G.number_of_nodes()} nodes, {G.number_of_edges()} edges")
+    Parameters:
+    - monthly_counts: month('YYYY-MM'), company, source, target, weight
+    - window, step: 구간 길이와 이동 간격 (freq 단위 기간 수)
+    - freq: 기간 단위 ('M': 월, 'Q': 분기 등 pandas Period 빈도)
+    - company: 기업명 또는 'All' (전체 기업 합산)
+    - min_edge_weight: 구간 네트워크의 최소 공출현 횟수
+    - as_edges: True 이면 그래프 대신 period(구간 마지막 기간 문자열), source, target, weight
+      엣지 표를 반환 (analyze_centrality_evolution(..., key_name='period') 입력)
     
-    return yearly_networks
+    Returns:
+    - dict: {구간 마지막 기간(pd.Period): networkx.Graph} (as_edges=True 이면 DataFrame)
+    """
+    if company != ALL_COMPANIES:
+        monthly_counts = monthly_counts[monthly_counts['company'] == company]
+    if monthly_counts.empty:
+        return pd.DataFrame(columns=['period', 'source', 'target', 'weight']) if as_edges else {}
+    periods = pd.PeriodIndex(monthly_counts['month'], freq='M').asfreq(freq)
+    
+    # 키워드 사전 공유: 모든 기간 행렬을 같은 크기의 상삼각 행렬로 만듦
+    m = len(monthly_counts)
+    codes, vocabulary = pd.factorize(
+        pd.concat([monthly_counts['source'], monthly_counts['target']], ignore_index=True)
+    )
+    rows, cols = np.minimum(codes[:m], codes[m:]), np.maximum(codes[:m], codes[m:])
+    weight = monthly_counts['weight'].to_numpy(dtype=np.int64)
+    shape = (len(vocabulary), len(vocabulary))
+    period_matrices = {
+        period: sparse.csr_matrix((weight[pos], (rows[pos], cols[pos])), shape=shape)
+        for period, pos in pd.Series(weight).groupby(periods).indices.items()
+    }
+    
+    windows = rolling_cooccurrence(
+        period_matrices, pd.period_range(periods.min(), periods.max(), freq=freq), window, step
+    )
+    if as_edges:
+        frames = [cooccurrence_to_edges(cooc, vocabulary, min_weight=min_edge_weight).assign(period=str(last))
+                  for _, last, cooc in windows]
+        if not frames:
+            return pd.DataFrame(columns=['period', 'source', 'target', 'weight'])
+        return pd.concat(frames, ignore_index=True)[['period', 'source', 'target', 'weight']]
+    vocabulary = list(vocabulary)
+    return {
+        last: cooccurrence_to_graph(cooc, vocabulary, min_weight=min_edge_weight)
+        for _, last, cooc in windows
+    }
+
 
+def company_edges(counts, company):
+    """누적 공출현 횟수에서 특정 기업('All' 이면 기업 합산)의 year, source, target, weight 엣지 표"""
+    if company == ALL_COMPANIES:
+        return counts.groupby(['year', 'source', 'target'], as_index=False, sort=True)['weight'].sum()
+    return counts.loc[counts['company'] == company, ['year', 'source', 'target', 'weight']]
 
-def analyze_centrality_evolution(networks_dict):
+
+def centrality_panel_path(name):
+    """중심성 패널 저장 경로 (data/interim/centrality/{name}.pkl)"""
+    return os.path.join(INTERIM_DIR, 'centrality', f'{name}.pkl')
+
+
+def load_centrality_panel(name, min_edge_weight=1):
+    """저장된 중심성 패널 (없거나 지표/임계값 설정이 바뀌었으면 빈 패널)"""
+    return CentralityPanel.load(centrality_panel_path(name),
+                                measures=CENTRALITY_MEASURES, betweenness_samples=BETWEENNESS_SAMPLES,
+                                min_weight=min_edge_weight)
+
+
+def analyze_centrality_evolution(networks, measures=CENTRALITY_MEASURES,
+                                 betweenness_samples=BETWEENNESS_SAMPLES, panel=None, key_name='year',
+                                 min_edge_weight=1):
     """
     연도별 중심성 변화 추적
     
-    Returns:
-    - DataFrame: 연도별 주요 키워드의 중심성 점수
-    """
-    centrality_data = []
+    연도별 공출현 엣지 표를 바로 희소 인접 행렬로 만들어 지표를 행렬 연산으로 계산합니다
+    (src.features.centrality 참고).
     
-    for year, G in sorted(networks_dict.items()):
-        if G.number_of_nodes() == 0:
-            continue
-        
-        # Degree Centrality 계산
-        degree_cent = nx.degree_centrality(G)
-        
-        # 가중치 반영한 Weighted Degree
-        weighted_degree = dict(G.degree(weight='weight'))
-        
-        for node in G.nodes():
-            centrality_data.append({
-                'year': year,
-                'keyword': node,
-                'degree_centrality': degree_cent.get(node, 0),
-                'weighted_degree': weighted_degree.get(node, 0)
-            })
+    Parameters:
+    - networks: key_name, source, target, weight 컬럼의 엣지 표 (예: company_edges 결과)
+      또는 {year: networkx.Graph}
+    - measures: 계산할 지표 (degree_centrality, weighted_degree, eigenvector, pagerank, betweenness)
+    - betweenness_samples: 노드가 이보다 많은 연도는 출발 노드를 표본 추출해 매개 중심성 추정
+    - panel: 이전 결과를 담은 CentralityPanel (load_centrality_panel). 주면 엣지가 바뀐 연도만
+      다시 계산하고, 입력에 없는 연도는 패널에서 제거합니다
+    - key_name: 기간 컬럼명 (이동 구간 네트워크는 'period')
+    - min_edge_weight: 엣지 표의 최소 공출현 횟수 (panel 을 주면 panel.min_weight 사용)
     
-    df_cent = pd.DataFrame(centrality_data)
-    return df_cent
+    Returns:
+    - DataFrame: year, keyword, 지표 컬럼 (연도별 네트워크의 모든 노드)
+    """
+    if panel is None:
+        panel = CentralityPanel(measures=measures, betweenness_samples=betweenness_samples,
+                                min_weight=min_edge_weight)
+    if isinstance(networks, pd.DataFrame):
+        panel.update_edges(networks, key=key_name)
+    else:
+        panel.update_graphs(networks)
+    return panel.to_frame(key_name)
 
 
 def plot_keyword_evolution(df_cent, keywords_to_track, title="Keyword Centrality Evolution", 
@@ -283,11 +331,33 @@ def plot_company_comparison(cent_samsung, cent_skhynix, keywords, save_path=None
     plt.show()
 
 
+def detect_topic_transitions(df_cent, measure='weighted_degree', key_name='year', pairs=None,
+                             min_magnitude=0.0, persistent_only=False):
+    """
+    모든 키워드 쌍의 중심성 역전(토픽 전환) 시점 탐지 (시각화 없음)
+    
+    Parameters:
+    - df_cent: analyze_centrality_evolution 결과 (tidy 표)
+    - measure: 비교할 중심성 지표
+    - key_name: 기간 컬럼 ('year', 이동 구간은 'period')
+    - pairs, min_magnitude, persistent_only: src.features.transitions.find_crossovers 참고
+    
+    Returns:
+    - DataFrame: old, new, period, previous_period, gap_before, gap_after, magnitude, persistent
+      (역전 크기 내림차순)
+    """
+    return find_crossovers(centrality_array(df_cent, measure, key_name), pairs=pairs,
+                           min_magnitude=min_magnitude, persistent_only=persistent_only)
+
+
 def analyze_topic_transition(df_cent, keyword_pairs, save_path=None):
     """
     특정 키워드 쌍의 중심성 역전 시점 분석
     예: DRAM에서 HBM으로의 전환
+    
+    전환점은 detect_topic_transitions 로 찾은 쌍별 첫 역전 시점입니다.
     """
+    transitions = detect_topic_transitions(df_cent, pairs=keyword_pairs)
     fig, axes = plt.subplots(len(keyword_pairs), 1, figsize=(16, 5*len(keyword_pairs)))
     if len(keyword_pairs) == 1:
         axes = [axes]
@@ -308,21 +378,15 @@ def analyze_topic_transition(df_cent, keyword_pairs, save_path=None):
                    marker='s', linewidth=3, markersize=10, label=f'{new_topic} (신규)', 
                    color='#e377c2')
         
-        # 교차점 찾기
-        if len(old_data) > 0 and len(new_data) > 0:
-            merged = pd.merge(old_data[['year', 'weighted_degree']], 
-                            new_data[['year', 'weighted_degree']], 
-                            on='year', suffixes=('_old', '_new'))
-            merged['diff'] = merged['weighted_degree_new'] - merged['weighted_degree_old']
-            
-            crossover = merged[merged['diff'] > 0]
-            if len(crossover) > 0:
-                crossover_year = crossover.iloc[0]['year']
-                ax.axvline(crossover_year, color='red', linestyle=':', linewidth=2, alpha=0.7)
-                ax.text(crossover_year, ax.get_ylim()[1]*0.9, 
-                       f'전환점: {int(crossover_year)}년', 
-                       ha='center', fontsize=12, color='red', fontweight='bold',
-                       bbox=dict(boxstyle='round', facecolor='yellow', alpha=0.3))
+        # 교차점 표시
+        crossover = transitions[(transitions['old'] == old_topic) & (transitions['new'] == new_topic)]
+        if len(crossover) > 0:
+            crossover_year = crossover['period'].min()
+            ax.axvline(crossover_year, color='red', linestyle=':', linewidth=2, alpha=0.7)
+            ax.text(crossover_year, ax.get_ylim()[1]*0.9, 
+                   f'전환점: {int(crossover_year)}년', 
+                   ha='center', fontsize=12, color='red', fontweight='bold',
+                   bbox=dict(boxstyle='round', facecolor='yellow', alpha=0.3))
         
         ax.set_title(f'토픽 전환 분석: {old_topic} → {new_topic}', 
                     fontsize=15, fontweight='bold')
@@ -340,17 +404,21 @@ def analyze_topic_transition(df_cent, keyword_pairs, save_path=None):
     plt.show()
 
 
-def print_summary_report(df, networks_all, centrality_all, centrality_samsung, centrality_skhynix):
-    """종합 인사이트 리포트 출력"""
+def print_summary_report(article_stats, networks_all, centrality_all, centrality_samsung, centrality_skhynix):
+    """종합 인사이트 리포트 출력
+
+    article_stats: 연도×기업별 기사 수(articles)와 추출 키워드 수(keywords) 집계
+    networks_all: 전체 기업의 {year: CellGraph} (CentralityPanel.cells)
+    """
     print("\n" + "="*80)
     print("시계열 네트워크 분석 종합 리포트")
     print("="*80)
     
     # 1. 전체 기간 통계
     print("\n[1] 전체 분석 기간 통계")
-    print(f"  - 분석 기간: {df['year'].min()}년 ~ {df['year'].max()}년")
-    print(f"  - 총 기사 수: {len(df):,}건")
-    print(f"  - 총 추출 키워드 수: {df['keywords'].apply(len).sum():,}개")
+    print(f"  - 분석 기간: {article_stats['year'].min()}년 ~ {article_stats['year'].max()}년")
+    print(f"  - 총 기사 수: {int(article_stats['articles'].sum()):,}건")
+    print(f"  - 총 추출 키워드 수: {int(article_stats['keywords'].sum()):,}개")
     
     # 2. 연도별 네트워크 규모 변화
     print("\n[2] 연도별 네트워크 규모 변화")
@@ -358,9 +426,9 @@ def print_summary_report(df, networks_all, centrality_all, centrality_samsung, c
     for year, G in sorted(networks_all.items()):
         network_stats.append({
             'Year': year,
-            'Nodes': G.number_of_nodes(),
-            'Edges': G.number_of_edges(),
-            'Density': round(nx.density(G), 3) if G.number_of_nodes() > 1 else 0
+            'Nodes': G.n_nodes,
+            'Edges': G.n_edges,
+            'Density': round(2 * G.n_edges / (G.n_nodes * (G.n_nodes - 1)), 3) if G.n_nodes > 1 else 0
         })
     df_stats = pd.DataFrame(network_stats)
     print(df_stats.to_string(index=False))
@@ -399,74 +467,252 @@ def print_summary_report(df, networks_all, centrality_all, centrality_samsung, c
     print("\n" + "="*80)
 
 
-def main():
-    """메인 실행 함수"""
-    print("="*80)
-    print("시계열 의미 연결망 분석 (Temporal Semantic Network Analysis)")
-    print("="*80)
+# data/interim 에 누적되는 Step 1-3 결과 (파일 이름, 병합 키)
+NETWORK_TABLES = [
+    ('network_counts.parquet', ['year', 'company', 'source', 'target']),
+    ('network_monthly_counts.parquet', ['month', 'company', 'source', 'target']),
+    ('network_article_stats.parquet', ['year', 'company']),
+]
+
+
+def write_network_tables(counts_delta, monthly_delta, article_stats_delta, full):
+    """공출현 횟수(연도별/월별)/기사 통계를 data/interim 의 누적 결과에 병합(full=True 이면 덮어쓰기)해 저장"""
+    return tuple(
+        update_aggregate_table(os.path.join(INTERIM_DIR, filename), delta, keys, full)
+        for (filename, keys), delta in zip(NETWORK_TABLES, (counts_delta, monthly_delta, article_stats_delta), strict=True)
+    )
+
+
+def update_network_counts(incremental=False, workers=None):
+    """
+    Step 1-3: 기사 로딩 → 키워드 추출 → (연도 × 기업) 공출현 횟수/기사 통계 갱신
     
+    Returns:
+    - (counts, monthly_counts, article_stats): 누적 연도별/월별 공출현 횟수와 연도×기업별 기사/키워드 수
+    """
     # 1. 데이터 로딩
     print("\n[Step 1] 데이터 로딩 및 전처리...")
-    df = load_and_preprocess()
-    print(f"총 {len(df):,}건의 기사 로드 완료")
+    with track_stage('load') as stage:
+        run = start_incremental_run(
+            'temporal_network_analysis', INTERIM_DIR, raw_dir=DATA_DIR,
+            columns=['date', 'company', 'year', 'text'], years=range(2014, 2025), incremental=incremental,
+            outputs=[os.path.join(INTERIM_DIR, filename) for filename, _ in NETWORK_TABLES]
+        )
+        df = run.articles
+        df['processed_text'] = df['text']
+        stage.rows = len(df)
+    print(f"총 {len(df):,}건의 {'기사' if run.full else '신규 기사'} 로드 완료")
     
     # 2. 키워드 추출
     print("\n[Step 2] 키워드 추출...")
-    df['keywords'] = df['processed_text'].apply(extract_keywords_advanced)
-    df['keyword_count'] = df['keywords'].apply(len)
+    with track_stage('keywords', rows=len(df)):
+        # 기사별 키워드는 문자열 리스트 대신 번호 배열(KeywordSets)로 보관
+        keywords = extract_keyword_sets_parallel(df['processed_text'], TECH_KEYWORDS, workers=workers)
+        df['keyword_count'] = keywords.counts()
     print(f"키워드 추출 완료: {len(df[df['keyword_count'] > 0])} / {len(df)} 기사")
     
     # 3. 연도별 네트워크 구축
     print("\n[Step 3] 연도별 네트워크 구축...")
-    print("\n--- 전체 데이터 ---")
-    networks_all = build_yearly_networks(df, company_filter=None, min_edge_weight=5)
+    with track_stage('cooccurrence', rows=len(df)):
+        # 월별 셀을 한 번 계산하고 연도별 횟수는 월별 합산으로 얻음
+        df['month'] = df['date'].dt.to_period('M').astype(str)
+        monthly_delta = count_cooccurrence_cells(df, period='month', keywords=keywords)
+        counts, monthly_counts, article_stats = write_network_tables(
+            yearly_counts_from_monthly(monthly_delta), monthly_delta,
+            df.groupby(['year', 'company'], observed=True)
+              .agg(articles=('keyword_count', 'size'), keywords=('keyword_count', 'sum'))
+              .reset_index()
+              .astype({'year': 'int64', 'company': 'str'}),
+            run.full
+        )
+    run.commit()
+    return counts, monthly_counts, article_stats
+
+
+def update_emerging_keywords(incremental=False, workers=None):
+    """
+    Step 4-3: 신규 등장/급증 키워드(약한 신호) 탐지
+    
+    기사 토큰(열린 어휘)의 월×기업별 문서 빈도를 지수 감쇠 기준선과 비교합니다.
+    탐지기 상태는 data/interim/emerging_keywords 에 저장되어, incremental=True 이면
+    이전 실행 이후 추가된 기사만 토큰화/집계합니다. 설정이 바뀌었거나 상태가 없으면
+    전체 기사로 다시 계산합니다. 마지막(집계 중인) 달은 다음 달 기사가 들어온 뒤 평가됩니다.
     
-    print("\n--- 삼성전자 ---")
-    networks_samsung = build_yearly_networks(df, company_filter='Samsung', min_edge_weight=3)
+    Returns:
+    - DataFrame: company, period, term, count, docs, rate, baseline, zscore, novel, rank
+    """
+    options = {**EMERGING_KEYWORDS, **((load_config().get('features') or {}).get('emerging_keywords') or {})}
+    tokenizer = options.pop('tokenizer')
+    state_dir = os.path.join(INTERIM_DIR, 'emerging_keywords')
+    output_path = os.path.join(PROCESSED_DIR, 'emerging_keywords.csv')
+    
+    detector = None
+    if incremental and os.path.exists(os.path.join(state_dir, 'state.json')) and os.path.exists(output_path):
+        detector = BurstDetector.load(state_dir)
+        if detector.params != BurstDetector(**options).params:
+            detector = None
+    run = start_incremental_run(
+        'emerging_keywords', INTERIM_DIR, raw_dir=DATA_DIR,
+        columns=['date', 'company', 'text'], years=range(2014, 2025), incremental=detector is not None
+    )
+    if run.full:
+        detector = BurstDetector(**options)
+    
+    df = run.articles
+    tokens = tokenize_articles(df['text'], tokenizer, cache_dir=os.path.join(INTERIM_DIR, 'tokens'),
+                               workers=workers)
+    emerging = detector.update(df['date'], df['company'].astype(str), tokens)
+    if not run.full:
+        emerging = pd.concat([pd.read_csv(output_path), emerging], ignore_index=True)
+    os.makedirs(PROCESSED_DIR, exist_ok=True)
+    emerging.to_csv(output_path, index=False)
+    detector.save(state_dir)
+    run.commit()
+    if detector.dropped_articles:
+        print(f"이미 평가한 달의 늦게 추가된 기사 {detector.dropped_articles:,}건은 제외되었습니다.")
+    return emerging
+
+
+@cached_stage('network_counts', files=lambda: news_source_paths(DATA_DIR),
+              config_sections=('data', 'features'),
+              code=('src.data', 'src.features', update_network_counts, write_network_tables,
+                    count_cooccurrence_cells, yearly_counts_from_monthly),
+              ignore=('workers',))
+def full_network_counts(workers=None):
+    """
+    전체 기사 기준 Step 1-3 (단계 캐시 사용)
     
-    print("\n--- SK하이닉스 ---")
-    networks_skhynix = build_yearly_networks(df, company_filter='SKHynix', min_edge_weight=3)
+    원본 CSV, 키워드 추출/집계 코드가 그대로면 코퍼스 로딩과 키워드 추출 없이
+    data/interim/stage_cache 에 저장된 결과를 반환합니다.
+    """
+    return update_network_counts(incremental=False, workers=workers)
+
+
+def main(incremental=False, workers=None, profile=False):
+    """메인 실행 함수
+
+    incremental=True 이면 이전 실행 이후 추가된 기사만 키워드/공출현을 계산하고
+    data/interim 에 저장된 누적 공출현 횟수에 병합합니다.
+    workers 는 키워드 추출 프로세스 수이며 None 이면 CPU 코어 수를 사용합니다.
+    전체 실행의 Step 1-3 결과는 단계 캐시에 저장되어, 입력과 코드가 같으면 재사용됩니다.
+    단계별 시간/메모리/처리량은 reports/experiments 에 저장되며, profile=True 이면
+    단계별 cProfile 결과(.prof)도 함께 저장합니다.
+    """
+    with Tracker('temporal_network_analysis', profile=profile):
+        run_analysis(incremental=incremental, workers=workers)
+
+
+def run_analysis(incremental=False, workers=None):
+    """Step 1-6 실행 (main 참고)"""
+    print("="*80)
+    print("시계열 의미 연결망 분석 (Temporal Semantic Network Analysis)")
+    print("="*80)
     
-    # 4. 중심성 분석
+    with track_stage('network_counts') as stage:
+        if incremental:
+            counts, monthly_counts, article_stats = update_network_counts(incremental=True, workers=workers)
+        else:
+            counts, monthly_counts, article_stats = full_network_counts(workers=workers)
+            write_network_tables(counts, monthly_counts, article_stats, full=True)
+            # 캐시 적중 시에는 update_network_counts 가 실행되지 않으므로 증분 상태를 여기서 기록
+            commit_full_run('temporal_network_analysis', INTERIM_DIR, raw_dir=DATA_DIR)
+        stage.rows = int(article_stats['articles'].sum())
+    
+    # 4. 중심성 분석: (연도 × 기업) 공출현 횟수를 희소 인접 행렬로 바로 변환해 계산.
+    # 패널은 data/interim/centrality 에 저장되어 공출현 횟수가 바뀐 연도만 다시 계산합니다.
     print("\n[Step 4] 중심성 시계열 분석...")
-    centrality_all = analyze_centrality_evolution(networks_all)
-    centrality_samsung = analyze_centrality_evolution(networks_samsung)
-    centrality_skhynix = analyze_centrality_evolution(networks_skhynix)
+    with track_stage('centrality', rows=len(counts)):
+        panels, centrality = {}, {}
+        for company, min_edge_weight in CENTRALITY_MIN_EDGE_WEIGHT.items():
+            panels[company] = load_centrality_panel(company, min_edge_weight)
+            centrality[company] = analyze_centrality_evolution(company_edges(counts, company),
+                                                               panel=panels[company])
+            panels[company].save(centrality_panel_path(company))
+        centrality_all = centrality[ALL_COMPANIES]
+        centrality_samsung = centrality['Samsung']
+        centrality_skhynix = centrality['SKHynix']
+    
+    for label, company in [("전체 데이터", ALL_COMPANIES), ("삼성전자", 'Samsung'), ("SK하이닉스", 'SKHynix')]:
+        print(f"\n--- {label} ---")
+        for year, cell in sorted(panels[company].cells.items()):
+            print(f"Year {year}: {cell.n_nodes} nodes, {cell.n_edges} edges")
     print("중심성 분석 완료")
     
+    # 4-1. 이동 구간(월/분기) 네트워크 중심성
+    rolling = {**ROLLING_NETWORK, **((load_config().get('features') or {}).get('rolling_network') or {})}
+    print(f"\n[Step 4-1] 이동 구간 중심성 분석 (구간 {rolling['window']}{rolling['freq']}, "
+          f"간격 {rolling['step']}{rolling['freq']})...")
+    with track_stage('rolling_centrality', rows=len(monthly_counts)):
+        rolling_panel = load_centrality_panel('rolling')
+        rolling_centrality = analyze_centrality_evolution(
+            rolling_networks_from_counts(monthly_counts, as_edges=True, **rolling),
+            panel=rolling_panel, key_name='period'
+        )
+        rolling_panel.save(centrality_panel_path('rolling'))
+        rolling_centrality.to_parquet(os.path.join(INTERIM_DIR, 'rolling_centrality.parquet'), index=False)
+    print(f"이동 구간 {len(rolling_panel.cells)}개 분석 완료")
+    
+    # 4-2. 전체 키워드 쌍의 토픽 전환(중심성 역전) 탐지
+    print("\n[Step 4-2] 토픽 전환 탐지...")
+    with track_stage('transitions', rows=len(centrality_all) + len(rolling_centrality)):
+        transitions = detect_topic_transitions(centrality_all)
+        rolling_transitions = detect_topic_transitions(rolling_centrality, key_name='period')
+        os.makedirs(PROCESSED_DIR, exist_ok=True)
+        transitions.to_csv(os.path.join(PROCESSED_DIR, 'topic_transitions.csv'), index=False)
+        rolling_transitions.to_csv(os.path.join(PROCESSED_DIR, 'topic_transitions_rolling.csv'), index=False)
+    print(f"연도별 전환 {len(transitions):,}건, 이동 구간 전환 {len(rolling_transitions):,}건 저장")
+    for row in transitions[transitions['persistent']].head(5).itertuples():
+        print(f"  {row.old} → {row.new}: {row.period}년 (역전 크기 {row.magnitude:,.0f})")
+    
+    # 4-3. 신규 등장/급증 키워드 (약한 신호)
+    print("\n[Step 4-3] 신규 등장/급증 키워드 탐지...")
+    with track_stage('emerging_keywords') as stage:
+        emerging = update_emerging_keywords(incremental=incremental, workers=workers)
+        stage.rows = len(emerging)
+    if len(emerging):
+        recent_year = emerging['period'].max()[:4]
+        print(f"{recent_year}년 급증 키워드 (* 처음 등장한 용어)")
+        recent = emerging[emerging['period'].str.startswith(recent_year)].sort_values('zscore', ascending=False)
+        for company, group in recent.groupby('company', sort=True):
+            terms = group.drop_duplicates('term').head(8)
+            print(f"  {company}: " + ", ".join(f"{t}{'*' if n else ''}" for t, n in zip(terms['term'], terms['novel'], strict=True)))
+    else:
+        print("탐지된 급증 키워드가 없습니다.")
+    
     # 5. 시각화
     print("\n[Step 5] 시각화 생성...")
-    
-    # 5-1. 주요 기술 키워드 진화
-    tech_keywords = ['HBM', 'DRAM', 'DDR', 'NAND', 'AI', '파운드리', 'EUV', 'GAA']
-    plot_keyword_evolution(
-        centrality_all, tech_keywords,
-        title="반도체 핵심 기술 키워드의 네트워크 중심성 변화 (2014-2024)",
-        save_path=os.path.join(OUTPUT_DIR, 'fig_11_temporal_keyword_evolution.png')
-    )
-    
-    # 5-2. 히트맵
-    heatmap_data = create_temporal_heatmap(
-        centrality_all, top_n=15,
-        save_path=os.path.join(OUTPUT_DIR, 'fig_08_temporal_centrality_heatmap.png')
-    )
-    
-    # 5-3. 기업 비교
-    comparison_keywords = ['HBM', 'DRAM', 'AI', '파운드리']
-    plot_company_comparison(
-        centrality_samsung, centrality_skhynix, comparison_keywords,
-        save_path=os.path.join(OUTPUT_DIR, 'fig_07_company_strategy_evolution.png')
-    )
-    
-    # 5-4. 토픽 전환 분석
-    transition_pairs = [('DRAM', 'HBM')]
-    analyze_topic_transition(
-        centrality_all, transition_pairs,
-        save_path=os.path.join(OUTPUT_DIR, 'fig_10_topic_transition_analysis.png')
-    )
+    with track_stage('figures'):
+        # 5-1. 주요 기술 키워드 진화
+        tech_keywords = ['HBM', 'DRAM', 'DDR', 'NAND', 'AI', '파운드리', 'EUV', 'GAA']
+        plot_keyword_evolution(
+            centrality_all, tech_keywords,
+            title="반도체 핵심 기술 키워드의 네트워크 중심성 변화 (2014-2024)",
+            save_path=os.path.join(OUTPUT_DIR, 'fig_11_temporal_keyword_evolution.png')
+        )
+        
+        # 5-2. 히트맵
+        heatmap_data = create_temporal_heatmap(
+            centrality_all, top_n=15,
+            save_path=os.path.join(OUTPUT_DIR, 'fig_08_temporal_centrality_heatmap.png')
+        )
+        
+        # 5-3. 기업 비교
+        comparison_keywords = ['HBM', 'DRAM', 'AI', '파운드리']
+        plot_company_comparison(
+            centrality_samsung, centrality_skhynix, comparison_keywords,
+            save_path=os.path.join(OUTPUT_DIR, 'fig_07_company_strategy_evolution.png')
+        )
+        
+        # 5-4. 토픽 전환 분석
+        transition_pairs = [('DRAM', 'HBM')]
+        analyze_topic_transition(
+            centrality_all, transition_pairs,
+            save_path=os.path.join(OUTPUT_DIR, 'fig_10_topic_transition_analysis.png')
+        )
     
     # 6. 종합 리포트
-    print_summary_report(df, networks_all, centrality_all, centrality_samsung, centrality_skhynix)
+    print_summary_report(article_stats, panels[ALL_COMPANIES].cells, centrality_all, centrality_samsung,
+                         centrality_skhynix)
     
     print("\n분석 완료!")
     print(f"생성된 그래프는 {OUTPUT_DIR}/ 디렉토리에 저장되었습니다.")
@@ -474,5 +720,13 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="시계열 의미 연결망 분석")
+    parser.add_argument('--incremental', action='store_true', help="신규 기사만 분석해 기존 결과에 병합")
+    parser.add_argument('--workers', type=int, default=None, help="병렬 프로세스 수 (기본값: CPU 코어 수)")
+    parser.add_argument('--force', action='store_true', help="단계 캐시를 무시하고 다시 계산")
+    parser.add_argument('--profile', action='store_true', help="단계별 cProfile 결과(.prof)를 reports/experiments 에 저장")
+    args = parser.parse_args()
+    if args.force:
+        configure_stage_cache(force=True)
+    main(incremental=args.incremental, workers=args.workers, profile=args.profile)
 